@@ -0,0 +1,144 @@
+import argparse
+import os
+import random
+import time
+
+from gensim.corpora import Dictionary
+
+from src.LDA.backends import train_model
+from src.speeches_io import scan_speeches
+
+
+def load_corpus(speeches: str, column: str, n_rows: int) -> list[list[str]]:
+    """
+    Load the lemmas of a slice of tokenized speeches, or generate a
+    synthetic corpus of topic-like word distributions if the file
+    is missing.
+
+    Args:
+        speeches (str): The path to the tokenized speeches Parquet file
+        or dataset written by src.tokenize_column.
+        column (str): The list column containing the lemmas.
+        n_rows (int): The number of speeches in the slice.
+
+    Returns:
+        list[list[str]]: The lemmas of each speech.
+    """
+    if os.path.exists(speeches):
+        return (scan_speeches(speeches)
+                .select(column)
+                .drop_nulls()
+                .head(n_rows)
+                .collect()[column]
+                .to_list())
+
+    print(f"{speeches} not found, using a synthetic corpus")
+    rng = random.Random(0)
+    vocabulary = [f"Wort{i}" for i in range(5000)]
+    topics = [rng.sample(vocabulary, 200) for _ in range(20)]
+    return [[rng.choice(rng.choice(topics[:3] + [topics[i % 20]]))
+             for _ in range(rng.randint(20, 300))]
+            for i in range(n_rows)]
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Compare the training throughput of the LDA backends."
+    )
+
+    parser.add_argument(
+        "--speeches",
+        type=str,
+        default="data/parquet/speeches_tokenized.parquet",
+        help="The tokenized speeches Parquet file or dataset"
+    )
+
+    parser.add_argument(
+        "--column",
+        type=str,
+        default="speechContent_cleaned_tokens",
+        help="The list column containing the lemmas"
+    )
+
+    parser.add_argument(
+        "--n-rows",
+        type=int,
+        default=10000,
+        help="The number of speeches in the slice"
+    )
+
+    parser.add_argument(
+        "--num-topics",
+        type=int,
+        default=5,
+        help="The number of topics"
+    )
+
+    parser.add_argument(
+        "--workers",
+        nargs="+",
+        type=int,
+        default=[1, 2, 4],
+        help="The worker counts of the multicore backend"
+    )
+
+    parser.add_argument(
+        "--chunksize",
+        nargs="+",
+        type=int,
+        default=[2000],
+        help="The chunk sizes to compare"
+    )
+
+    parser.add_argument(
+        "--passes",
+        type=int,
+        default=1,
+        help="The number of passes over the corpus"
+    )
+
+    parser.add_argument(
+        "--iterations",
+        type=int,
+        default=50,
+        help="The maximum number of E-step iterations per document"
+    )
+
+    parser.add_argument(
+        "--eval-every",
+        type=int,
+        default=None,
+        help="How often to estimate the perplexity, 0 to disable it"
+    )
+
+    args = parser.parse_args()
+
+    texts = load_corpus(args.speeches, args.column, args.n_rows)
+    dictionary = Dictionary(texts)
+    corpus = [dictionary.doc2bow(text) for text in texts]
+    print(f"{len(corpus)} speeches, {len(dictionary)} types")
+
+    settings = [("LDA", None)]
+    settings += [("LDA-MULTICORE", workers) for workers in args.workers]
+
+    for chunksize in args.chunksize:
+        for backend, workers in settings:
+            start = time.perf_counter()
+            train_model(backend, corpus, dictionary, args.num_topics,
+                        workers=workers,
+                        chunksize=chunksize,
+                        passes=args.passes,
+                        iterations=args.iterations,
+                        eval_every=args.eval_every,
+                        random_state=0)
+            elapsed = time.perf_counter() - start
+
+            docs_per_second = len(corpus) * args.passes / elapsed
+            label = backend if workers is None \
+                else f"{backend} workers={workers}"
+            print(f"{label:>27} chunksize={chunksize}: {elapsed:.2f}s, "
+                  f"{docs_per_second:.0f} docs/s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,108 @@
+import argparse
+import os
+import random
+import time
+
+import polars as pl
+
+from src.clean_text import clean_text
+from src.remove_stopwords import (STOPWORD_ENGINES, read_stopwords,
+                                  remove_stopwords)
+from src.speeches_io import scan_speeches
+
+
+def load_corpus(speeches: str, column: str, n_rows: int) -> pl.DataFrame:
+    """
+    Load a slice of cleaned speeches, or generate a synthetic corpus
+    from the stopwords and a few content words if the file is missing.
+
+    Args:
+        speeches (str): The path to the speeches Parquet file or dataset.
+        column (str): The column containing the speech content.
+        n_rows (int): The number of speeches in the slice.
+
+    Returns:
+        pl.DataFrame: A DataFrame with the speech content in `column`.
+    """
+    if os.path.exists(speeches):
+        corpus = (scan_speeches(speeches)
+                  .select(column)
+                  .head(n_rows)
+                  .collect())
+        return clean_text(corpus, column)
+
+    print(f"{speeches} not found, using a synthetic corpus")
+    words = ["Bundesregierung", "Gesetz", "Antrag", "Haushalt", "Land",
+             "Wirtschaft", "Europa", "Verantwortung"]
+    words += read_stopwords("data/custom_stopwords.txt")
+    rng = random.Random(0)
+    speeches = [" ".join(rng.choice(words).capitalize()
+                         for _ in range(rng.randint(50, 1500))) + "."
+                for _ in range(n_rows)]
+    return pl.DataFrame({column: speeches})
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Compare the runtime of the stopword removal engines."
+    )
+
+    parser.add_argument(
+        "--speeches",
+        type=str,
+        default="data/parquet/speeches.parquet",
+        help="The speeches Parquet file or dataset to take a slice from"
+    )
+
+    parser.add_argument(
+        "--stopwords",
+        type=str,
+        default="data/custom_stopwords.txt",
+        help="A list of stopwords"
+    )
+
+    parser.add_argument(
+        "--column",
+        type=str,
+        default="speechContent",
+        help="The column containing the speech content"
+    )
+
+    parser.add_argument(
+        "--n-rows",
+        type=int,
+        default=10000,
+        help="The number of speeches in the slice"
+    )
+
+    parser.add_argument(
+        "--repeat",
+        type=int,
+        default=3,
+        help="The number of timed runs per engine"
+    )
+
+    args = parser.parse_args()
+
+    corpus = load_corpus(args.speeches, args.column, args.n_rows)
+    n_chars = corpus[args.column].str.len_chars().sum()
+    print(f"{corpus.height} speeches, {n_chars} characters")
+
+    results = {}
+    for engine in STOPWORD_ENGINES:
+        timings = []
+        for _ in range(args.repeat):
+            start = time.perf_counter()
+            results[engine] = remove_stopwords(args.stopwords, corpus,
+                                               args.column, engine)
+            timings.append(time.perf_counter() - start)
+        print(f"{engine:>6}: best {min(timings):.3f}s, "
+              f"{n_chars / min(timings) / 1e6:.1f} MB/s")
+
+    equal = all(result.equals(results["regex"])
+                for result in results.values())
+    print(f"outputs identical: {equal}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,195 @@
+"""
+Title: backends.py
+
+Description:
+    This file contains the registry of topic
+    modelling backends. Each backend trains one
+    Gensim model on a corpus, so that only the
+    requested algorithm is trained, and takes
+    its tuning parameters as keyword arguments.
+
+Usage:
+    Train a model using\n
+    train_model('LDA', corpus, dictionary, num_topics, passes=5)
+    New algorithms are added by decorating a training
+    function with register_backend.
+"""
+
+from typing import Callable
+
+from gensim.corpora import Dictionary
+from gensim.models import HdpModel, LdaModel, LdaMulticore, LsiModel
+from gensim.models.basemodel import BaseTopicModel
+
+# training functions by algorithm name
+MODEL_BACKENDS: dict[str, Callable[..., BaseTopicModel]] = {}
+
+# tuning parameters accepted by at least one backend
+MODEL_PARAMETERS = ['passes', 'iterations', 'chunksize', 'alpha', 'eta',
+                    'random_state', 'workers', 'eval_every']
+
+
+def register_backend(name: str) -> Callable:
+    """
+    Register a function training a topic model under an algorithm name.
+    """
+    def decorator(train: Callable[..., BaseTopicModel]) -> Callable:
+        MODEL_BACKENDS[name] = train
+        return train
+    return decorator
+
+
+def _set(**params) -> dict:
+    """
+    Drop unset parameters, so the model defaults apply.
+    """
+    return {key: value for key, value in params.items() if value is not None}
+
+
+@register_backend('LDA')
+def train_lda(
+        corpus,
+        dictionary: Dictionary,
+        num_topics: int,
+        passes: int = None,
+        iterations: int = None,
+        chunksize: int = None,
+        alpha: str | float = None,
+        eta: str | float = None,
+        random_state: int = None,
+        eval_every: int = None,
+        **params
+) -> LdaModel:
+    """
+    Train a Latent Dirichlet Allocation model.
+    """
+    return LdaModel(
+        corpus=corpus,
+        num_topics=num_topics,
+        id2word=dictionary,
+        **_set(passes=passes, iterations=iterations, chunksize=chunksize,
+               alpha=alpha, eta=eta, random_state=random_state,
+               eval_every=eval_every)
+    )
+
+
+@register_backend('LDA-MULTICORE')
+def train_lda_multicore(
+        corpus,
+        dictionary: Dictionary,
+        num_topics: int,
+        workers: int = None,
+        passes: int = None,
+        iterations: int = None,
+        chunksize: int = None,
+        alpha: str | float = None,
+        eta: str | float = None,
+        random_state: int = None,
+        eval_every: int = None,
+        **params
+) -> LdaMulticore:
+    """
+    Train a Latent Dirichlet Allocation model, running the E-step
+    on the chunks of the corpus in parallel worker processes.
+    By default, one worker less than the number of CPU cores is used.
+    The 'auto' prior of alpha is not supported.
+    """
+    return LdaMulticore(
+        corpus=corpus,
+        num_topics=num_topics,
+        id2word=dictionary,
+        **_set(workers=workers, passes=passes, iterations=iterations,
+               chunksize=chunksize, alpha=alpha, eta=eta,
+               random_state=random_state, eval_every=eval_every)
+    )
+
+
+@register_backend('HDP')
+def train_hdp(
+        corpus,
+        dictionary: Dictionary,
+        num_topics: int,
+        chunksize: int = None,
+        alpha: float = None,
+        eta: float = None,
+        random_state: int = None,
+        **params
+) -> HdpModel:
+    """
+    Train a Hierarchical Dirichlet Process model,
+    which infers the number of topics itself.
+    """
+    return HdpModel(
+        corpus=corpus,
+        id2word=dictionary,
+        **_set(chunksize=chunksize, alpha=alpha, eta=eta,
+               random_state=random_state)
+    )
+
+
+@register_backend('LSI')
+def train_lsi(
+        corpus,
+        dictionary: Dictionary,
+        num_topics: int,
+        chunksize: int = None,
+        random_state: int = None,
+        **params
+) -> LsiModel:
+    """
+    Train a Latent Semantic Indexing model.
+    """
+    return LsiModel(
+        corpus=corpus,
+        num_topics=num_topics,
+        id2word=dictionary,
+        **_set(chunksize=chunksize, random_seed=random_state)
+    )
+
+
+def get_backend(name: str) -> Callable[..., BaseTopicModel]:
+    """
+    Get the training function of a registered backend.
+
+    Raises:
+        ValueError: If no backend is registered under the name.
+    """
+    if name not in MODEL_BACKENDS:
+        raise ValueError(
+            f"The available models are {', '.join(MODEL_BACKENDS)}")
+    return MODEL_BACKENDS[name]
+
+
+def train_model(
+        name: str,
+        corpus,
+        dictionary: Dictionary,
+        num_topics: int,
+        **params
+) -> BaseTopicModel:
+    """
+    Train the topic model of a registered backend. Parameters
+    that the backend doesn't support are ignored.
+
+    Args:
+        name: The name of the algorithm, e.g. 'LDA'.
+        corpus: The bag-of-words corpus.
+        dictionary: The dictionary of the corpus.
+        num_topics: The number of topics.
+        **params: The tuning parameters of the backend.
+
+    Returns:
+        BaseTopicModel: The trained model.
+    """
+    return get_backend(name)(corpus, dictionary, num_topics, **params)
+
+
+def parse_prior(value: str) -> str | float:
+    """
+    Parse a Dirichlet prior given on the command line,
+    either a number or the name of a prior, e.g. 'auto'.
+    """
+    try:
+        return float(value)
+    except ValueError:
+        return value
@@ -0,0 +1,107 @@
+"""
+Title: factions.py
+
+Description:
+    This file contains the FactionIndex class, which
+    maps the abbreviations of the factions to their IDs
+    and back, and the FactionGroups class, which sorts
+    the speeches by faction once, so that the speeches
+    of a faction are a slice of the sorted table instead
+    of a scan over all speeches.
+
+Usage:
+    Create a FactionIndex from the factions table using\n
+    FactionIndex.read('data/factions.parquet')
+    and group the speeches using FactionGroups(speeches).
+"""
+
+import polars as pl
+
+
+class FactionIndex:
+    """
+    A lookup between the abbreviations and IDs of the factions.
+    """
+
+    def __init__(self, factions: pl.DataFrame) -> None:
+        """
+        Initialize the FactionIndex object.
+
+        Args:
+            factions: The factions table with
+            the columns id and abbreviation.
+        """
+        self.ids: dict[str, int] = dict(zip(
+            factions['abbreviation'].to_list(), factions['id'].to_list()))
+        self.abbreviations: dict[int, str] = dict(zip(
+            factions['id'].to_list(), factions['abbreviation'].to_list()))
+
+    @classmethod
+    def read(cls, path: str) -> 'FactionIndex':
+        """
+        Create a FactionIndex from a factions Parquet file.
+        """
+        return cls(pl.read_parquet(path, columns=['id', 'abbreviation']))
+
+    def id(self, party: int | str) -> int:
+        """
+        Get the ID of a faction.
+
+        Args:
+            party: The ID or abbreviation of the faction.
+
+        Raises:
+            ValueError: If no faction has the abbreviation.
+        """
+        if not isinstance(party, str):  # it is an id
+            return int(party)
+        if party not in self.ids:
+            raise ValueError(
+                f"The available factions are {', '.join(self.ids)}")
+        return self.ids[party]
+
+    def abbreviation(self, faction_id: int) -> str | None:
+        """
+        Get the abbreviation of a faction ID, or None if it is unknown.
+        """
+        return self.abbreviations.get(faction_id)
+
+
+class FactionGroups:
+    """
+    The speeches sorted by faction, with the offset
+    and number of speeches of each faction.
+    """
+
+    def __init__(
+            self,
+            speeches: pl.DataFrame,
+            key: str = 'factionId'
+    ) -> None:
+        """
+        Initialize the FactionGroups object.
+
+        Args:
+            speeches: The speeches to group.
+            key: The column containing the faction ID.
+        """
+        self.speeches = speeches.sort(key, maintain_order=True)
+        groups = (self.speeches
+                  .select(key)
+                  .with_row_index('offset')
+                  .group_by(key, maintain_order=True)
+                  .agg(pl.col('offset').first(), pl.len().alias('length')))
+        self.offsets: dict[int, tuple[int, int]] = {
+            faction_id: (offset, length)
+            for faction_id, offset, length in groups.iter_rows()
+        }
+
+    def __len__(self) -> int:
+        return len(self.offsets)
+
+    def get(self, faction_id: int) -> pl.DataFrame:
+        """
+        Get the speeches of a faction, in the order of the dataset.
+        """
+        offset, length = self.offsets.get(faction_id, (0, 0))
+        return self.speeches.slice(offset, length)
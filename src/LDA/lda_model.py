@@ -25,28 +25,59 @@ Usage:
 import argparse
 import json
 import logging
+import multiprocessing
 import os
 import re
-from datetime import datetime
-from typing import Literal
+from concurrent.futures import ProcessPoolExecutor
+from typing import Iterable, Iterator, Literal
 
-import gensim
+import numpy as np
 import polars as pl
 import pyLDAvis
 import pyLDAvis.gensim_models
-import spacy
+from gensim import matutils, utils
 from gensim.corpora import Dictionary
-from gensim.models import LdaModel, LsiModel, HdpModel
+from gensim.models import LdaModel
 from nltk.corpus import stopwords
+from spacy.language import Language
 from spacy.tokens import Doc
 from tqdm import tqdm
 
+from src.corpus_statistics import CorpusStatistics, statistics_path
+from src.LDA.backends import (MODEL_BACKENDS, MODEL_PARAMETERS,
+                              get_backend, parse_prior)
 from src.LDA.exceptions import EmptyCorpusError
-from src.LDA.topic_naming import Topic
+from src.LDA.factions import FactionGroups, FactionIndex
+from src.LDA.lemma_cache import LemmaCache
+from src.LDA.model_store import YearModelStore, speech_keys
+from src.LDA.spacy_models import load_model
+from src.LDA.streaming_corpus import TokenFile, stream_corpus
+from src.LDA.topic_naming import name_topics
+from src.LDA.vocabulary import Vocabulary
+from src.LDA.word_vectors import MemmapVectors
+from src.speeches_io import (collect, is_partitioned, scan_speeches,
+                             with_date_columns)
+from src.tokenize_column import BATCH_SIZE, EXCLUDED_COMPONENTS
 
 logger = logging.getLogger(__name__)
 Doc.set_extension('custom_attr', default=True)
 
+# part-of-speech tags of the lemmas used for topic modelling
+POS_FILTER = ['NOUN', 'PROPN']
+
+# Gensim omits topic shares below this probability from the
+# document topics, even with a minimum probability of zero
+MINIMUM_PROBABILITY = 1e-8
+
+# number of documents whose topics are inferred at once
+INFERENCE_CHUNKSIZE = 2000
+
+# number of speeches whose lemmas are looked up and tagged at once
+LEMMA_CHUNKSIZE = 10000
+
+# tuning parameters that also apply to the online update of an LDA model
+UPDATE_PARAMETERS = ['passes', 'iterations', 'chunksize', 'eval_every']
+
 
 class TopicList:
     """
@@ -61,7 +92,7 @@ class TopicList:
     def __init__(
             self,
             topic_word_dict: dict[int, list[str]],
-            topic_distributions: list[tuple],
+            topic_distributions: np.ndarray,
             parties: list[str]
     ) -> None:
         """
@@ -69,48 +100,50 @@ class TopicList:
 
         Args:
         topic_word_dict: A dictionary mapping topic IDs to words.
-        topic_distributions: List of tuples with the topic distributions.
+        topic_distributions: A (documents, topics) matrix
+        with the topic distribution of each document.
         parties: A list of parties associated with documents.
         """
 
         self.topic_word_dict = topic_word_dict
 
-        self.topic_distributions = topic_distributions
+        self.topic_distributions = np.asarray(topic_distributions,
+                                              dtype=np.float64)
         self.average_share_of_topic = self.get_accumulated_share()
 
         self.parties = parties
         self.topics_parties = self.get_party_topics()
+        (self.party_ids, self.party_topic_counts,
+         self.party_topic_mass) = self.get_party_topic_matrix()
 
-    def get_accumulated_share(self) -> float:
+    def get_accumulated_share(self) -> dict[int, float]:
         """
         This method computes the cumulative share of each topic
         and then averages it by the number of documents.
+        Like Gensim's document topics, shares below
+        MINIMUM_PROBABILITY are not counted. The weights of
+        non-probabilistic models like LSI can be negative,
+        so they are counted by their absolute value.
 
         Returns:
             dict[int, float]: A dictionary mapping topic IDs
             to their average share.
         """
 
-        topic_cumulative_share = {}
-        topic_counts = {}
-
-        for document in self.topic_distributions:
-            for topic_id, share in document:
-                if topic_id not in topic_cumulative_share:
-                    topic_cumulative_share[topic_id] = 0
-                    topic_counts[topic_id] = 0
-                topic_cumulative_share[topic_id] += share
-                topic_counts[topic_id] += 1
+        counted = np.abs(self.topic_distributions) >= MINIMUM_PROBABILITY
+        topic_counts = counted.sum(axis=0)
+        topic_cumulative_share = np.where(
+            counted, self.topic_distributions, 0).sum(axis=0)
 
         topic_average_share = {
-            topic_id: topic_cumulative_share[topic_id] /
-                      topic_counts[topic_id]
-            for topic_id in topic_cumulative_share
+            int(topic_id): float(topic_cumulative_share[topic_id] /
+                                 topic_counts[topic_id])
+            for topic_id in np.flatnonzero(topic_counts)
         }
 
         return topic_average_share
 
-    def get_party_topics(self) -> dict[int, list[str]]:
+    def get_party_topics(self) -> dict[int, set]:
         """
         This method analyzes the topic distribution
         across documents to identify the main topic
@@ -121,38 +154,84 @@ class TopicList:
             dict: A dictionary mapping topic IDs to sets of parties.
         """
 
-        party_topics = {}
-        for idx, document in enumerate(self.topic_distributions):
-
-            party = self.parties[idx]
-            main_topic = max(document, key=lambda x: x[1])[0]
+        main_topics = self.topic_distributions.argmax(axis=1)
+        parties = np.asarray(self.parties, dtype=object)
 
-            if main_topic not in party_topics:
-                party_topics[main_topic] = set([party])
-            else:
-                party_topics[main_topic].add(party)
+        party_topics = {
+            int(topic_id): set(parties[main_topics == topic_id])
+            for topic_id in np.unique(main_topics)
+        }
 
         print(party_topics)
         return party_topics
 
+    def get_party_topic_matrix(
+            self
+    ) -> tuple[list, np.ndarray, np.ndarray]:
+        """
+        This method counts the documents of each party
+        by their main topic and sums the topic shares
+        of the documents of each party.
+
+        Returns:
+            tuple: The sorted party IDs, a (parties, topics) matrix
+            of main topic counts and a (parties, topics) matrix
+            of the probability mass of each topic.
+        """
+
+        party_ids, party_index = np.unique(
+            np.asarray(self.parties), return_inverse=True)
+        main_topics = self.topic_distributions.argmax(axis=1)
+        shape = (len(party_ids), self.topic_distributions.shape[1])
+
+        counts = np.zeros(shape, dtype=np.int64)
+        np.add.at(counts, (party_index, main_topics), 1)
+
+        mass = np.zeros(shape)
+        np.add.at(mass, party_index, self.topic_distributions)
+
+        return party_ids.tolist(), counts, mass
+
+    @property
+    def party_topic_shares(self) -> np.ndarray:
+        """
+        The share of each topic in the probability mass
+        of each party, as a (parties, topics) matrix.
+        """
+        total = self.party_topic_mass.sum(axis=1, keepdims=True)
+        return np.divide(self.party_topic_mass, total,
+                         out=np.zeros_like(self.party_topic_mass),
+                         where=total > 0)
+
     def align_topics(self):
         """
         This generator method yields tuples containing
         the word list, average share of the topic,
-        and associated parties for each topic.
+        associated parties and the main topic counts
+        and topic shares of each party for each topic.
 
         Yields:
             tuple: A tuple containing a WordList object,
-            the average share of the topic,
-            and a set of parties.
+            the average share of the topic, a set of parties,
+            and dictionaries mapping each party to its number of
+            documents with the main topic and to its topic share.
         """
 
+        party_topic_shares = self.party_topic_shares
         num_docs = len(self.topic_word_dict)
         for topic_id in range(0, (num_docs - 1)):
             word_list = WordList(self.topic_word_dict[str(topic_id)])
             relative_share = self.average_share_of_topic[topic_id]
-            parties = self.topics_parties[topic_id]
-            yield (word_list, relative_share, parties)
+            # topics that are not the main topic of any document
+            # have no associated parties
+            parties = self.topics_parties.get(topic_id, set())
+            party_counts = dict(zip(
+                self.party_ids,
+                self.party_topic_counts[:, topic_id].tolist()))
+            party_shares = dict(zip(
+                self.party_ids, party_topic_shares[:, topic_id].tolist()))
+            yield (word_list, relative_share, parties,
+                   party_counts, party_shares)
 
     def __iter__(self):
         return iter(self.align_topics())
@@ -198,21 +277,69 @@ class TopicModel:
 
     def __init__(
             self,
-            dataset: pl.DataFrame,
+            dataset: pl.DataFrame | pl.LazyFrame,
             process: bool = True,
-            topic_model: Literal['LDA', 'LSI', 'HDP'] = None
+            topic_model: Literal['LDA', 'LSI', 'HDP'] = None,
+            tokens_column: str = None,
+            n_process: int = 1,
+            batch_size: int = BATCH_SIZE,
+            exclude: list[str] = EXCLUDED_COMPONENTS,
+            lemma_cache: str = None,
+            model_params: dict = None,
+            factions_path: str = 'data/factions.parquet',
+            model_dir: str = None,
+            corpus_dir: str = None,
+            vocabulary_dir: str = None,
+            dataset_path: str = None
     ) -> None:
         """
         Initialize the TopicModel object.
 
         Args:
-            dataset: A polars DataFrame containing the speeches.
+            dataset: A polars DataFrame containing the speeches,
+            or a LazyFrame over a partitioned speeches dataset.
             process: Whether to apply preprocessing to the dataset.
             topic_model: The desired topic modelling algorithm.
+            tokens_column: A list column of lemmas written by
+            src.tokenize_column, used instead of tagging the
+            speeches with spaCy.
+            n_process: The number of processes tagging the speeches.
+            batch_size: The number of speeches tagged at once.
+            exclude: The spaCy pipeline components that are not loaded.
+            lemma_cache: The path to a directory caching the lemmas
+            of tagged speeches across runs, or None to disable it.
+            model_params: The tuning parameters passed to the backend
+            training the topic model, e.g. passes or iterations.
+            factions_path: The path to the factions parquet file.
+            model_dir: A directory persisting the model of each year,
+            so that years can be updated incrementally.
+            corpus_dir: A directory the corpus of each year is written
+            to and streamed from, instead of holding it in memory.
+            vocabulary_dir: A directory persisting the bigram model and
+            dictionary trained once on all speeches, which are then
+            applied to every year instead of training them per year.
+            dataset_path: The path the whole dataset was read from. If
+            given, the corpus statistics are persisted in a sidecar next
+            to it, so it must not be passed for a subset of the dataset.
         """
 
         self.topic_model = topic_model
-        self.nlp = spacy.load('de_core_news_lg')
+        self.model_params = model_params or {}
+        self.model_store = YearModelStore(model_dir) if model_dir else None
+        self.corpus_dir = corpus_dir
+        self.vocabulary_dir = vocabulary_dir
+        self.vocabulary = None
+        self.dataset_path = dataset_path
+        self._statistics = None
+        self.tokens_column = tokens_column
+        self.n_process = n_process
+        self.batch_size = batch_size
+        # the pipeline and the lemma cache are only loaded
+        # once speeches have to be tagged
+        self.exclude = exclude
+        self._nlp = None
+        self.lemma_cache_path = lemma_cache
+        self.lemma_cache = None
 
         # german stopwords
         self.german_stop_words = stopwords.words('german')
@@ -222,28 +349,63 @@ class TopicModel:
             sw = [line.strip() for line in fp.readlines()]
             self.german_stop_words.extend(sw)
 
-        self.factions_data = pl.read_parquet(args.filename1)
+        self.factions_data = pl.read_parquet(factions_path)
+        self.factions = FactionIndex(self.factions_data)
+        # the speeches are only grouped by faction
+        # once the speeches of a party are requested
+        self._faction_groups = None
 
-        # add year column
-        dataset = dataset.with_columns(
-            dataset["date"].map_elements(
-                self.get_year_from_date,
-                return_dtype=str).alias("year")
-        )
+        # add the typed date and year columns if they are missing
+        dataset = with_date_columns(dataset)
 
         if process:
             self.data: pl.DataFrame = self.prepare_dataset(dataset)
         else:
-            self.data: pl.DataFrame = dataset
+            self.data: pl.DataFrame | pl.LazyFrame = dataset
+
+    @property
+    def nlp(self) -> Language:
+        """
+        The spaCy pipeline tagging the speeches.
+        """
+        if self._nlp is None:
+            self._nlp = load_model(exclude=self.exclude)
+        return self._nlp
+
+    @nlp.setter
+    def nlp(self, nlp: Language) -> None:
+        self._nlp = nlp
+
+    @property
+    def faction_groups(self) -> FactionGroups:
+        """
+        The non-empty speeches grouped by faction.
+        """
+        if self._faction_groups is None:
+            self._faction_groups = FactionGroups(collect(
+                self.data.filter(pl.col('speechContent') != '')))
+        return self._faction_groups
+
+    @property
+    def statistics(self) -> CorpusStatistics:
+        """
+        The number of speeches, words and tokens per year and faction,
+        computed once and read from the sidecar of the dataset if given.
+        """
+        if self._statistics is None:
+            sidecar = None
+            if self.dataset_path:
+                sidecar = statistics_path(self.dataset_path)
+            self._statistics = CorpusStatistics.for_dataset(
+                self.data, sidecar, self.dataset_path, self.tokens_column)
+        return self._statistics
 
     @property
     def word_count(self) -> int:
         """
         The number of words in the dataset.
         """
-        texts = self.data.filter(pl.col('speechContent') != '')[
-            'speechContent'].to_list()
-        return len(' '.join(texts).split())
+        return self.statistics.word_count
 
     @property
     def data_columns(self) -> list[str]:
@@ -258,24 +420,14 @@ class TopicModel:
         """
         The number of parties in dataset.
         """
-        parties = self.data['factionId'].n_unique()
-        return parties
+        return self.statistics.party_count
 
     @property
     def available_years(self) -> list[int]:
         """
         A list of years for which data exists in the dataset.
         """
-        years = self.data["year"].unique()
-        return sorted(list(years))
-
-    @staticmethod
-    def get_year_from_date(date_string: str) -> str:
-        """
-        Extract the year from a date string.
-        """
-        date_object = datetime.strptime(date_string, "%Y-%m-%d")
-        return str(date_object.year)
+        return self.statistics.years
 
     def simple_preprocess(self, text: str) -> str:
         """
@@ -294,6 +446,7 @@ class TopicModel:
         """
         Preprocess the dataset.
         """
+        data = collect(data)
 
         # preprocess text content
         data = data.with_columns(
@@ -302,13 +455,6 @@ class TopicModel:
                 return_dtype=str).alias("speechContent")
         )
 
-        # add year column
-        data = data.with_columns(
-            data["date"].map_elements(
-                self.get_year_from_date,
-                return_dtype=str).alias("year")
-        )
-
         logger.warning('finished preprocessing.')
         data.write_parquet('data/speeches_processed.parquet')
         return data
@@ -318,35 +464,105 @@ class TopicModel:
         Get speeches by year.
 
         Args:
-            year (int): The year to filter speeches by.
+            year (int | str): The year to filter speeches by.
 
         Returns:
             pl.DataFrame: The filtered speeches for the given year.
         """
-        year_speeches = self.data.filter(pl.col('year') == year)
+        year_speeches = self.data.filter(pl.col('year') == int(year))
         year_speeches = year_speeches.filter(pl.col('speechContent') != '')
+        if isinstance(year_speeches, pl.LazyFrame):
+            # the scan is streamed, so only the speeches
+            # of the year are held in memory
+            return year_speeches.collect(streaming=True)
         return year_speeches
 
-    def get_speeches_by_party(self, party: int | str) -> list[str]:
+    def get_speeches_by_party(
+            self,
+            party: int | str,
+            column: str = 'speechContent'
+    ) -> list[str]:
         """
         Get speeches by party.
 
         Args:
             party: The party ID or abbreviation to filter speeches by.
+            column: The column to return for each speech.
 
         Returns:
             list[str]: The filtered speeches for the given party.
+
+        Raises:
+            ValueError: If no faction has the abbreviation.
+        """
+        faction_id = self.factions.id(party)
+        return self.faction_groups.get(faction_id)[column].to_list()
+
+    def get_lemmas(
+            self,
+            texts: list[str],
+            verbose: bool = False
+    ) -> list[list[str]]:
+        """
+        Get the lemmas of the nouns and proper nouns of each speech.
+        Lemmas of speeches found in the lemma cache are reused,
+        all other speeches are streamed through spaCy in batches.
+
+        Args:
+            texts: The speeches to lemmatize.
+            verbose: Whether to display the tagged speeches.
+
+        Returns:
+            list[list[str]]: The lemmas of each speech.
         """
-        if isinstance(party, int):  # it is an id
-            party_speeches = self.data.filter(pl.col('factionId') == party)
+        if self.lemma_cache is None and self.lemma_cache_path:
+            self.lemma_cache = LemmaCache.for_model(
+                self.lemma_cache_path, self.nlp, POS_FILTER, self.exclude)
 
-        if isinstance(party, str):
-            id = self.factions_data.select(
-                self.factions_data['abbreviation'] == party, 'id')
-            party_speeches = self.data.filter(pl.col('factionId') == id)
+        if self.lemma_cache is not None:
+            lemmas = self.lemma_cache.get(texts)
+        else:
+            lemmas = [None] * len(texts)
 
-        party_speeches = party_speeches.filter(pl.col('speechContent') != '')
-        return party_speeches['speechContent'].to_list()
+        missing = [i for i, text_lemmas in enumerate(lemmas)
+                   if text_lemmas is None]
+        docs = self.nlp.pipe((texts[i] for i in missing),
+                             batch_size=self.batch_size,
+                             n_process=self.n_process)
+
+        for i, doc in tqdm(zip(missing, docs), total=len(missing)):
+            lemmas[i] = [tok.lemma_ for tok in doc
+                         if tok.pos_ in POS_FILTER]
+
+            if verbose:
+                tqdm.write(str(doc.text))
+
+        if self.lemma_cache is not None and missing:
+            self.lemma_cache.put([texts[i] for i in missing],
+                                 [lemmas[i] for i in missing])
+            self.lemma_cache.save()
+
+        return lemmas
+
+    def iter_lemmas(
+            self,
+            texts: Iterable[str],
+            verbose: bool = False
+    ) -> Iterator[list[str]]:
+        """
+        Lazily get the lemmas of the nouns and proper nouns of each
+        speech, tagging the speeches in chunks, so that only the lemmas
+        of one chunk are held in memory at a time.
+
+        Args:
+            texts: The speeches to lemmatize.
+            verbose: Whether to display the tagged speeches.
+
+        Yields:
+            list[str]: The lemmas of each speech.
+        """
+        for chunk in utils.grouper(texts, LEMMA_CHUNKSIZE):
+            yield from self.get_lemmas(chunk, verbose)
 
     def generate_topics(
             self,
@@ -380,55 +596,39 @@ class TopicModel:
             or None if `to_html` is True.
         """
 
-        if year:  # filter texts by year
-            year_content = self.get_speeches_by_year(str(year))
-            texts = year_content['speechContent'].to_list()
-            parties = year_content['factionId'].to_list()
-
-        if party is not None:  # filter texts by party
-            texts = self.get_speeches_by_party(party)
-
-        for i, text in tqdm(enumerate(texts), total=len(texts)):
-            doc = self.nlp(text)
-            texts[i] = [
-                tok.lemma_ for tok in doc
-                if tok.pos_ in ['NOUN', 'PROPN']  # it is a noun
-                   and not tok.lemma_.lower() in self.german_stop_words
-                # it is not a stopword
-            ]
-
-            if verbose:
-                tqdm.write(str(doc.text))
-
-        if use_bigrams:  # apply bigram model
-            bigram = gensim.models.phrases.Phrases(texts)
-            texts = [bigram[line] for line in texts]
-
-        dictionary = Dictionary(texts)
-
-        # Filter out words that appear in less than min_frequency documents
-        if min_frequency:
-            dictionary.filter_extremes(no_below=min_frequency)
+        texts, parties, keys = self.get_texts(year, party, verbose)
+
+        # a persisted vocabulary is shared by all years
+        vocabulary = None
+        if self.vocabulary_dir:
+            vocabulary = self.get_vocabulary(use_bigrams, min_frequency)
+
+        if self.corpus_dir:
+            # the texts are written to disk once and streamed from there
+            vocabulary, corpus = stream_corpus(
+                texts,
+                os.path.join(self.corpus_dir, str(year or party)),
+                use_bigrams,
+                min_frequency,
+                vocabulary)
+        else:
+            texts = list(texts)
+            if vocabulary is None:
+                vocabulary = Vocabulary.build(
+                    texts, use_bigrams, min_frequency)
+            corpus = [vocabulary.doc2bow(text) for text in texts]
 
-        corpus = [dictionary.doc2bow(text) for text in texts]
+        phrases, dictionary = vocabulary.phrases, vocabulary.dictionary
 
+        # only the requested algorithm is trained
+        train = get_backend(self.topic_model or model)
         try:
-            topic_models = {
-                'LDA': LdaModel(
-                    corpus=corpus,
-                    num_topics=num_topics,
-                    id2word=dictionary
-                ),
-                'HDP': HdpModel(
-                    corpus=corpus,
-                    id2word=dictionary
-                ),
-                'LSI': LsiModel(
-                    corpus=corpus,
-                    num_topics=num_topics,
-                    id2word=dictionary
-                )
-            }
+            model = train(
+                corpus,
+                dictionary,
+                num_topics,
+                **self.model_params
+            )
         except ValueError:
             raise EmptyCorpusError(
                 """Please modify the number of rows """
@@ -437,10 +637,15 @@ class TopicModel:
                 """returned an empty corpus.""".format(year)
             )
 
-        if self.topic_model:
-            model = topic_models[self.topic_model]
-        else:
-            model = topic_models[model]
+        # persist the model, so the year can be updated incrementally
+        if self.model_store is not None and year:
+            if isinstance(model, LdaModel):
+                self.model_store.save(
+                    year, model, dictionary, phrases, set(keys),
+                    corpus, parties)
+            else:
+                logger.warning('only LDA models can be updated, '
+                               f'the model of {year} is not persisted.')
 
         if to_html:
             data = pyLDAvis.gensim_models.prepare(model, corpus, dictionary)
@@ -449,44 +654,305 @@ class TopicModel:
                 pyLDAvis.save_html(data, fp)
                 logger.warning(f'saved html file to {fname}')
         else:
-            # dictionary containing the lists of salient words for each topic
-            topic_words_dict = {}
-            topic_distributions = []
+            return self.get_topic_list(
+                model, dictionary, corpus, num_topics, topn, parties)
+
+    def get_vocabulary(
+            self,
+            use_bigrams: bool = True,
+            min_frequency: int = None
+    ) -> Vocabulary:
+        """
+        Load the vocabulary persisted in the vocabulary directory,
+        or train it on the speeches of all years and persist it.
+
+        Args:
+            use_bigrams: Whether to apply a bigram model.
+            min_frequency: Minimum number of documents a word
+            has to appear in.
+
+        Returns:
+            Vocabulary: The vocabulary shared by all years.
+        """
+        if self.vocabulary is not None:
+            return self.vocabulary
+
+        if Vocabulary.exists(self.vocabulary_dir):
+            self.vocabulary = Vocabulary.load(self.vocabulary_dir)
+            return self.vocabulary
+
+        texts = (text for year in self.available_years
+                 for text in self.get_texts(year)[0])
+        if self.corpus_dir:
+            # the speeches of all years are streamed from disk
+            os.makedirs(self.corpus_dir, exist_ok=True)
+            texts = TokenFile.write(
+                os.path.join(self.corpus_dir, 'tokens.txt'), texts)
+        else:
+            texts = list(texts)
+
+        self.vocabulary = Vocabulary.build(texts, use_bigrams, min_frequency)
+        self.vocabulary.save(self.vocabulary_dir)
+        return self.vocabulary
+
+    def get_texts(
+            self,
+            year: int = None,
+            party: str = None,
+            verbose: bool = False,
+            seen: set[str] = None
+    ) -> tuple[Iterator[list[str]], list[int], list[str]]:
+        """
+        Get the lemmas of the speeches of a year or a party,
+        without stopwords.
+
+        The lemmas are produced lazily while they are consumed,
+        so the lemmas of all speeches are never held in memory.
+
+        Args:
+            year: The year to filter speeches by.
+            party: The party to filter speeches by.
+            verbose: Whether to display the tagged speeches.
+            seen: The keys of speeches that are skipped,
+            so that they are not tagged again.
+
+        Returns:
+            tuple: The lemmas of each speech, the factions of the
+            speeches of a year and the keys identifying the speeches
+            in the model store, or None if no model store is used.
+        """
+        # pre-tokenized speeches only need to be filtered for stopwords
+        column = self.tokens_column or 'speechContent'
+
+        if year:  # filter texts by year
+            speeches = self.get_speeches_by_year(year)
+
+        if party is not None:  # filter texts by party
+            speeches = self.faction_groups.get(self.factions.id(party))
+
+        # only the model store identifies the speeches
+        keys = None
+        if self.model_store is not None or seen is not None:
+            ids = speeches['id'] if 'id' in speeches.columns else None
+            keys = speech_keys(speeches['speechContent'], ids)
+
+        if seen:  # skip the speeches that were seen before
+            new = [key not in seen for key in keys]
+            speeches = speeches.filter(pl.Series(new, dtype=pl.Boolean))
+            keys = [key for key, is_new in zip(keys, new) if is_new]
+
+        parties = speeches['factionId'].to_list() if party is None else None
+
+        texts = (text for text, in speeches.select(column).iter_rows())
+        if not self.tokens_column:
+            texts = self.iter_lemmas(texts, verbose)
+
+        german_stop_words = set(self.german_stop_words)
+        texts = (
+            [lemma for lemma in lemmas
+             if lemma.lower() not in german_stop_words]  # not a stopword
+            for lemmas in texts
+        )
+
+        return texts, parties, keys
+
+    @staticmethod
+    def get_topic_list(
+            model,
+            dictionary: Dictionary,
+            corpus: list,
+            num_topics: int,
+            topn: int,
+            parties: list[int]
+    ) -> TopicList:
+        """
+        Collect the salient words of each topic and the
+        topic distribution of each document of a trained model.
+        """
+        # dictionary containing the lists of salient words for each topic
+        topic_words_dict = {}
+
+        for topic_id in range(num_topics):
+            topic_terms = model.get_topic_terms(topic_id, topn=topn)
+            topic_words = [dictionary[word_id]
+                           for word_id, _ in topic_terms]
+            topic_words_dict[str(topic_id)] = topic_words
+
+        # Get the topic distribution for each document
+        topic_distributions = infer_document_topics(model, corpus)
+
+        return TopicList(topic_words_dict, topic_distributions, parties)
+
+    def update_topics(
+            self,
+            year: int,
+            topn: int = 5
+    ) -> TopicList:
+        """
+        Update the persisted model of a year with the speeches that
+        were added since it was trained, using the online update of
+        Gensim's LDA, and collect the topics of all its speeches.
+
+        The dictionary and bigram model of the year are kept fixed,
+        so words that are new to the year are ignored. The corpus of the
+        persisted model is reused, so only the new speeches are tagged.
+
+        Args:
+            year: The year to update.
+            topn: Number of top words to consider for each topic.
 
-            for topic_id in range(num_topics):
-                topic_terms = model.get_topic_terms(topic_id, topn=topn)
-                topic_words = [dictionary[word_id]
-                               for word_id, _ in topic_terms]
-                topic_words_dict[str(topic_id)] = topic_words
+        Returns:
+            TopicList: The topics of the updated model.
+        """
+        model, dictionary, phrases, seen = self.model_store.load(year)
+        corpus, parties = self.model_store.load_corpus(year)
+
+        # only the new speeches are tagged and mapped to bags of words
+        texts, new_parties, keys = self.get_texts(year, seen=seen)
+        if phrases is not None:
+            texts = (phrases[line] for line in texts)
+        new_corpus = [dictionary.doc2bow(text) for text in texts]
+        logger.warning(f'updating the model of {year} '
+                       f'with {len(new_corpus)} new speeches.')
+
+        if new_corpus:
+            # the parameters are set on the model, since the update
+            # of LdaMulticore doesn't take them as arguments
+            for param in UPDATE_PARAMETERS:
+                if self.model_params.get(param) is not None:
+                    setattr(model, param, self.model_params[param])
+            model.update(new_corpus)
+
+            corpus += new_corpus
+            parties += new_parties
+            self.model_store.save(year, model, dictionary, phrases,
+                                  seen.union(keys), corpus, parties)
+
+        return self.get_topic_list(
+            model, dictionary, corpus, model.num_topics, topn, parties)
+
+
+def infer_document_topics(
+        model,
+        corpus,
+        chunksize: int = INFERENCE_CHUNKSIZE
+) -> np.ndarray:
+    """
+    Infer the topic distribution of each document of a corpus.
+    LDA models infer the documents of a chunk in one batch, which
+    gives the same distributions as get_document_topics, other
+    models are queried one document at a time.
 
-            # Get the topic distribution for each document
-            for doc_bow in corpus:
-                doc_topics = model.get_document_topics(
-                    doc_bow, minimum_probability=0)
-                topic_distributions.append(doc_topics)
+    Args:
+        model: The trained topic model.
+        corpus: The bag-of-words corpus, which is iterated once.
+        chunksize: The number of documents inferred at once.
 
-            return TopicList(topic_words_dict, topic_distributions, parties)
+    Returns:
+        np.ndarray: A (documents, topics) matrix of topic shares.
+    """
+    if not isinstance(model, LdaModel):
+        # HDP models have no num_topics, their topics are truncated at m_T
+        num_topics = getattr(model, 'num_topics', None) or model.m_T
+        return matutils.corpus2csc(
+            (model[doc_bow] for doc_bow in corpus),
+            num_terms=num_topics).T.toarray()
+
+    chunks = [np.zeros((0, model.num_topics))]
+    for chunk in utils.grouper(corpus, chunksize):
+        gamma, _ = model.inference(chunk)
+        chunks.append(gamma / gamma.sum(axis=1, keepdims=True))
+    return np.concatenate(chunks)
 
 
 def load_data(filename, n_rows=None):
     """
     Load the parquet dataset and return first n rows if specified.
+    Partitioned datasets are scanned lazily, so that only the
+    partitions of the requested years are read.
     """
     assert os.path.exists(filename), "Please pass an existing file."
-    data = pl.read_parquet(filename)
+    if is_partitioned(filename):
+        data = scan_speeches(filename)
+    else:
+        data = pl.read_parquet(filename)
     if n_rows:
         data = data.limit(n_rows)
     return data
 
 
+# the topic model of a worker process, created once per process
+_worker_model = None
+
+
+def _init_worker(filename, n_rows, model_kwargs):
+    """
+    Create the topic model of a worker process. The speeches are
+    scanned lazily, so every worker only reads the years it models.
+    """
+    global _worker_model
+    data = scan_speeches(filename)
+    if n_rows:
+        data = data.limit(n_rows)
+    _worker_model = TopicModel(data, process=False, **model_kwargs)
+
+
+def _generate_year_topics(year, min_frequency):
+    """
+    Generate the topics of a year in a worker process.
+    """
+    print(f'processing year {str(year)}.')
+    return generate_year_topics(_worker_model, year, min_frequency)
+
+
+def generate_year_topics(ldaModel, year, min_frequency):
+    """
+    Generate the topics of a single year.
+
+    Args:
+        ldaModel: An instance of TopicModel
+        or a similar class capable of generating topics.
+        year: The year to generate topics for.
+        min_frequency: Minimum frequency of
+        words to consider during topic generation.
+
+    Returns:
+        list: The (word list, relative share, parties, party counts,
+        party shares) tuples of the topics, or None if the year
+        returned an empty corpus.
+    """
+    try:
+        topics = ldaModel.generate_topics(
+            use_bigrams=True,
+            min_frequency=min_frequency,
+            num_topics=5,
+            topn=20,
+            year=int(year),
+            to_html=False)
+    except EmptyCorpusError as e:
+        print(EmptyCorpusError.__name__ + ": " + str(e))
+        return None
+    return list(topics)
+
+
 def process_topics_by_year(
         ldaModel,
         min_frequency,
         used_words,
-        topic_naming_engine
+        topic_naming_engine,
+        centroid_cache=None,
+        vectors=None,
+        jobs=1,
+        worker_args=None
 ):
     """
     Process topics by year using the provided LDA model and parameters.
+    The topics of all years are named in a single batch.
+
+    With more than one job, the topics of the years are generated in
+    a pool of worker processes, each of which creates its own topic
+    model once. Naming and merging the topics happens in the order of
+    the years, so the result is the same as that of a sequential run.
 
     Args:
         ldaModel: An instance of TopicModel
@@ -496,6 +962,13 @@ def process_topics_by_year(
         used_words: A set containing words
         that have already been used as topics.
         topic_naming_engine: The engine or method used to name topics.
+        centroid_cache: A directory caching the topic category
+        centroids across runs, or None to compute them.
+        vectors: The word vectors used to name topics,
+        by default those of the spaCy pipeline.
+        jobs: The number of worker processes generating topics.
+        worker_args: The filename, number of rows and TopicModel
+        keyword arguments used to create the model of each worker.
 
     Returns:
         dict: A dictionary where keys are years and values
@@ -507,51 +980,177 @@ def process_topics_by_year(
               of the topic in the respective year.
               - 'parties': A list of parties
               associated with the topic.
+              - 'party_counts': The number of speeches of
+              each party with the topic as their main topic.
+              - 'party_shares': The share of the topic
+              in the speeches of each party.
     """
 
-    topics_by_year = {}
-    for year in ldaModel.available_years:
-        print(f'processing year {str(year)}.')
-        topics_by_year[year] = {}
-        try:
-            topics = ldaModel.generate_topics(
-                use_bigrams=True,
-                min_frequency=min_frequency,
-                num_topics=5,
-                topn=20,
-                year=int(year),
-                to_html=False)
-        except EmptyCorpusError as e:
-            print(EmptyCorpusError.__name__ + ": " + str(e))
-            continue
-
-        for word_list, relative_share, parties in topics:
-            topic = Topic(
-                salient_words=word_list,
-                used_topics=used_words,
-                engine=topic_naming_engine)
-            topic_name = topic.name.strip(""".'"!,""")
-            used_words.add(topic_name)
-
-            print("topic: {}".format(topic_name))
-            print("words: {}.".format(str(word_list)))
-            print("parties: {}".format(parties))
-            print("-" * 64)
-
-            if topic_name in topics_by_year[year]:
-                t = topics_by_year[year][topic_name]
-                word_list = sorted(list(set(t['words'] + list(word_list))))
-                relative_share = float(t['relative_share']) + relative_share
-                parties = set(t['parties']).union(parties)
-
-            topics_by_year[year][topic_name] = {
-                'words': list(word_list),
-                'relative_share': str(relative_share),
-                'parties': list(parties)
-            }
+    years = ldaModel.available_years
+    # json keys are strings
+    topics_by_year = {str(year): {} for year in years}
+
+    # the shared vocabulary is trained once, the workers load it
+    if ldaModel.vocabulary_dir:
+        ldaModel.get_vocabulary(min_frequency=min_frequency)
+
+    if jobs > 1:
+        executor = ProcessPoolExecutor(
+            max_workers=jobs,
+            mp_context=multiprocessing.get_context('spawn'),
+            initializer=_init_worker,
+            initargs=worker_args)
+        with executor:
+            results = list(executor.map(
+                _generate_year_topics, years,
+                [min_frequency] * len(years)))
+    else:
+        results = []
+        for year in years:
+            print(f'processing year {str(year)}.')
+            results.append(
+                generate_year_topics(ldaModel, year, min_frequency))
+
+    year_topics = [(str(year), topic)
+                   for year, topics in zip(years, results)
+                   if topics is not None
+                   for topic in topics]
+
+    return merge_topics(topics_by_year, year_topics, used_words,
+                        topic_naming_engine, centroid_cache, vectors)
+
+
+def merge_topics(
+        topics_by_year,
+        year_topics,
+        used_words,
+        topic_naming_engine,
+        centroid_cache=None,
+        vectors=None
+):
+    """
+    Name a list of topics in a single batch and merge them into
+    the topics of their years. Topics of a year that are given
+    the same name are merged into one entry.
+
+    Args:
+        topics_by_year: The dictionary of topics by year to update.
+        year_topics: A list of (year, (word list, relative share,
+        parties, party counts, party shares)) tuples.
+        used_words: A set containing words
+        that have already been used as topics.
+        topic_naming_engine: The engine or method used to name topics.
+        centroid_cache: A directory caching the topic category
+        centroids across runs, or None to compute them.
+        vectors: The word vectors used to name topics,
+        by default those of the spaCy pipeline.
+
+    Returns:
+        dict: The updated dictionary of topics by year.
+    """
+    topic_names = name_topics(
+        [list(topic[0]) for _, topic in year_topics],
+        engine=topic_naming_engine,
+        vectors=vectors,
+        cache_dir=centroid_cache)
+
+    for (year, topic), topic_name in zip(year_topics, topic_names):
+        (word_list, relative_share, parties,
+         party_counts, party_shares) = topic
+        # json keys are strings
+        party_counts = {str(party): count
+                        for party, count in party_counts.items()}
+        party_shares = {str(party): share
+                        for party, share in party_shares.items()}
+        topic_name = topic_name.strip(""".'"!,""")
+        used_words.add(topic_name)
+
+        print("topic: {}".format(topic_name))
+        print("words: {}.".format(str(word_list)))
+        print("parties: {}".format(parties))
+        print("-" * 64)
+
+        if topic_name in topics_by_year[year]:
+            t = topics_by_year[year][topic_name]
+            word_list = sorted(list(set(t['words'] + list(word_list))))
+            relative_share = float(t['relative_share']) + relative_share
+            parties = set(t['parties']).union(parties)
+            party_counts = {
+                party: t['party_counts'].get(party, 0) + count
+                for party, count in party_counts.items()}
+            party_shares = {
+                party: t['party_shares'].get(party, 0) + share
+                for party, share in party_shares.items()}
+
+        topics_by_year[year][topic_name] = {
+            'words': list(word_list),
+            'relative_share': str(relative_share),
+            'parties': list(parties),
+            'party_counts': party_counts,
+            'party_shares': party_shares
+        }
     return topics_by_year
 
 
+def update_year(
+        ldaModel,
+        year,
+        min_frequency,
+        topics_by_year,
+        used_words,
+        topic_naming_engine,
+        centroid_cache=None,
+        vectors=None
+):
+    """
+    Update the persisted model of a single year with its new speeches
+    and replace the topics of that year, keeping all other years.
+
+    Args:
+        ldaModel: An instance of TopicModel with a model directory.
+        year: The year to update.
+        min_frequency: Minimum frequency of words to consider
+        if the year has to be trained from scratch.
+        topics_by_year: The topics by year of a previous run.
+        used_words: A set containing words
+        that have already been used as topics.
+        topic_naming_engine: The engine or method used to name topics.
+        centroid_cache: A directory caching the topic category
+        centroids across runs, or None to compute them.
+        vectors: The word vectors used to name topics,
+        by default those of the spaCy pipeline.
+
+    Returns:
+        dict: The updated dictionary of topics by year.
+    """
+    # json keys are strings
+    year = str(year)
+
+    if ldaModel.model_store.exists(year):
+        topics = ldaModel.update_topics(year, topn=20)
+    else:
+        # the year is trained from scratch and persisted
+        topics = generate_year_topics(ldaModel, year, min_frequency)
+        if topics is None:
+            return topics_by_year
+
+    topics_by_year[year] = {}
+    return merge_topics(topics_by_year, [(year, topic) for topic in topics],
+                        used_words, topic_naming_engine, centroid_cache,
+                        vectors)
+
+
+def load_topics(output_path):
+    """
+    Load the output dictionary of a previous run from a json file,
+    or return an empty dictionary if the file doesn't exist.
+    """
+    if not os.path.exists(output_path):
+        return {}
+    with open(output_path, 'r', encoding='utf-8') as fp:
+        return json.load(fp)
+
+
 def save_topics(output_path, topics_by_year):
     """
     Save the output dictionary to a json file.
@@ -565,13 +1164,33 @@ def main(args):
     Run the LDA topic modelling using the
     specified arguments.
     """
-    assert args.model in ['LDA', 'LSI', 'HDP'], \
-        "The available models are LDA, LSI and HDP"
+    assert args.model in MODEL_BACKENDS, \
+        f"The available models are {', '.join(MODEL_BACKENDS)}"
     assert 0 < args.min_frequency <= 1000, \
         "The minimum frequency must be between 0 and 1000"
 
+    model_kwargs = dict(
+        topic_model=args.model,
+        tokens_column=args.tokens_column,
+        n_process=args.n_process,
+        batch_size=args.batch_size,
+        exclude=args.exclude,
+        lemma_cache=args.lemma_cache,
+        model_params={param: getattr(args, param)
+                      for param in MODEL_PARAMETERS},
+        factions_path=args.filename1,
+        model_dir=args.model_dir,
+        corpus_dir=args.corpus_dir,
+        vocabulary_dir=args.vocabulary_dir,
+        # the statistics of the first rows are not persisted,
+        # they would be served for the whole dataset
+        dataset_path=(args.filename
+                      if args.statistics and not args.n_rows else None))
+
     data = load_data(args.filename, args.n_rows)
-    ldaModel = TopicModel(data, process=False, topic_model=args.model)
+    vectors = MemmapVectors(args.vectors) if args.vectors else None
+    ldaModel = TopicModel(data, process=False, **model_kwargs)
+    print(f'corpus: {ldaModel.statistics}.')
     used_words = set((
         "Außenpolitik",
         "Innenpolitik",
@@ -583,10 +1202,24 @@ def main(args):
         "Wirtschaftspolitik",
         "Oppositionspolitik"
     ))
-    topics_by_year = process_topics_by_year(
-        ldaModel, args.min_frequency, used_words, args.topic_naming_engine)
+    if args.update_year:
+        assert args.model_dir, \
+            "Updating a year requires the model directory of a previous run"
+        topics_by_year = update_year(
+            ldaModel, args.update_year, args.min_frequency,
+            load_topics(args.output), used_words, args.topic_naming_engine,
+            args.centroid_cache, vectors)
+    else:
+        topics_by_year = process_topics_by_year(
+            ldaModel, args.min_frequency, used_words,
+            args.topic_naming_engine, args.centroid_cache, vectors,
+            args.jobs, (args.filename, args.n_rows, model_kwargs))
     save_topics(args.output, topics_by_year)
 
+    # merge the shards written by this run
+    if args.lemma_cache:
+        LemmaCache.compact(args.lemma_cache)
+
 
 if __name__ == "__main__":
     parser = argparse.ArgumentParser()
@@ -604,6 +1237,40 @@ if __name__ == "__main__":
                         type=int)
     parser.add_argument('-engine', '--topic-naming-engine',
                         default='list', type=str)
+    parser.add_argument('-tokens', '--tokens-column', default=None,
+                        type=str)
+    parser.add_argument('-n-process', '--n-process', default=1,
+                        type=int)
+    parser.add_argument('-batch-size', '--batch-size', default=BATCH_SIZE,
+                        type=int)
+    parser.add_argument('-exclude', '--exclude', nargs='*',
+                        default=EXCLUDED_COMPONENTS, type=str)
+    parser.add_argument('-lemma-cache', '--lemma-cache',
+                        default='data/lemma_cache', type=str)
+    parser.add_argument('-centroid-cache', '--centroid-cache',
+                        default=None, type=str)
+    parser.add_argument('-vectors', '--vectors', default=None, type=str)
+    parser.add_argument('-passes', '--passes', default=None, type=int)
+    parser.add_argument('-iterations', '--iterations', default=None,
+                        type=int)
+    parser.add_argument('-chunksize', '--chunksize', default=None, type=int)
+    parser.add_argument('-alpha', '--alpha', default=None, type=parse_prior)
+    parser.add_argument('-eta', '--eta', default=None, type=parse_prior)
+    parser.add_argument('-random-state', '--random-state', default=None,
+                        type=int)
+    parser.add_argument('-jobs', '--jobs', default=1, type=int)
+    parser.add_argument('-workers', '--workers', default=None, type=int)
+    parser.add_argument('-eval-every', '--eval-every', default=None,
+                        type=int)
+    parser.add_argument('-model-dir', '--model-dir', default=None,
+                        type=str)
+    parser.add_argument('-update-year', '--update-year', default=None,
+                        type=int)
+    parser.add_argument('-corpus-dir', '--corpus-dir', default=None,
+                        type=str)
+    parser.add_argument('-vocabulary-dir', '--vocabulary-dir', default=None,
+                        type=str)
+    parser.add_argument('-statistics', '--statistics', action='store_true')
 
     args = parser.parse_args()
 
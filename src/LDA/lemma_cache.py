@@ -0,0 +1,218 @@
+"""
+Title: lemma_cache.py
+
+Description:
+    This file contains the LemmaCache class,
+    which stores the filtered lemmas of speeches
+    in a directory of Parquet shards, so that unchanged
+    speeches don't have to be parsed by spaCy again
+    when the topic model is rerun.
+
+Usage:
+    Create a LemmaCache for a directory and a spaCy
+    pipeline, look up the lemmas of a list of speeches
+    using get, add the lemmas of newly parsed speeches
+    using put and write them to a new shard using save.
+    The shards are merged once there are too many of
+    them, and at the end of a run using compact.
+"""
+
+import fcntl
+import glob
+import hashlib
+import os
+import uuid
+
+import polars as pl
+from spacy.language import Language
+
+# Schema of the Parquet shards backing the cache
+CACHE_SCHEMA = {"key": pl.String, "lemmas": pl.List(pl.String)}
+
+# number of shards above which a save merges all shards into one
+MAX_SHARDS = 16
+
+
+class LemmaCache:
+    """
+    An on-disk cache mapping speeches to their filtered lemmas.
+
+    Entries are keyed by a hash of the speech text, the name and version
+    of the spaCy model, the part-of-speech filter and the excluded
+    pipeline components, so a different model or configuration never
+    serves stale lemmas.
+
+    The entries are not loaded into memory. Each lookup scans the shards
+    for the keys of the requested speeches only, and every save appends
+    the entries added since the last save as a new shard, so saving
+    costs only the size of the new entries.
+    """
+
+    def __init__(
+            self,
+            path: str,
+            model_name: str,
+            model_version: str,
+            pos_filter: list[str],
+            exclude: list[str] = ()
+    ) -> None:
+        """
+        Initialize the LemmaCache object.
+
+        Args:
+            path: The directory of the Parquet shards of the cache.
+            model_name: The name of the spaCy model.
+            model_version: The version of the spaCy model.
+            pos_filter: The part-of-speech tags of the cached lemmas.
+            exclude: The spaCy pipeline components that are not loaded.
+        """
+        self.path = path
+        self.prefix = '\0'.join(
+            [model_name, model_version, ','.join(sorted(pos_filter)),
+             ','.join(sorted(exclude))])
+        # entries added since the last save
+        self.pending: dict[str, list[str]] = {}
+
+    @classmethod
+    def for_model(
+            cls,
+            path: str,
+            nlp: Language,
+            pos_filter: list[str],
+            exclude: list[str] = ()
+    ) -> 'LemmaCache':
+        """
+        Create a LemmaCache for the lemmas of a spaCy pipeline.
+        """
+        name = f"{nlp.meta['lang']}_{nlp.meta['name']}"
+        return cls(path, name, nlp.meta['version'], pos_filter, exclude)
+
+    @staticmethod
+    def shards(path: str) -> list[str]:
+        """
+        List the Parquet shards of a cache directory.
+        """
+        return sorted(glob.glob(os.path.join(path, '*.parquet')))
+
+    def __len__(self) -> int:
+        keys = set(self.pending)
+        if os.path.isdir(self.path):
+            with _DirectoryLock(self.path, fcntl.LOCK_SH):
+                shards = self.shards(self.path)
+                if shards:
+                    keys.update(pl.scan_parquet(shards).select('key')
+                                .collect(streaming=True)['key'])
+        return len(keys)
+
+    def key(self, text: str) -> str:
+        """
+        Compute the cache key of a speech.
+        """
+        content = f'{self.prefix}\0{text}'.encode('utf-8')
+        return hashlib.sha256(content).hexdigest()
+
+    def get(self, texts: list[str]) -> list[list[str] | None]:
+        """
+        Look up the lemmas of a list of speeches.
+
+        Args:
+            texts: The speeches to look up.
+
+        Returns:
+            list: The cached lemmas of each speech,
+            or None for speeches that are not cached.
+        """
+        keys = [self.key(text) for text in texts]
+        entries = {key: self.pending[key]
+                   for key in keys if key in self.pending}
+
+        missing = [key for key in keys if key not in entries]
+        if missing and os.path.isdir(self.path):
+            with _DirectoryLock(self.path, fcntl.LOCK_SH):
+                shards = self.shards(self.path)
+                if shards:
+                    cache = (pl.scan_parquet(shards)
+                             .filter(pl.col('key').is_in(missing))
+                             .collect(streaming=True))
+                    entries.update(zip(cache['key'].to_list(),
+                                       cache['lemmas'].to_list()))
+
+        return [entries.get(key) for key in keys]
+
+    def put(self, texts: list[str], lemmas: list[list[str]]) -> None:
+        """
+        Add the lemmas of a list of speeches to the cache.
+        """
+        for text, text_lemmas in zip(texts, lemmas):
+            self.pending[self.key(text)] = text_lemmas
+
+    def save(self) -> None:
+        """
+        Write the entries added since the last save to a new shard,
+        and merge the shards once there are more than MAX_SHARDS.
+        The shard is renamed into place once it is complete, so an
+        interrupted run never leaves a truncated shard behind.
+        """
+        if not self.pending:
+            return
+
+        os.makedirs(self.path, exist_ok=True)
+        _write_shard(self.path, pl.DataFrame({
+            'key': list(self.pending.keys()),
+            'lemmas': list(self.pending.values())
+        }, schema=CACHE_SCHEMA))
+        self.pending = {}
+
+        if len(self.shards(self.path)) > MAX_SHARDS:
+            self.compact(self.path)
+
+    @classmethod
+    def compact(cls, path: str) -> None:
+        """
+        Merge the shards of a cache directory into a single shard.
+        The shards are streamed, so only their keys are held in memory.
+        """
+        if not os.path.isdir(path):
+            return
+
+        with _DirectoryLock(path, fcntl.LOCK_EX):
+            shards = cls.shards(path)
+            if len(shards) < 2:
+                return
+
+            _write_shard(path, pl.scan_parquet(shards).unique('key'))
+            for shard in shards:
+                os.remove(shard)
+
+
+class _DirectoryLock:
+    """
+    A file lock on a cache directory, which keeps a compaction
+    from removing shards while they are read.
+    """
+
+    def __init__(self, path: str, operation: int) -> None:
+        self.path = os.path.join(path, '.lock')
+        self.operation = operation
+        self.fp = None
+
+    def __enter__(self):
+        self.fp = open(self.path, 'w')
+        fcntl.flock(self.fp, self.operation)
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.fp.close()
+
+
+def _write_shard(path: str, cache: pl.DataFrame | pl.LazyFrame) -> None:
+    """
+    Write cache entries to a new shard of a cache directory.
+    """
+    name = uuid.uuid4().hex
+    tmp_path = os.path.join(path, f'.{name}.tmp')
+    if isinstance(cache, pl.LazyFrame):
+        cache.sink_parquet(tmp_path)
+    else:
+        cache.write_parquet(tmp_path)
+    os.replace(tmp_path, os.path.join(path, f'{name}.parquet'))
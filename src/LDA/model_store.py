@@ -0,0 +1,160 @@
+"""
+Title: model_store.py
+
+Description:
+    This file contains the YearModelStore class,
+    which persists the topic model, dictionary and
+    bigram model of each year together with the
+    bag-of-words corpus, the factions and the keys
+    of the speeches the model was trained on, so that
+    a year can later be updated with only the speeches
+    that were added since.
+
+Usage:
+    Pass a directory to the TopicModel using
+    the model_dir parameter, or run\n
+    python -m src.LDA.lda_model --model-dir data/lda_models
+    to persist the models, and\n
+    python -m src.LDA.lda_model --model-dir data/lda_models --update-year 2024
+    to update a single year.
+"""
+
+import hashlib
+import json
+import os
+from itertools import repeat
+from typing import Iterable
+
+from gensim.corpora import Dictionary, MmCorpus
+from gensim.models import LdaModel
+from gensim.models.phrases import FrozenPhrases
+
+
+def speech_hash(text: str) -> str:
+    """
+    Identify a speech by a hash of its text.
+    """
+    return hashlib.sha256(text.encode('utf-8')).hexdigest()
+
+
+def speech_keys(texts: Iterable[str], ids: Iterable = None) -> list[str]:
+    """
+    Identify each speech by its ID and a hash of its text. Speeches
+    without an ID are numbered by the occurrences of their text instead,
+    so that a repeated speech is not mistaken for one seen before.
+
+    Args:
+        texts: The texts of the speeches.
+        ids: The IDs of the speeches, or None if they have none.
+
+    Returns:
+        list[str]: The key of each speech.
+    """
+    keys = []
+    occurrences: dict[str, int] = {}
+    for text, speech_id in zip(texts, repeat(None) if ids is None else ids):
+        text_hash = speech_hash(text)
+        if speech_id is None:
+            occurrence = occurrences.get(text_hash, 0)
+            occurrences[text_hash] = occurrence + 1
+            speech_id = f'#{occurrence}'
+        keys.append(f'{speech_id}:{text_hash}')
+    return keys
+
+
+class YearModelStore:
+    """
+    A directory holding the persisted topic model of each year,
+    e.g. `data/lda_models/2024/model`.
+    """
+
+    def __init__(self, directory: str) -> None:
+        self.directory = directory
+
+    def path(self, year, name: str) -> str:
+        return os.path.join(self.directory, str(year), name)
+
+    def exists(self, year) -> bool:
+        """
+        Check whether a model was persisted for a year.
+        """
+        return os.path.exists(self.path(year, 'speeches.json'))
+
+    def save(
+            self,
+            year,
+            model: LdaModel,
+            dictionary: Dictionary,
+            phrases: FrozenPhrases | None,
+            speeches: set[str],
+            corpus,
+            parties: list[int]
+    ) -> None:
+        """
+        Persist the model of a year.
+
+        Args:
+            year: The year of the model.
+            model: The trained topic model.
+            dictionary: The dictionary of the model's corpus.
+            phrases: The bigram model applied to the speeches, or None.
+            speeches: The keys of the speeches the model was
+            trained on.
+            corpus: The bag-of-words corpus of the speeches.
+            parties: The faction of each document of the corpus.
+        """
+        os.makedirs(os.path.join(self.directory, str(year)), exist_ok=True)
+        model.save(self.path(year, 'model'))
+        dictionary.save(self.path(year, 'dictionary'))
+
+        phrases_path = self.path(year, 'phrases')
+        if phrases is not None:
+            phrases.save(phrases_path)
+        elif os.path.exists(phrases_path):
+            os.remove(phrases_path)
+
+        MmCorpus.serialize(self.path(year, 'corpus.mm'), corpus)
+        with open(self.path(year, 'parties.json'), 'w',
+                  encoding='utf-8') as fp:
+            json.dump(parties, fp)
+
+        # written last, so that a year only exists once it is complete
+        with open(self.path(year, 'speeches.json'), 'w',
+                  encoding='utf-8') as fp:
+            json.dump(sorted(speeches), fp)
+
+    def load(self, year) -> tuple[LdaModel, Dictionary,
+                                  FrozenPhrases | None, set[str]]:
+        """
+        Load the persisted model of a year.
+
+        Returns:
+            tuple: The model, the dictionary, the bigram model or None,
+            and the keys of the speeches the model was trained on.
+        """
+        model = LdaModel.load(self.path(year, 'model'))
+        dictionary = Dictionary.load(self.path(year, 'dictionary'))
+
+        phrases = None
+        if os.path.exists(self.path(year, 'phrases')):
+            phrases = FrozenPhrases.load(self.path(year, 'phrases'))
+
+        with open(self.path(year, 'speeches.json'), 'r',
+                  encoding='utf-8') as fp:
+            speeches = set(json.load(fp))
+
+        return model, dictionary, phrases, speeches
+
+    def load_corpus(self, year) -> tuple[list, list[int]]:
+        """
+        Load the corpus the persisted model of a year was trained on.
+
+        Returns:
+            tuple: The bag-of-words corpus and the faction
+            of each of its documents.
+        """
+        corpus = list(MmCorpus(self.path(year, 'corpus.mm')))
+        with open(self.path(year, 'parties.json'), 'r',
+                  encoding='utf-8') as fp:
+            parties = json.load(fp)
+        return corpus, parties
@@ -0,0 +1,73 @@
+"""
+Title: spacy_models.py
+
+Description:
+    This file contains a process-wide registry
+    of spaCy pipelines, shared by the TopicModel
+    and the Topic class, so that each pipeline
+    is loaded at most once per process.
+
+Usage:
+    Get a pipeline using load_model. Tests can
+    inject a small pipeline using register_model
+    and reset the registry using clear_models.
+"""
+
+from typing import Callable
+
+import spacy
+from spacy.language import Language
+
+from src.tokenize_column import EXCLUDED_COMPONENTS
+
+# the pipeline used for tagging speeches and naming topics
+DEFAULT_MODEL = 'de_core_news_lg'
+
+# loaded pipelines by model name and excluded components
+_models: dict[tuple[str, tuple[str, ...]], Language] = {}
+
+# the function loading a pipeline that is not registered yet
+_loader: Callable[..., Language] = spacy.load
+
+
+def _key(name: str, exclude: list[str]) -> tuple[str, tuple[str, ...]]:
+    return name, tuple(sorted(exclude))
+
+
+def load_model(
+        name: str = DEFAULT_MODEL,
+        exclude: list[str] = EXCLUDED_COMPONENTS
+) -> Language:
+    """
+    Get a spaCy pipeline, loading it on first use.
+
+    Args:
+        name: The name of the spaCy model.
+        exclude: The pipeline components that are not loaded.
+
+    Returns:
+        Language: The shared pipeline.
+    """
+    key = _key(name, exclude)
+    if key not in _models:
+        _models[key] = _loader(name, exclude=list(exclude))
+    return _models[key]
+
+
+def register_model(
+        nlp: Language,
+        name: str = DEFAULT_MODEL,
+        exclude: list[str] = EXCLUDED_COMPONENTS
+) -> None:
+    """
+    Register a pipeline, e.g. a small test pipeline,
+    to be returned by load_model instead of loading the model.
+    """
+    _models[_key(name, exclude)] = nlp
+
+
+def clear_models() -> None:
+    """
+    Remove all pipelines from the registry.
+    """
+    _models.clear()
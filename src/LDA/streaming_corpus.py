@@ -0,0 +1,85 @@
+"""
+Title: streaming_corpus.py
+
+Description:
+    This file contains the functions used to stream
+    the corpus of a topic model from disk. The lemmas
+    of the speeches are written once to a token file,
+    which is iterated lazily to train the vocabulary,
+    and the bag-of-words corpus is serialized in the
+    Matrix Market format, so that only one document
+    is held in memory at a time.
+
+Usage:
+    Pass a directory to the TopicModel using the
+    corpus_dir parameter, or run\n
+    python -m src.LDA.lda_model --corpus-dir data/lda_corpus
+"""
+
+import os
+from typing import Iterable, Iterator
+
+from gensim.corpora import MmCorpus
+
+from src.LDA.vocabulary import Vocabulary
+
+
+class TokenFile:
+    """
+    A file with the tokens of one document per line,
+    separated by spaces, that can be iterated repeatedly.
+    """
+
+    def __init__(self, path: str) -> None:
+        self.path = path
+
+    @classmethod
+    def write(cls, path: str, texts: Iterable[list[str]]) -> 'TokenFile':
+        """
+        Write the tokens of a sequence of documents to a file.
+        """
+        with open(path, 'w', encoding='utf-8') as fp:
+            for tokens in texts:
+                fp.write(' '.join(tokens) + '\n')
+        return cls(path)
+
+    def __iter__(self) -> Iterator[list[str]]:
+        with open(self.path, 'r', encoding='utf-8') as fp:
+            for line in fp:
+                yield line.split()
+
+
+def stream_corpus(
+        texts: Iterable[list[str]],
+        directory: str,
+        use_bigrams: bool = True,
+        min_frequency: int = None,
+        vocabulary: Vocabulary = None
+) -> tuple[Vocabulary, MmCorpus]:
+    """
+    Build the vocabulary and the bag-of-words corpus of
+    a sequence of documents, streaming them from disk.
+
+    Args:
+        texts: The lemmas of each document, consumed once.
+        directory: The directory of the token and corpus files.
+        use_bigrams: Whether to apply a bigram model.
+        min_frequency: Minimum number of documents a word
+        has to appear in.
+        vocabulary: A trained vocabulary that is applied to the
+        documents, or None to train one on them.
+
+    Returns:
+        tuple: The vocabulary and the serialized corpus.
+    """
+    os.makedirs(directory, exist_ok=True)
+    tokens = TokenFile.write(os.path.join(directory, 'tokens.txt'), texts)
+
+    if vocabulary is None:
+        vocabulary = Vocabulary.build(tokens, use_bigrams, min_frequency)
+
+    corpus_path = os.path.join(directory, 'corpus.mm')
+    MmCorpus.serialize(corpus_path,
+                       (vocabulary.doc2bow(text) for text in tokens))
+
+    return vocabulary, MmCorpus(corpus_path)
@@ -19,16 +19,158 @@ Usage:
     Pass a list of extracted keywords to the class.
     Then the name property will contain the topic name,
     that was classified using SpaCy vectors.
+    To name many topics at once, pass their keyword
+    lists to name_topics.
 """
 
+import hashlib
 import json
+import os
 from typing import Optional, Literal
 
 import numpy as np
-import spacy
-from sklearn.metrics.pairwise import cosine_similarity
+from spacy.language import Language
 
 from src.LDA.exceptions import *
+from src.LDA.spacy_models import load_model
+from src.LDA.word_vectors import WordVectors, as_vectors
+
+
+TOPIC_KEYWORDS = 'src/LDA/topic_keywords.json'
+
+# centroid matrices by keyword file and vector model
+_centroids: dict[tuple[str, str], 'TopicCentroids'] = {}
+
+
+def average_vector(lemmata, nlp_model: WordVectors):
+    """
+    Average the vectors of all lemmas that have a vector,
+    or return None if none of them has one. The vectors are
+    looked up in a spaCy pipeline or a vector backend.
+    """
+    backend = as_vectors(nlp_model)
+    vectors = []
+    for lemma in lemmata:
+        vector = backend.get(lemma)
+        if vector is not None:
+            vectors.append(vector)
+    if vectors:
+        return np.mean(vectors, axis=0)
+    else:
+        return None
+
+
+class TopicCentroids:
+    """
+    The normalized average vectors of the keyword lists
+    of all topic categories, stacked into one matrix,
+    so that any number of topics can be scored against
+    all categories with a single matrix multiplication.
+    """
+
+    def __init__(self, names: list[str], matrix: np.ndarray) -> None:
+        self.names = names
+        self.matrix = matrix / np.linalg.norm(matrix, axis=1, keepdims=True)
+
+    @classmethod
+    def from_keywords(
+            cls,
+            vectors: WordVectors,
+            keywords_path: str = TOPIC_KEYWORDS,
+            cache_dir: str = None
+    ) -> 'TopicCentroids':
+        """
+        Compute the centroids of the categories in a keyword file.
+        With a cache directory, the centroids are stored in a file
+        keyed by the hash of the keyword file and the vector model,
+        and loaded from it on later runs.
+        """
+        vectors = as_vectors(vectors)
+        with open(keywords_path, 'rb') as fp:
+            content = fp.read()
+
+        cache_path = None
+        if cache_dir:
+            digest = hashlib.sha256(
+                content + vectors.model_id.encode('utf-8')).hexdigest()
+            cache_path = os.path.join(cache_dir, f'centroids_{digest}.npz')
+            if os.path.exists(cache_path):
+                cached = np.load(cache_path)
+                return cls(cached['names'].tolist(), cached['matrix'])
+
+        names, topic_vectors = [], []
+        for topic, lemma_list in json.loads(content)['topics'].items():
+            topic_vector = average_vector(lemma_list, vectors)
+            if topic_vector is not None:
+                names.append(topic)
+                topic_vectors.append(topic_vector)
+
+        if not topic_vectors:
+            raise NoTopicsFoundError
+
+        centroids = cls(names, np.stack(topic_vectors))
+
+        if cache_path:
+            os.makedirs(cache_dir, exist_ok=True)
+            np.savez(cache_path, names=np.array(names),
+                     matrix=centroids.matrix)
+
+        return centroids
+
+    def classify(self, vectors: np.ndarray) -> list[str]:
+        """
+        Name each row of a matrix of topic vectors after the category
+        with the highest cosine similarity.
+        """
+        norms = np.linalg.norm(vectors, axis=1, keepdims=True)
+        similarities = (vectors / norms) @ self.matrix.T
+        return [self.names[i] for i in np.argmax(similarities, axis=1)]
+
+
+def get_centroids(
+        vectors: WordVectors,
+        keywords_path: str = TOPIC_KEYWORDS,
+        cache_dir: str = None
+) -> TopicCentroids:
+    """
+    Get the category centroids for a keyword file and vector model,
+    computing them only once per process.
+    """
+    vectors = as_vectors(vectors)
+    key = (os.path.abspath(keywords_path), vectors.model_id)
+    if key not in _centroids:
+        _centroids[key] = TopicCentroids.from_keywords(
+            vectors, keywords_path, cache_dir)
+    return _centroids[key]
+
+
+def name_topics(
+        word_lists: list[list[str]],
+        engine: Literal["list"] = "list",
+        vectors: WordVectors = None,
+        cache_dir: str = None
+) -> list[str]:
+    """
+    Name a batch of topics, given their salient words, scoring
+    all topics against all categories at once. The word vectors
+    are taken from a spaCy pipeline or an exported vector table,
+    by default from the shared de_core_news_lg pipeline.
+
+    Raises:
+        MissingVectorError: If none of the words of a topic
+        has a vector.
+    """
+    if not word_lists:
+        return []
+
+    vectors = as_vectors(load_model() if vectors is None else vectors)
+    centroids = get_centroids(vectors, cache_dir=cache_dir)
+
+    topic_vectors = [average_vector(words, vectors) for words in word_lists]
+    if any(vector is None for vector in topic_vectors):
+        raise MissingVectorError
+
+    return centroids.classify(np.stack(topic_vectors))
 
 
 class Topic:
@@ -38,11 +180,13 @@ class Topic:
             salient_words: list[str],
             used_topics: list[str] = None,
             engine: Literal["list"] = "list",
+            nlp: Language = None
     ) -> None:
         self.salient_words = salient_words
         self.engine = engine
         self.used_topics = used_topics
-        self.nlp = spacy.load('de_core_news_lg')
+        # the pipeline is shared by all topics
+        self.nlp = nlp or load_model()
 
     @property
     def name(self) -> Optional[str]:
@@ -50,42 +194,7 @@ class Topic:
 
     @staticmethod
     def average_vector(lemmata, nlp_model):
-        vectors = []
-        for lemma in lemmata:
-            token = nlp_model.vocab[lemma]
-            if token.has_vector:
-                vectors.append(token.vector)
-        if vectors:
-            return np.mean(vectors, axis=0)
-        else:
-            return None
+        return average_vector(lemmata, nlp_model)
 
     def topic_classifier_list_based(self) -> Optional[str]:
-        with open('src/LDA/topic_keywords.json', 'r', encoding='utf-8') as fp:
-            data = json.load(fp)
-        topics = data['topics']
-        extracted_vector = self.average_vector(self.salient_words, self.nlp)
-
-        if extracted_vector is not None:
-            # Compute cosine similarity
-            # between extracted vector and topic vectors
-            topic_similarities = {}
-            for topic, lemma_list in topics.items():
-                topic_vector = self.average_vector(lemma_list, self.nlp)
-                if topic_vector is not None:
-                    similarity = cosine_similarity(
-                        [extracted_vector], [topic_vector]
-                    )[0][0]
-                    topic_similarities[topic] = similarity
-
-            # Determine the topic with the highest similarity
-            if topic_similarities:
-                max_similarity_topic = max(
-                    topic_similarities,
-                    key=topic_similarities.get
-                )
-                return max_similarity_topic
-            else:
-                NoTopicsFoundError
-        else:
-            raise MissingVectorError
+        return name_topics([self.salient_words], self.engine, self.nlp)[0]
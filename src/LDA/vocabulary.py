@@ -0,0 +1,124 @@
+"""
+Title: vocabulary.py
+
+Description:
+    This file contains the Vocabulary class, which
+    holds the frozen bigram model and the dictionary
+    the speeches are mapped to bag-of-words vectors
+    with. A vocabulary can be trained on the speeches
+    of a single year, or once on the whole corpus and
+    persisted, so that every year is modelled with the
+    same phrases and words.
+
+Usage:
+    Pass a directory to the TopicModel using the
+    vocabulary_dir parameter, or run\n
+    python -m src.LDA.lda_model --vocabulary-dir data/lda_vocabulary
+    The vocabulary is trained on the first run and
+    loaded by later runs, delete the directory to retrain it.
+"""
+
+import os
+from typing import Iterable
+
+from gensim.corpora import Dictionary
+from gensim.models.phrases import FrozenPhrases, Phrases
+
+
+class Vocabulary:
+    """
+    A frozen bigram model and a dictionary
+    with document-frequency pruning.
+    """
+
+    def __init__(
+            self,
+            dictionary: Dictionary,
+            phrases: FrozenPhrases = None
+    ) -> None:
+        self.dictionary = dictionary
+        self.phrases = phrases
+
+    @classmethod
+    def build(
+            cls,
+            texts: Iterable[list[str]],
+            use_bigrams: bool = True,
+            no_below: int = None,
+            no_above: float = 0.5,
+            keep_n: int = 100000
+    ) -> 'Vocabulary':
+        """
+        Train the bigram model and the dictionary of a corpus.
+
+        Args:
+            texts: The lemmas of each document. The documents are
+            iterated once, or twice when bigrams are used, so they can
+            be streamed from a file.
+            use_bigrams: Whether to apply a bigram model.
+            no_below: Minimum number of documents a word has to
+            appear in, or None to keep all words.
+            no_above: Maximum fraction of documents a word may appear in.
+            keep_n: Maximum number of words that are kept.
+
+        Returns:
+            Vocabulary: The trained vocabulary.
+        """
+        phrases = None
+        if use_bigrams:  # apply bigram model
+            phrases = Phrases(texts).freeze()
+
+        vocabulary = cls(Dictionary(), phrases)
+        vocabulary.dictionary.add_documents(
+            vocabulary.apply(text) for text in texts)
+
+        # Filter out words that appear in less than no_below documents
+        if no_below:
+            vocabulary.dictionary.filter_extremes(
+                no_below=no_below, no_above=no_above, keep_n=keep_n)
+        return vocabulary
+
+    @staticmethod
+    def exists(directory: str) -> bool:
+        """
+        Check whether a vocabulary was persisted in a directory.
+        """
+        return os.path.exists(os.path.join(directory, 'dictionary'))
+
+    @classmethod
+    def load(cls, directory: str) -> 'Vocabulary':
+        """
+        Load a persisted vocabulary.
+        """
+        phrases = None
+        phrases_path = os.path.join(directory, 'phrases')
+        if os.path.exists(phrases_path):
+            phrases = FrozenPhrases.load(phrases_path)
+        return cls(Dictionary.load(os.path.join(directory, 'dictionary')),
+                   phrases)
+
+    def save(self, directory: str) -> None:
+        """
+        Persist the vocabulary in a directory.
+        """
+        os.makedirs(directory, exist_ok=True)
+        phrases_path = os.path.join(directory, 'phrases')
+        if self.phrases is not None:
+            self.phrases.save(phrases_path)
+        elif os.path.exists(phrases_path):
+            os.remove(phrases_path)
+
+        # written last, so that the vocabulary only exists once complete
+        self.dictionary.save(os.path.join(directory, 'dictionary'))
+
+    def apply(self, tokens: list[str]) -> list[str]:
+        """
+        Join the bigrams of a document.
+        """
+        return self.phrases[tokens] if self.phrases else tokens
+
+    def doc2bow(self, tokens: list[str]) -> list[tuple[int, int]]:
+        """
+        Map a document to its bag-of-words vector.
+        """
+        return self.dictionary.doc2bow(self.apply(tokens))
@@ -0,0 +1,186 @@
+"""
+Title: word_vectors.py
+
+Description:
+    This file contains the word vector backends
+    used for naming topics. SpacyVectors looks up
+    vectors in a loaded spaCy pipeline, MemmapVectors
+    in a vector table exported to NumPy files, which
+    is memory-mapped instead of loading the pipeline,
+    so that several processes share one page-cached
+    copy of the table.
+
+Usage:
+    Export the vectors of a spaCy model using\n
+    python -m src.LDA.word_vectors --output data/vectors/de_core_news_lg
+    and pass the output prefix to the topic model using\n
+    python -m src.LDA.lda_model --vectors data/vectors/de_core_news_lg
+"""
+
+import argparse
+import json
+import os
+from typing import Optional
+
+import numpy as np
+from spacy.language import Language
+
+from src.LDA.spacy_models import load_model
+
+
+def model_id(nlp: Language) -> str:
+    """
+    Identify the vectors of a spaCy pipeline by model name and version.
+    """
+    return f"{nlp.meta['lang']}_{nlp.meta['name']}-{nlp.meta['version']}"
+
+
+class SpacyVectors:
+    """
+    Look up word vectors in the vocabulary of a spaCy pipeline.
+    """
+
+    def __init__(self, nlp: Language) -> None:
+        self.nlp = nlp
+        self.model_id = model_id(nlp)
+
+    def get(self, word: str) -> Optional[np.ndarray]:
+        """
+        Get the vector of a word, or None if it has no vector.
+        """
+        lexeme = self.nlp.vocab[word]
+        if lexeme.has_vector:
+            return lexeme.vector
+        return None
+
+
+class MemmapVectors:
+    """
+    Look up word vectors in a table exported by export_vectors.
+
+    The vectors, the sorted keys and their rows are memory-mapped,
+    so opening the table reads nothing but a small metadata file,
+    and only the pages of the looked up words are loaded.
+    """
+
+    def __init__(self, prefix: str) -> None:
+        """
+        Open an exported vector table.
+
+        Args:
+            prefix: The path prefix of the exported files.
+        """
+        self.vectors = np.load(f'{prefix}.npy', mmap_mode='r')
+        self.keys = np.load(f'{prefix}.keys.npy', mmap_mode='r')
+        self.rows = np.load(f'{prefix}.rows.npy', mmap_mode='r')
+        with open(f'{prefix}.json', 'r', encoding='utf-8') as fp:
+            self.model_id = json.load(fp)['model']
+
+        # longer words would be truncated when compared with the keys
+        self.max_length = self.keys.dtype.itemsize // 4
+
+    def get(self, word: str) -> Optional[np.ndarray]:
+        """
+        Get the vector of a word, or None if it has no vector.
+        """
+        if not word or len(word) > self.max_length:
+            return None
+        i = np.searchsorted(self.keys, word)
+        if i < len(self.keys) and self.keys[i] == word:
+            return np.asarray(self.vectors[self.rows[i]])
+        return None
+
+
+# a spaCy pipeline or one of the vector backends
+WordVectors = Language | SpacyVectors | MemmapVectors
+
+
+def as_vectors(vectors: WordVectors) -> SpacyVectors | MemmapVectors:
+    """
+    Wrap a spaCy pipeline into a vector backend.
+    """
+    if isinstance(vectors, Language):
+        return SpacyVectors(vectors)
+    return vectors
+
+
+def export_vectors(
+        nlp: Language,
+        prefix: str,
+        words: list[str] = None
+) -> int:
+    """
+    Export the word vectors of a spaCy pipeline to NumPy files:
+    the vector table `{prefix}.npy`, the sorted keys
+    `{prefix}.keys.npy` with their rows `{prefix}.rows.npy`,
+    and the model name and version in `{prefix}.json`.
+
+    Args:
+        nlp: The spaCy pipeline containing the vectors.
+        prefix: The path prefix of the exported files.
+        words: The words to export, or None to export all vectors.
+
+    Returns:
+        int: The number of exported keys.
+    """
+    table = nlp.vocab.vectors
+
+    if words is None:
+        keys = []
+        rows = []
+        for key, row in table.key2row.items():
+            if key in nlp.vocab.strings:
+                keys.append(nlp.vocab.strings[key])
+                rows.append(row)
+        vectors = np.asarray(table.data)
+    else:
+        lookup = SpacyVectors(nlp)
+        found = {word: lookup.get(word) for word in set(words)}
+        keys = sorted(word for word, vector in found.items()
+                      if vector is not None)
+        rows = list(range(len(keys)))
+        vectors = np.stack([found[word] for word in keys]) if keys \
+            else np.zeros((0, table.shape[1]), dtype='float32')
+
+    order = np.argsort(np.array(keys, dtype=str), kind='stable')
+    sorted_keys = np.array(keys, dtype=str)[order]
+    sorted_rows = np.array(rows, dtype=np.int64)[order]
+
+    directory = os.path.dirname(prefix)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+
+    np.save(f'{prefix}.npy', vectors.astype('float32', copy=False))
+    np.save(f'{prefix}.keys.npy', sorted_keys)
+    np.save(f'{prefix}.rows.npy', sorted_rows)
+    with open(f'{prefix}.json', 'w', encoding='utf-8') as fp:
+        json.dump({'model': model_id(nlp)}, fp)
+
+    return len(sorted_keys)
+
+
+def main(args):
+    """
+    Export the vectors of a spaCy model.
+    """
+    words = None
+    if args.words:
+        with open(args.words, 'r', encoding='utf-8') as fp:
+            words = [line.strip() for line in fp if line.strip()]
+
+    nlp = load_model(args.model)
+    n_keys = export_vectors(nlp, args.output, words)
+    print(f'exported {n_keys} vectors to {args.output}.npy')
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument('-m', '--model', default='de_core_news_lg',
+                        type=str)
+    parser.add_argument('-output', '--output',
+                        default='data/vectors/de_core_news_lg', type=str)
+    parser.add_argument('-words', '--words', default=None, type=str)
+
+    args = parser.parse_args()
+
+    main(args)
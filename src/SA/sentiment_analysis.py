@@ -29,6 +29,9 @@ import polars as pl
 from nltk.sentiment.vader import SentimentIntensityAnalyzer
 from transformers import pipeline
 
+from src.speeches_io import (PARTITION_COLUMNS, collect, scan_speeches,
+                             write_speeches)
+
 nltk.download('vader_lexicon')
 
 logger = logging.getLogger(__name__)
@@ -112,6 +115,14 @@ def main():
         help="The sentiment analyzer to be used"
     )
 
+    parser.add_argument(
+        "-c",
+        "--column",
+        type=str,
+        default="speechContent",
+        help="The column containing the speech content"
+    )
+
     parser.add_argument(
         "-o",
         "--output",
@@ -120,19 +131,28 @@ def main():
         help="The output file path"
     )
 
+    parser.add_argument(
+        "--partition-by",
+        nargs="+",
+        choices=PARTITION_COLUMNS,
+        default=None,
+        help="Write the output as a dataset directory partitioned "
+             "by these columns"
+    )
+
     args = parser.parse_args()
 
-    speeches = pl.read_parquet(args.speeches)
+    speeches = collect(scan_speeches(args.speeches))
 
     sentiment_analyzer = SentimentAnalysis(analyzer=args.analyzer)
 
     speeches = speeches.with_columns(
-        pl.col("speechContent").map_elements(
+        pl.col(args.column).map_elements(
             sentiment_analyzer.compute_sentiment,
             return_dtype=pl.Float64).alias("sentiment")
     )
 
-    speeches.write_parquet(args.output)
+    write_speeches(speeches, args.output, args.partition_by)
 
 
 if __name__ == '__main__':
@@ -27,6 +27,8 @@ import logging
 
 import polars as pl
 
+from src.speeches_io import scan_speeches, with_date_columns
+
 logger = logging.getLogger(__name__)
 
 """
@@ -44,9 +46,9 @@ pl.DataFrame: DataFrame containing dates and sentiment scores.
 def analyze_sentiment_before_election(speeches_path: str,
                                       election_path: str,
                                       output_path: str) -> None:
-    speeches = pl.read_parquet(speeches_path)
-    speeches = (speeches.with_columns(pl.col("date").str.strptime(pl.Date, format="%Y-%m-%d")
-                                      .map_elements(lambda x: x.year, return_dtype=pl.Int64).alias("year")))
+    # Speeches are scanned lazily, so that only the years before an
+    # election are read from a partitioned dataset
+    speeches = with_date_columns(scan_speeches(speeches_path))
 
     election = pl.read_csv(election_path)
 
@@ -60,13 +62,14 @@ def analyze_sentiment_before_election(speeches_path: str,
     for row in election.iter_rows(named=True):
         election_date = row["electionDate"]
         election_year = election_date.year
-        year_before_election = str(election_year - 1)
+        year_before_election = election_year - 1
 
         sentiment_before_election = (sentiment_before_election
-                                     .vstack(speeches.filter(speeches["year"] == year_before_election)
-                                             .groupby("year")
+                                     .vstack(speeches.filter(pl.col("year") == year_before_election)
+                                             .group_by("year")
                                              .agg(pl.mean("sentiment"))
-                                             .select(["year", "sentiment"])))
+                                             .select(["year", "sentiment"])
+                                             .collect()))
 
     sentiment_before_election.write_csv(output_path)
     logger.info(f'Saved sentiment before election to {output_path}')
@@ -28,6 +28,7 @@ import logging
 import polars as pl
 
 from sentiment_analysis import SentimentAnalysis
+from src.speeches_io import scan_speeches
 
 logger = logging.getLogger(__name__)
 
@@ -45,14 +46,15 @@ def analyze_sentiment_by_gender(speeches_path: str,
         Returns:
         pl.DataFrame: DataFrame containing average sentiment scores by gender.
         """
-    speeches = pl.read_parquet(speeches_path)
+    speeches = scan_speeches(speeches_path)
 
     sentiment_analyzer = SentimentAnalysis(analyzer='nltk')
 
-    sentiment_by_gender = (speeches.filter(speeches["gender"] != "NA")
+    sentiment_by_gender = (speeches.filter(pl.col("gender") != "NA")
                            .group_by("gender")
                            .agg(pl.mean("sentiment")
-                                .alias("avg_sentiment")))
+                                .alias("avg_sentiment"))
+                           .collect())
 
     sentiment_by_gender.write_csv(output_path)
     logger.info(f'Saved sentiment by gender to {output_path}')
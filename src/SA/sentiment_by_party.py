@@ -27,6 +27,8 @@ import logging
 
 import polars as pl
 
+from src.speeches_io import scan_speeches
+
 # from sentiment_analysis import SentimentAnalysis
 
 logger = logging.getLogger(__name__)
@@ -45,10 +47,11 @@ def analyze_sentiment_by_party(speeches_path: str,
         Returns:
         pl.DataFrame: DataFrame containing average sentiment scores by party.
         """
-    speeches = pl.read_parquet(speeches_path)
+    speeches = scan_speeches(speeches_path)
     sentiment_by_party = (speeches.group_by("factionId")
                           .agg(pl.mean("sentiment")
-                               .alias("avg_sentiment")))
+                               .alias("avg_sentiment"))
+                          .collect())
 
     sentiment_by_party.write_csv(output_path)
     logger.info(f'Saved sentiment by party to {output_path}')
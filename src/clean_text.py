@@ -2,28 +2,45 @@ import argparse
 
 import polars as pl
 
+from src.speeches_io import PARTITION_COLUMNS, scan_speeches, write_speeches
 
-def clean_text(speeches: pl.DataFrame, column: str) -> pl.DataFrame:
+
+def clean_text_expr(column: str) -> pl.Expr:
+    """
+    Build the expression that cleans the text in a specified column.
+
+    Args:
+        column (str): The name of the column that contains the text
+        to clean.
+
+    Returns:
+        pl.Expr: An expression removing occurrences of '\n{..}' and
+        '({..})' and replacing '\n' with a space.
+    """
+    # Remove all occurrences of '\n', '\n{..}', and '({..})'
+    return (pl.col(column)
+            .str.replace_all(r'\n\{.*?}', '')
+            .str.replace_all(r'\(\{.*?\}\)', '')
+            .str.replace_all(r'\n', ' '))
+
+
+def clean_text(speeches: pl.DataFrame | pl.LazyFrame, column: str) \
+        -> pl.DataFrame | pl.LazyFrame:
     """
     Clean the text in a specified column of a DataFrame containing speeches.
 
     Args:
-        speeches (pl.DataFrame): A DataFrame containing speeches or text data.
+        speeches (pl.DataFrame | pl.LazyFrame): A DataFrame or LazyFrame
+        containing speeches or text data.
         column (str): The name of the column in `speeches` that contains
         the text to clean.
 
     Returns:
-        pl.DataFrame: A new DataFrame with the specified column's text cleaned
-        by removing
-                     occurrences of '\n', '\n{..}', and '({..})'.
+        pl.DataFrame | pl.LazyFrame: A new DataFrame, or a LazyFrame for
+        lazy input, with the specified column's text cleaned by removing
+        occurrences of '\n', '\n{..}', and '({..})'.
     """
-    # Remove all occurrences of '\n', '\n{..}', and '({..})'
-    text = speeches.with_columns(
-        pl.col(column)
-        .str.replace_all(r'\n\{.*?}', '')
-        .str.replace_all(r'\(\{.*?\}\)', '')
-        .str.replace_all(r'\n', ' ')
-    )
+    text = speeches.with_columns(clean_text_expr(column))
 
     text.filter(pl.col(column).is_not_null())
 
@@ -56,13 +73,21 @@ def main():
         help="The output file path for the cleaned speech list"
     )
 
+    parser.add_argument(
+        "--partition-by",
+        nargs="+",
+        choices=PARTITION_COLUMNS,
+        default=None,
+        help="Write the output as a dataset directory partitioned "
+             "by these columns"
+    )
+
     args = parser.parse_args()
 
-    cleaned_speeches = clean_text(pl.read_parquet(args.speech),
-                                  args.column)
+    cleaned_speeches = clean_text(scan_speeches(args.speech), args.column)
 
-    # Write the DataFrame to a Parquet file
-    cleaned_speeches.write_parquet(args.output)
+    # Stream the query result to a Parquet file
+    write_speeches(cleaned_speeches, args.output, args.partition_by)
 
     print(f"Cleaned speeches have been written to {args.output}")
 
@@ -0,0 +1,232 @@
+import argparse
+import os
+
+import polars as pl
+
+from src.speeches_io import (collect, is_partitioned, scan_speeches,
+                             with_date_columns)
+
+# Columns of the statistics table, one row per year and faction
+STATISTICS_SCHEMA = {
+    "year": pl.Int64,
+    "factionId": pl.Int64,
+    "speeches": pl.Int64,
+    "words": pl.Int64,
+    "tokens": pl.Int64,
+}
+
+
+def statistics_path(speeches_path: str) -> str:
+    """
+    Get the path of the statistics sidecar of a speeches Parquet file
+    or dataset, e.g. `speeches.parquet.statistics.parquet`.
+    """
+    return f"{speeches_path.rstrip(os.sep)}.statistics.parquet"
+
+
+def _modified(path: str) -> float:
+    """
+    Get the last modification time of a file, or of the newest
+    file of a dataset directory.
+    """
+    if not is_partitioned(path):
+        return os.path.getmtime(path)
+    return max((os.path.getmtime(os.path.join(root, name))
+                for root, _, names in os.walk(path) for name in names),
+               default=os.path.getmtime(path))
+
+
+class CorpusStatistics:
+    """
+    The number of speeches, words and tokens per year and faction.
+    """
+
+    def __init__(self, table: pl.DataFrame) -> None:
+        """
+        Initialize the CorpusStatistics object.
+
+        Args:
+            table (pl.DataFrame): The counts of each year and faction,
+            with the columns of STATISTICS_SCHEMA.
+        """
+        self.table = table
+
+    @classmethod
+    def compute(cls,
+                speeches: pl.DataFrame | pl.LazyFrame,
+                tokens_column: str = None) -> "CorpusStatistics":
+        """
+        Count the speeches, words and tokens of each year and faction
+        in a single pass over the speeches.
+
+        Args:
+            speeches (pl.DataFrame | pl.LazyFrame): The speeches table.
+            tokens_column (str): A list column of tokens, or None if
+            the speeches are not tokenized.
+
+        Returns:
+            CorpusStatistics: The statistics of the speeches.
+        """
+        if tokens_column:
+            tokens = pl.col(tokens_column).list.len().sum()
+        else:
+            tokens = pl.lit(None)
+
+        table = (with_date_columns(speeches.lazy())
+                 .group_by("year", "factionId")
+                 .agg(pl.len().alias("speeches"),
+                      pl.col("speechContent").str.count_matches(r"\S+")
+                      .sum().alias("words"),
+                      tokens.alias("tokens"))
+                 .select([pl.col(column).cast(dtype)
+                          for column, dtype in STATISTICS_SCHEMA.items()])
+                 .sort("year", "factionId"))
+        return cls(collect(table))
+
+    @classmethod
+    def read(cls, path: str) -> "CorpusStatistics":
+        """
+        Read the statistics from a Parquet file.
+        """
+        return cls(pl.read_parquet(path))
+
+    def save(self, path: str) -> None:
+        """
+        Write the statistics to a Parquet file.
+        """
+        self.table.write_parquet(path)
+
+    @classmethod
+    def for_dataset(cls,
+                    speeches: pl.DataFrame | pl.LazyFrame,
+                    path: str = None,
+                    speeches_path: str = None,
+                    tokens_column: str = None) -> "CorpusStatistics":
+        """
+        Read the statistics from a sidecar Parquet file, or compute
+        them and write the sidecar. The sidecar is recomputed if it is
+        older than the speeches file it was computed from, or if tokens
+        are requested but the sidecar was computed without them.
+
+        Args:
+            speeches (pl.DataFrame | pl.LazyFrame): The speeches table.
+            path (str): The path to the sidecar, or None to compute
+            the statistics without persisting them.
+            speeches_path (str): The path to the speeches Parquet file
+            or dataset, used to detect a stale sidecar.
+            tokens_column (str): A list column of tokens, or None if
+            the speeches are not tokenized.
+
+        Returns:
+            CorpusStatistics: The statistics of the speeches.
+        """
+        if path and os.path.exists(path) and (
+                not speeches_path
+                or os.path.getmtime(path) >= _modified(speeches_path)):
+            statistics = cls.read(path)
+            if not tokens_column or statistics.token_count is not None:
+                return statistics
+
+        statistics = cls.compute(speeches, tokens_column)
+        if path:
+            statistics.save(path)
+        return statistics
+
+    @property
+    def years(self) -> list[int]:
+        """
+        The sorted years of the speeches.
+        """
+        return self.table["year"].unique().sort().to_list()
+
+    @property
+    def speech_count(self) -> int:
+        """
+        The number of speeches.
+        """
+        return int(self.table["speeches"].sum())
+
+    @property
+    def word_count(self) -> int:
+        """
+        The number of whitespace separated words of the speeches.
+        """
+        return int(self.table["words"].sum())
+
+    @property
+    def token_count(self) -> int | None:
+        """
+        The number of tokens of the speeches,
+        or None if they are not tokenized.
+        """
+        if self.table["tokens"].null_count() == self.table.height:
+            return None
+        return int(self.table["tokens"].sum())
+
+    @property
+    def party_count(self) -> int:
+        """
+        The number of factions of the speeches.
+        """
+        return self.table["factionId"].n_unique()
+
+    def by_year(self) -> pl.DataFrame:
+        """
+        The number of speeches, words, tokens and factions of each year.
+        """
+        return (self.table
+                .group_by("year")
+                .agg(pl.col("speeches", "words", "tokens").sum(),
+                     pl.col("factionId").n_unique().alias("factions"))
+                .sort("year"))
+
+    def __str__(self) -> str:
+        tokens = self.token_count
+        return (f"{self.speech_count} speeches, {self.word_count} words, "
+                + (f"{tokens} tokens, " if tokens is not None else "")
+                + f"{self.party_count} factions and {len(self.years)} years")
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Count the speeches, words and tokens per year "
+                    "and faction"
+    )
+
+    parser.add_argument(
+        "speeches",
+        type=str,
+        help="The speeches Parquet file or dataset"
+    )
+
+    parser.add_argument(
+        "--tokens-column",
+        type=str,
+        default=None,
+        help="A list column of tokens"
+    )
+
+    parser.add_argument(
+        "-o",
+        "--output",
+        type=str,
+        default=None,
+        help="The path to the statistics sidecar, by default "
+             "next to the speeches"
+    )
+
+    args = parser.parse_args()
+
+    statistics = CorpusStatistics.for_dataset(
+        scan_speeches(args.speeches),
+        args.output or statistics_path(args.speeches),
+        args.speeches,
+        args.tokens_column)
+
+    with pl.Config(tbl_rows=-1):
+        print(statistics.by_year())
+    print(statistics)
+
+
+if __name__ == "__main__":
+    main()
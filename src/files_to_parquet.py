@@ -2,6 +2,93 @@ import argparse
 
 import polars as pl
 
+from src.speeches_io import (PARTITION_COLUMNS, with_date_columns,
+                             write_partitioned)
+
+# Columns of speeches.csv that are typed explicitly instead of being
+# inferred from the first rows of the file
+SPEECHES_SCHEMA = {
+    "date": pl.Date,
+    "factionId": pl.Int64,
+    "politicianId": pl.Int64,
+}
+
+COMPRESSION_CODECS = ["zstd", "lz4", "snappy", "gzip", "brotli",
+                      "uncompressed"]
+
+
+def convert_speeches(speeches: str,
+                     output: str,
+                     streaming: bool = False,
+                     compression: str = "zstd",
+                     compression_level: int = None,
+                     row_group_size: int = None,
+                     partition_by: list[str] = None) -> None:
+    """
+    Convert the speeches.csv file to a Parquet file, or to a hive-style
+    partitioned Parquet dataset if partition columns are given.
+    The typed year of each speech is added once at ingestion.
+
+    Args:
+        speeches (str): The path to the speeches.csv file.
+        output (str): The output file path for the Parquet file.
+        streaming (bool): Whether to stream the file in batches using
+        `scan_csv` and `sink_parquet` instead of loading it into memory.
+        compression (str): The compression codec of the Parquet file.
+        compression_level (int): The compression level of the codec,
+        or None for the codec's default.
+        row_group_size (int): The number of rows per row group,
+        or None for the Polars default.
+        partition_by (list[str]): The partition columns of the dataset,
+        or None to write a single Parquet file.
+    """
+    parquet_options = dict(compression=compression,
+                           compression_level=compression_level,
+                           row_group_size=row_group_size)
+
+    if streaming:
+        # The CSV is read in batches and written directly to the
+        # output file, so the corpus is never held in memory at once
+        df_speeches = with_date_columns(
+            pl.scan_csv(speeches, schema_overrides=SPEECHES_SCHEMA))
+
+        if partition_by:
+            # The CSV is converted once into a staging Parquet file
+            # holding the year, from which the partitions are written
+            write_partitioned(df_speeches, output, partition_by,
+                              **parquet_options)
+        else:
+            df_speeches.sink_parquet(output, **parquet_options)
+    else:
+        df_speeches = with_date_columns(
+            pl.read_csv(speeches, schema_overrides=SPEECHES_SCHEMA))
+
+        if partition_by:
+            write_partitioned(df_speeches, output, partition_by,
+                              **parquet_options)
+        else:
+            df_speeches.write_parquet(output, **parquet_options)
+
+
+def convert_table(table: str,
+                  output: str,
+                  compression: str = "zstd",
+                  compression_level: int = None) -> None:
+    """
+    Convert a tab separated file to a Parquet file.
+
+    Args:
+        table (str): The path to the .tab file.
+        output (str): The output file path for the Parquet file.
+        compression (str): The compression codec of the Parquet file.
+        compression_level (int): The compression level of the codec,
+        or None for the codec's default.
+    """
+    df_table = pl.read_csv(table, separator="\t")
+    df_table.write_parquet(output,
+                           compression=compression,
+                           compression_level=compression_level)
+
 
 def main():
     parser = argparse.ArgumentParser(
@@ -50,29 +137,64 @@ def main():
         help="The output file path for the factions dataframe"
     )
 
-    args = parser.parse_args()
+    parser.add_argument(
+        "--streaming",
+        action="store_true",
+        help="Stream the speeches file in batches instead of "
+             "loading it into memory"
+    )
 
-    # Read the .csv file
-    df_speeches = pl.read_csv(args.speeches)
+    parser.add_argument(
+        "--compression",
+        type=str,
+        choices=COMPRESSION_CODECS,
+        default="zstd",
+        help="The compression codec of the Parquet files"
+    )
 
-    # Write to a .parquet file
-    df_speeches.write_parquet(args.output1)
+    parser.add_argument(
+        "--compression-level",
+        type=int,
+        default=None,
+        help="The compression level of the codec"
+    )
 
-    print(f"Converted speeches file has been written to {args.output1}")
+    parser.add_argument(
+        "--row-group-size",
+        type=int,
+        default=None,
+        help="The number of rows per row group of the speeches file"
+    )
+
+    parser.add_argument(
+        "--partition-by",
+        nargs="+",
+        choices=PARTITION_COLUMNS,
+        default=None,
+        help="Write the speeches as a dataset directory partitioned "
+             "by these columns"
+    )
 
-    # Read the .tab file
-    df_politicians = pl.read_csv(args.politicians, separator="\t")
+    args = parser.parse_args()
 
-    # Write to a .parquet file
-    df_politicians.write_parquet(args.output2)
+    convert_speeches(args.speeches, args.output1,
+                     streaming=args.streaming,
+                     compression=args.compression,
+                     compression_level=args.compression_level,
+                     row_group_size=args.row_group_size,
+                     partition_by=args.partition_by)
 
-    print(f"Converted politicians file has been written to {args.output2}")
+    print(f"Converted speeches file has been written to {args.output1}")
 
-    # Read the .tab file
-    df_factions = pl.read_csv(args.factions, separator="\t")
+    convert_table(args.politicians, args.output2,
+                  compression=args.compression,
+                  compression_level=args.compression_level)
+
+    print(f"Converted politicians file has been written to {args.output2}")
 
-    # Write to a .parquet file
-    df_factions.write_parquet(args.output3)
+    convert_table(args.factions, args.output3,
+                  compression=args.compression,
+                  compression_level=args.compression_level)
 
     print(f"Converted factions file has been written to {args.output3}")
 
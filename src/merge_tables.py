@@ -2,25 +2,30 @@ import argparse
 
 import polars
 
+from src.speeches_io import PARTITION_COLUMNS, scan_speeches, write_speeches
 
-def merge_tables(table1_path, table2_path, foreign_key, data_columns, id_column, output_path):
+
+def merge_tables(table1_path, table2_path, foreign_key, data_columns, id_column, output_path,
+                 partition_by=None):
     """
     This method merges 1+ data columns from table 2 to table 1. It performs a left join.
+    Table 1 may also be a partitioned dataset directory.
     :param table1_path: file path to table 1
     :param table2_path: file path to table 2
     :param foreign_key: foreign key in table 1
     :param data_columns: columns of table 2 to be copied into table 1
     :param id_column: table 2 column that matches the foreign key of table 1
     :param output_path: output file path (.parquet)
+    :param partition_by: partition columns of the output dataset, or None to write a single file
     """
     # Load tables, only select the necessary rows in table 2
-    df1 = polars.scan_parquet(table1_path)
+    df1 = scan_speeches(table1_path)
     df2 = (polars.scan_parquet(table2_path)
            .select([id_column] + data_columns))
     # perform left join on table 1
     merged_table = df1.join(df2, left_on=foreign_key,
                             right_on=id_column, how='left')
-    merged_table.sink_parquet(output_path)
+    write_speeches(merged_table, output_path, partition_by)
 
 
 def main():
@@ -44,11 +49,15 @@ def main():
                         help='The name of the table 2 id column')
     parser.add_argument('-o', '--output', default='merged.parquet',
                         help='The name of the output file')
+    parser.add_argument('--partition-by', nargs='+', choices=PARTITION_COLUMNS,
+                        default=None,
+                        help='Write the output as a dataset directory '
+                             'partitioned by these columns')
 
     args = parser.parse_args()
 
     merge_tables(args.table1, args.table2, args.table1_foreign_key_column_name, args.data_columns,
-                 args.id, args.output)
+                 args.id, args.output, args.partition_by)
 
 
 if __name__ == '__main__':
@@ -3,16 +3,20 @@ import argparse
 import matplotlib.pyplot as plt
 import pandas as pd
 
+from src.speeches_io import scan_speeches, with_date_columns
+
 
 def load_data(input_file: str) -> pd.DataFrame:
-    """Load sentiment data from a CSV file."""
-    return pd.read_parquet(input_file)
+    """Load the columns needed for plotting from a Parquet file
+    or a partitioned Parquet dataset."""
+    speeches = with_date_columns(scan_speeches(input_file))
+    columns = [column for column in ('year', 'sentiment', 'gender')
+               if column in speeches.columns]
+    return speeches.select(columns).collect().to_pandas()
 
 
 def plot_average_sentiment(data: pd.DataFrame, output_file: str) -> None:
     """Plot average sentiment over time."""
-    data['date'] = pd.to_datetime(data['date'])
-    data['year'] = data['date'].dt.year
     yearly_sentiment = data.groupby('year')['sentiment'].mean()
 
     plt.figure(figsize=(10, 6))
@@ -28,8 +32,6 @@ def plot_average_sentiment(data: pd.DataFrame, output_file: str) -> None:
 
 def plot_sentiment_by_gender(data: pd.DataFrame, output_file: str) -> None:
     """Plot average sentiment over time by gender."""
-    data['date'] = pd.to_datetime(data['date'])
-    data['year'] = data['date'].dt.year
     yearly_sentiment_gender = (data.groupby(['year', 'gender'])['sentiment']
                                .mean()
                                .unstack())
@@ -0,0 +1,184 @@
+import argparse
+import tempfile
+
+import polars as pl
+
+from src.clean_text import clean_text
+from src.remove_punctuation import remove_punctuation
+from src.remove_stopwords import STOPWORD_ENGINES, remove_stopwords
+from src.remove_whitespaces import remove_whitespaces
+from src.speeches_io import PARTITION_COLUMNS, scan_speeches, write_speeches
+from src.stemming import STEMMING_MODES, TOKENIZERS, stemming
+
+# The preprocessing stages in the order in which they are applied,
+# named after the files written by the separate Snakefile rules
+STAGES = ["cleaned", "wo_sw", "wo_sw_ws", "stemmed", "stemmed_wo_punctuation"]
+
+
+def preprocess(stopwords: str,
+               speeches: pl.DataFrame | pl.LazyFrame,
+               column: str,
+               keep: list[str] = None,
+               stopword_engine: str = "regex",
+               stemming_mode: str = "apply",
+               workers: int = 1,
+               tokenizer: str = "nltk",
+               staging_dir: str = None) \
+        -> pl.DataFrame | pl.LazyFrame:
+    """
+    Apply all preprocessing stages to a column of a Polars DataFrame
+    or LazyFrame. The text is cleaned, stopwords and extra whitespaces
+    are removed, the words are stemmed and punctuation is removed.
+
+    Given a LazyFrame, the stages are composed into a single query plan,
+    so the corpus is read and written only once.
+
+    Args:
+        stopwords (str): The path to a file containing stopwords, with
+        one stopword per line.
+        speeches (pl.DataFrame | pl.LazyFrame): The speeches containing
+        the column to preprocess.
+        column (str): The name of the column containing the text.
+        keep (list[str]): Stages whose intermediate text should be kept
+        in an additional column named `{column}_{stage}`.
+        stopword_engine (str): The engine used to match stopwords,
+        either 'regex' or 'set'.
+        stemming_mode (str): The stemming mode, one of 'apply', 'cache'
+        or 'vocabulary'.
+        workers (int): The number of worker processes used for stemming.
+        tokenizer (str): The tokenizer used for stemming, either 'nltk'
+        or 'polars'.
+        staging_dir (str): A temporary directory in which the
+        'vocabulary' stemming mode stages the tokens of a LazyFrame.
+
+    Returns:
+        pl.DataFrame | pl.LazyFrame: The speeches with the preprocessed
+        text in `column` and the requested intermediate columns.
+    """
+    keep = keep or []
+
+    stages = {
+        "cleaned": lambda text: clean_text(text, column),
+        "wo_sw": lambda text: remove_stopwords(stopwords, text, column,
+                                               stopword_engine),
+        "wo_sw_ws": lambda text: remove_whitespaces(text, column),
+        "stemmed": lambda text: stemming(text, column, stemming_mode,
+                                         workers=workers,
+                                         tokenizer=tokenizer,
+                                         staging_dir=staging_dir),
+        "stemmed_wo_punctuation": lambda text: remove_punctuation(text,
+                                                                  column),
+    }
+
+    for stage in STAGES:
+        speeches = stages[stage](speeches)
+
+        if stage in keep:
+            speeches = speeches.with_columns(
+                pl.col(column).alias(f"{column}_{stage}")
+            )
+
+    return speeches
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Apply all preprocessing steps to a list of speeches "
+                    "in a single pass."
+    )
+
+    parser.add_argument(
+        "stopwords",
+        type=str,
+        help="A list of stopwords"
+    )
+
+    parser.add_argument(
+        "speech",
+        type=str,
+        help="A Dataframe of speech texts"
+    )
+
+    parser.add_argument(
+        "column",
+        type=str,
+        help="The column containing the speech content"
+    )
+
+    parser.add_argument(
+        "--keep",
+        nargs="+",
+        choices=STAGES[:-1],
+        default=None,
+        help="Intermediate stages to keep as additional columns"
+    )
+
+    parser.add_argument(
+        "--stopword-engine",
+        type=str,
+        choices=STOPWORD_ENGINES,
+        default="regex",
+        help="The engine used to match stopwords"
+    )
+
+    parser.add_argument(
+        "--stemming-mode",
+        type=str,
+        choices=STEMMING_MODES,
+        default="apply",
+        help="Whether to stem every token, memoize the stems in an "
+             "LRU cache or stem every token type once"
+    )
+
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=1,
+        help="The number of worker processes used for stemming"
+    )
+
+    parser.add_argument(
+        "--tokenizer",
+        type=str,
+        choices=TOKENIZERS,
+        default="nltk",
+        help="The tokenizer used for stemming"
+    )
+
+    parser.add_argument(
+        "--output",
+        type=str,
+        default="../data/preprocessed.parquet",
+        help="The output file path for the preprocessed speeches"
+    )
+
+    parser.add_argument(
+        "--partition-by",
+        nargs="+",
+        choices=PARTITION_COLUMNS,
+        default=None,
+        help="Write the output as a dataset directory partitioned "
+             "by these columns"
+    )
+
+    args = parser.parse_args()
+
+    # The staged tokens are removed once the output is written
+    with tempfile.TemporaryDirectory(prefix="preprocess-") as staging_dir:
+        preprocessed = preprocess(args.stopwords,
+                                  scan_speeches(args.speech),
+                                  args.column,
+                                  keep=args.keep,
+                                  stopword_engine=args.stopword_engine,
+                                  stemming_mode=args.stemming_mode,
+                                  workers=args.workers,
+                                  tokenizer=args.tokenizer,
+                                  staging_dir=staging_dir)
+
+        write_speeches(preprocessed, args.output, args.partition_by)
+
+    print(f"Preprocessed speeches have been written to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -4,30 +4,49 @@ import string
 
 import polars as pl
 
+from src.speeches_io import PARTITION_COLUMNS, scan_speeches, write_speeches
 
-def remove_punctuation(speeches: pl.DataFrame, column: str) -> pl.DataFrame:
+
+def remove_punctuation_expr(column: str) -> pl.Expr:
     """
-    Remove punctuation characters from a text in a specified column
-    of a Polars DataFrame.
+    Build the expression that removes punctuation characters from
+    a specified column.
 
     Args:
-        speeches (pl.DataFrame): A Polars DataFrame containing text data.
-        column (str): The name of the column in `speeches` DataFrame where
-        punctuation should be removed.
+        column (str): The name of the column where punctuation
+        should be removed.
 
     Returns:
-        pl.DataFrame: A new Polars DataFrame with the specified `column`
-        containing text with punctuation removed.
+        pl.Expr: An expression removing punctuation and stripping
+        leading and trailing spaces.
     """
     # Define a regular expression pattern to match all punctuation
     punctuation_pattern = f"[{re.escape(string.punctuation)}]"
 
     # Remove punctuation and strip trailing spaces
-    text = speeches.with_columns(
-        pl.col(column)
-        .str.replace_all(punctuation_pattern, "")
-        .str.strip_chars()
-    )
+    return (pl.col(column)
+            .str.replace_all(punctuation_pattern, "")
+            .str.strip_chars())
+
+
+def remove_punctuation(speeches: pl.DataFrame | pl.LazyFrame, column: str) \
+        -> pl.DataFrame | pl.LazyFrame:
+    """
+    Remove punctuation characters from a text in a specified column
+    of a Polars DataFrame.
+
+    Args:
+        speeches (pl.DataFrame | pl.LazyFrame): A Polars DataFrame or
+        LazyFrame containing text data.
+        column (str): The name of the column in `speeches` DataFrame where
+        punctuation should be removed.
+
+    Returns:
+        pl.DataFrame | pl.LazyFrame: A new Polars DataFrame, or a LazyFrame
+        for lazy input, with the specified `column` containing text with
+        punctuation removed.
+    """
+    text = speeches.with_columns(remove_punctuation_expr(column))
 
     return text
 
@@ -57,13 +76,22 @@ def main():
         help="The output file path for the removed puncatation list"
     )
 
+    parser.add_argument(
+        "--partition-by",
+        nargs="+",
+        choices=PARTITION_COLUMNS,
+        default=None,
+        help="Write the output as a dataset directory partitioned "
+             "by these columns"
+    )
+
     args = parser.parse_args()
 
-    remove_punctuations = remove_punctuation(pl.read_parquet(args.speech),
+    remove_punctuations = remove_punctuation(scan_speeches(args.speech),
                                              args.column)
 
-    # Write the DataFrame to a Parquet file
-    remove_punctuations.write_parquet(args.output)
+    # Stream the query result to a Parquet file
+    write_speeches(remove_punctuations, args.output, args.partition_by)
 
     print(f"Removed puncatations have been written to {args.output}")
 
@@ -4,29 +4,32 @@ import re
 import nltk
 import polars as pl
 
+from src.speeches_io import PARTITION_COLUMNS, scan_speeches, write_speeches
+
 nltk.download('stopwords')
 
+# The regex engine removes all stopwords with a single alternation pattern,
+# the set engine splits the text into words once and looks each word up
+# in a hash set of stopwords
+STOPWORD_ENGINES = ["regex", "set"]
+
+# Stopwords consisting of word characters only can be removed by the set
+# engine, as they always match a whole token
+WORD_PATTERN = r'\w+'
+TOKEN_PATTERN = r'\w+|\W+'
+
 
-def remove_stopwords(stopwords: str, speeches: pl.DataFrame, column: str) \
-        -> pl.DataFrame:
+def read_stopwords(stopwords: str) -> list[str]:
     """
-    Remove stopwords from a specified column in a Polars DataFrame.
-    This function reads a list of stopwords from a file, compiles a
-    regex pattern
-    to match these stopwords, and applies this pattern to remove
-    stopwords from each entry in the specified column of the given DataFrame.
+    Read a list of stopwords from a file and extend it with NLTK's
+    German stopwords.
 
     Args:
         stopwords (str): The path to a file containing stopwords, with
         one stopword per line.
-        speeches (pl.DataFrame): The Polars DataFrame containing the column
-        from which to remove stopwords.
-        column (str): The name of the column in the DataFrame from which to
-        remove stopwords.
 
     Returns:
-        pl.DataFrame: A new DataFrame with the stopwords removed from the
-        specified column.
+        list[str]: The custom and NLTK stopwords.
     """
     # Read stopwords from the file
     with open(stopwords, "r") as file:
@@ -34,15 +37,121 @@ def remove_stopwords(stopwords: str, speeches: pl.DataFrame, column: str) \
 
     stopwords_list.extend(nltk.corpus.stopwords.words('german'))
 
+    return stopwords_list
+
+
+def stopwords_regex_expr(stopwords_list: list[str], column: str) -> pl.Expr:
+    """
+    Build the expression that removes stopwords from a specified column
+    using a single case-insensitive regex alternation.
+
+    Args:
+        stopwords_list (list[str]): The stopwords to remove.
+        column (str): The name of the column from which to remove
+        stopwords.
+
+    Returns:
+        pl.Expr: An expression removing all stopwords from the column.
+    """
     # Create a regex pattern to match whole words in the stopwords list
     pattern = (r'(?i)\b(' + r'|'.join(re.escape(stopword) for stopword in
                                       stopwords_list) + r')\b')
 
     # Remove all occurrences of stopwords
-    text = speeches.with_columns(
-        pl.col(column)
-        .str.replace_all(pattern, '')
-    )
+    return pl.col(column).str.replace_all(pattern, '')
+
+
+def stopwords_set_expr(stopwords_list: list[str], column: str) -> pl.Expr:
+    """
+    Build the expression that removes stopwords from a specified column
+    by tokenizing the text once and filtering the words against a hash
+    set of lowercase stopwords. The result is the same as with the regex
+    engine: the text is split into runs of word characters and runs of
+    other characters, so the text between removed words is kept as is.
+
+    Stopwords that contain other than word characters cannot be matched
+    as a single token and are removed with a regex beforehand.
+
+    Args:
+        stopwords_list (list[str]): The stopwords to remove.
+        column (str): The name of the column from which to remove
+        stopwords.
+
+    Returns:
+        pl.Expr: An expression removing all stopwords from the column.
+    """
+    word_stopwords = sorted({stopword.lower() for stopword in stopwords_list
+                             if re.fullmatch(WORD_PATTERN, stopword)})
+    other_stopwords = [stopword for stopword in stopwords_list
+                       if stopword and not re.fullmatch(WORD_PATTERN,
+                                                        stopword)]
+
+    text = pl.col(column)
+    if other_stopwords:
+        text = stopwords_regex_expr(other_stopwords, column)
+
+    return (text
+            .str.extract_all(TOKEN_PATTERN)
+            .list.eval(pl.element().filter(
+                ~pl.element().str.to_lowercase().is_in(word_stopwords)))
+            .list.join(''))
+
+
+def remove_stopwords_expr(stopwords: str, column: str,
+                          engine: str = "regex") -> pl.Expr:
+    """
+    Build the expression that removes stopwords from a specified column.
+
+    Args:
+        stopwords (str): The path to a file containing stopwords, with
+        one stopword per line.
+        column (str): The name of the column from which to remove
+        stopwords.
+        engine (str): The engine used to match stopwords,
+        either 'regex' or 'set'.
+
+    Returns:
+        pl.Expr: An expression removing all stopwords from the column.
+    """
+    stopwords_list = read_stopwords(stopwords)
+
+    if engine == "regex":
+        return stopwords_regex_expr(stopwords_list, column)
+    elif engine == "set":
+        return stopwords_set_expr(stopwords_list, column)
+    else:
+        raise ValueError(f'Argument engine must be one of '
+                         f'{", ".join(STOPWORD_ENGINES)}')
+
+
+def remove_stopwords(stopwords: str,
+                     speeches: pl.DataFrame | pl.LazyFrame,
+                     column: str,
+                     engine: str = "regex") -> pl.DataFrame | pl.LazyFrame:
+    """
+    Remove stopwords from a specified column in a Polars DataFrame.
+    This function reads a list of stopwords from a file, compiles a
+    regex pattern
+    to match these stopwords, and applies this pattern to remove
+    stopwords from each entry in the specified column of the given DataFrame.
+
+    Args:
+        stopwords (str): The path to a file containing stopwords, with
+        one stopword per line.
+        speeches (pl.DataFrame | pl.LazyFrame): The Polars DataFrame or
+        LazyFrame containing the column from which to remove stopwords.
+        column (str): The name of the column in the DataFrame from which to
+        remove stopwords.
+        engine (str): The engine used to match stopwords, either 'regex'
+        for a single regex alternation or 'set' for a hash set lookup
+        of each word.
+
+    Returns:
+        pl.DataFrame | pl.LazyFrame: A new DataFrame, or a LazyFrame for
+        lazy input, with the stopwords removed from the specified column.
+    """
+    text = speeches.with_columns(remove_stopwords_expr(stopwords, column,
+                                                       engine))
 
     return text
 
@@ -71,6 +180,14 @@ def main():
         help="The column containing the speech content"
     )
 
+    parser.add_argument(
+        "--engine",
+        type=str,
+        choices=STOPWORD_ENGINES,
+        default="regex",
+        help="The engine used to match stopwords"
+    )
+
     parser.add_argument(
         "--output",
         type=str,
@@ -78,13 +195,24 @@ def main():
         help="The output file path for the removed stopword list"
     )
 
+    parser.add_argument(
+        "--partition-by",
+        nargs="+",
+        choices=PARTITION_COLUMNS,
+        default=None,
+        help="Write the output as a dataset directory partitioned "
+             "by these columns"
+    )
+
     args = parser.parse_args()
 
     removed_stopwords = remove_stopwords(args.stopwords,
-                                         pl.read_parquet(args.speech),
-                                         args.column)
+                                         scan_speeches(args.speech),
+                                         args.column,
+                                         args.engine)
 
-    removed_stopwords.write_parquet(args.output)
+    # Stream the query result to a Parquet file
+    write_speeches(removed_stopwords, args.output, args.partition_by)
 
     print(f"Removed stoppwords have been written to {args.output}")
 
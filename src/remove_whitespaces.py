@@ -2,8 +2,33 @@ import argparse
 
 import polars as pl
 
+from src.speeches_io import PARTITION_COLUMNS, scan_speeches, write_speeches
 
-def remove_whitespaces(speeches: pl.DataFrame, column: str) -> pl.DataFrame:
+
+def remove_whitespaces_expr(column: str) -> pl.Expr:
+    """
+    Build the expression that removes extra whitespaces from a
+    specified column.
+
+    Args:
+        column (str): The name of the column from which to remove
+        extra whitespaces.
+
+    Returns:
+        pl.Expr: An expression replacing double spaces with a single
+        space and stripping leading and trailing spaces.
+    """
+    # Replace multiple spaces with a single space and strip
+    # trailing spaces
+    return (pl.col(column)
+            # Replace multiple spaces with a single space
+            .str.replace_all(r'  ', ' ')
+            # Remove leading and trailing spaces
+            .str.strip_chars())
+
+
+def remove_whitespaces(speeches: pl.DataFrame | pl.LazyFrame, column: str) \
+        -> pl.DataFrame | pl.LazyFrame:
     """
     Remove extra whitespaces from a specified column in a Polars DataFrame.
     This function uses Polars string manipulation methods to replace multiple
@@ -11,24 +36,17 @@ def remove_whitespaces(speeches: pl.DataFrame, column: str) -> pl.DataFrame:
     each entry in the specified column of the given DataFrame.
 
     Args:
-        speeches (pl.DataFrame): The Polars DataFrame containing
-        the column to process.
+        speeches (pl.DataFrame | pl.LazyFrame): The Polars DataFrame or
+        LazyFrame containing the column to process.
         column (str): The name of the column in the DataFrame from
         which to remove extra whitespaces.
 
     Returns:
-        pl.DataFrame: A new DataFrame with extra whitespaces removed from
-        the specified column.
+        pl.DataFrame | pl.LazyFrame: A new DataFrame, or a LazyFrame for
+        lazy input, with extra whitespaces removed from the specified
+        column.
     """
-    text = speeches.with_columns(
-        # Replace multiple spaces with a single space and strip
-        # trailing spaces
-        pl.col(column)
-        # Replace multiple spaces with a single space
-        .str.replace_all(r'  ', ' ')
-        # Remove leading and trailing spaces
-        .str.strip_chars()
-    )
+    text = speeches.with_columns(remove_whitespaces_expr(column))
 
     return text
 
@@ -58,13 +76,22 @@ def main():
         help="The output file path for the removed whitespace list"
     )
 
+    parser.add_argument(
+        "--partition-by",
+        nargs="+",
+        choices=PARTITION_COLUMNS,
+        default=None,
+        help="Write the output as a dataset directory partitioned "
+             "by these columns"
+    )
+
     args = parser.parse_args()
 
-    remove_whitespace = remove_whitespaces(pl.read_parquet(args.speech),
+    remove_whitespace = remove_whitespaces(scan_speeches(args.speech),
                                            args.column)
 
-    # Write the DataFrame to a Parquet file
-    remove_whitespace.write_parquet(args.output)
+    # Stream the query result to a Parquet file
+    write_speeches(remove_whitespace, args.output, args.partition_by)
 
     print(f"Removed whitespace have been written to {args.output}")
 
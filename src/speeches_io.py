@@ -0,0 +1,212 @@
+import os
+import shutil
+import tempfile
+
+import polars as pl
+
+# Columns that can be used to split a speeches table into a
+# hive-style partitioned dataset, e.g. `speeches/year=1949/part-0.parquet`
+PARTITION_COLUMNS = ["year", "electoralTerm"]
+
+
+def is_partitioned(path: str) -> bool:
+    """
+    Check whether a path points to a partitioned Parquet dataset
+    instead of a single Parquet file.
+
+    Args:
+        path (str): The path to a Parquet file or dataset directory.
+
+    Returns:
+        bool: True if the path is a dataset directory.
+    """
+    return os.path.isdir(path)
+
+
+def scan_speeches(path: str) -> pl.LazyFrame:
+    """
+    Lazily scan a speeches table from a single Parquet file or from a
+    hive-style partitioned Parquet dataset.
+
+    Filters on partition columns are pushed down to the scan, so a
+    query for a single year only reads the files of that partition.
+
+    Args:
+        path (str): The path to a Parquet file or dataset directory.
+
+    Returns:
+        pl.LazyFrame: A LazyFrame over the speeches table.
+    """
+    if is_partitioned(path):
+        return pl.scan_parquet(os.path.join(path, "**", "*.parquet"),
+                               hive_partitioning=True)
+    return pl.scan_parquet(path)
+
+
+def collect(speeches: pl.DataFrame | pl.LazyFrame) -> pl.DataFrame:
+    """
+    Materialize a speeches table if it is lazy.
+
+    Args:
+        speeches (pl.DataFrame | pl.LazyFrame): The speeches table.
+
+    Returns:
+        pl.DataFrame: The materialized speeches table.
+    """
+    if isinstance(speeches, pl.LazyFrame):
+        return speeches.collect()
+    return speeches
+
+
+def with_date_columns(speeches: pl.DataFrame | pl.LazyFrame) \
+        -> pl.DataFrame | pl.LazyFrame:
+    """
+    Add the typed date columns `date`, `year` and `electoralTerm`
+    using native Polars expressions. A `date` string in ISO format is
+    parsed, a missing `year` is derived from the date, and year and
+    electoral term are cast to integers. Columns that are already typed
+    are left as they are, so the function is cheap to apply again.
+
+    Args:
+        speeches (pl.DataFrame | pl.LazyFrame): The speeches table.
+
+    Returns:
+        pl.DataFrame | pl.LazyFrame: The speeches table with typed
+        date columns.
+    """
+    schema = speeches.schema
+    columns = []
+
+    if "date" in schema:
+        date = pl.col("date")
+        if schema["date"] == pl.String:
+            date = date.str.slice(0, 10).str.to_date("%Y-%m-%d")
+            columns.append(date)
+        elif schema["date"] != pl.Date:
+            date = date.cast(pl.Date)
+            columns.append(date)
+
+        if "year" not in schema:
+            columns.append(date.dt.year().cast(pl.Int64).alias("year"))
+
+    for column in ("year", "electoralTerm"):
+        if column in schema and schema[column] != pl.Int64:
+            columns.append(pl.col(column).cast(pl.Int64))
+
+    if not columns:
+        return speeches
+    return speeches.with_columns(columns)
+
+
+def with_partition_columns(speeches: pl.DataFrame | pl.LazyFrame,
+                           partition_by: list[str]) \
+        -> pl.DataFrame | pl.LazyFrame:
+    """
+    Add missing partition columns that can be derived from the data.
+    The year is derived from the `date` column, which may either be
+    typed or an ISO formatted string.
+
+    Args:
+        speeches (pl.DataFrame | pl.LazyFrame): The speeches table.
+        partition_by (list[str]): The partition columns.
+
+    Returns:
+        pl.DataFrame | pl.LazyFrame: The speeches table including
+        all partition columns.
+    """
+    if "year" in partition_by and "year" not in speeches.columns:
+        speeches = speeches.with_columns(
+            pl.col("date").cast(pl.Date).dt.year().alias("year")
+        )
+    return speeches
+
+
+def write_partitioned(speeches: pl.DataFrame | pl.LazyFrame,
+                      path: str,
+                      partition_by: list[str],
+                      **parquet_options) -> None:
+    """
+    Write a speeches table as a hive-style partitioned Parquet dataset
+    with one directory per combination of partition values. An existing
+    dataset at `path` is replaced.
+
+    The plan of a LazyFrame is executed once into a temporary staging
+    file next to the dataset, which holds the partition columns. The
+    partitions are then written one at a time as filtered scans of the
+    staging file, so the table is never held in memory at once. If the
+    speeches are ordered by date, the row group statistics of the
+    staged year let each scan skip the row groups of other years.
+
+    Args:
+        speeches (pl.DataFrame | pl.LazyFrame): The speeches table.
+        path (str): The output directory of the dataset.
+        partition_by (list[str]): The partition columns.
+        **parquet_options: Options passed on to the Parquet writer.
+    """
+    speeches = with_partition_columns(speeches, partition_by)
+
+    if isinstance(speeches, pl.LazyFrame):
+        parent = os.path.dirname(os.path.abspath(path))
+        os.makedirs(parent, exist_ok=True)
+        with tempfile.TemporaryDirectory(prefix=".staging-",
+                                         dir=parent) as staging_dir:
+            staging = os.path.join(staging_dir, "speeches.parquet")
+            speeches.sink_parquet(staging, **parquet_options)
+            _write_partitions(pl.scan_parquet(staging), path, partition_by,
+                              **parquet_options)
+    else:
+        _write_partitions(speeches, path, partition_by, **parquet_options)
+
+
+def _write_partitions(speeches: pl.DataFrame | pl.LazyFrame,
+                      path: str,
+                      partition_by: list[str],
+                      **parquet_options) -> None:
+    """
+    Write each partition of a speeches table holding the partition
+    columns to its own directory of the dataset at `path`.
+    """
+    if os.path.exists(path):
+        shutil.rmtree(path)
+
+    keys = collect(speeches.select(partition_by).unique()).sort(partition_by)
+
+    for key in keys.iter_rows(named=True):
+        partition_dir = os.path.join(
+            path, *(f"{column}={value}" for column, value in key.items())
+        )
+        os.makedirs(partition_dir)
+        output = os.path.join(partition_dir, "part-0.parquet")
+
+        predicate = pl.all_horizontal(
+            [pl.col(column) == value for column, value in key.items()]
+        )
+        partition = speeches.filter(predicate).drop(partition_by)
+
+        if isinstance(partition, pl.LazyFrame):
+            partition.sink_parquet(output, **parquet_options)
+        else:
+            partition.write_parquet(output, **parquet_options)
+
+
+def write_speeches(speeches: pl.DataFrame | pl.LazyFrame,
+                   path: str,
+                   partition_by: list[str] = None,
+                   **parquet_options) -> None:
+    """
+    Write a speeches table to a single Parquet file, or to a partitioned
+    Parquet dataset if partition columns are given.
+
+    Args:
+        speeches (pl.DataFrame | pl.LazyFrame): The speeches table.
+        path (str): The output file or directory path.
+        partition_by (list[str]): The partition columns, or None to
+        write a single file.
+        **parquet_options: Options passed on to the Parquet writer.
+    """
+    if partition_by:
+        write_partitioned(speeches, path, partition_by, **parquet_options)
+    elif isinstance(speeches, pl.LazyFrame):
+        speeches.sink_parquet(path, **parquet_options)
+    else:
+        speeches.write_parquet(path, **parquet_options)
@@ -1,38 +1,340 @@
 import argparse
+import multiprocessing
+import os
+import tempfile
+import weakref
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+from itertools import chain
 
 import nltk
 import polars as pl
 
-# Download NLTK's punkt tokenizer if not already downloaded
-nltk.download('punkt')
+from src.speeches_io import (PARTITION_COLUMNS, scan_speeches,
+                             write_speeches)
+from src.tokenizer import tokenize_expr
 
+# Download NLTK's punkt tokenizer if not already downloaded. The lookup
+# is local, so spawned worker processes importing this module don't
+# check the network again
+try:
+    nltk.data.find('tokenizers/punkt')
+except LookupError:
+    nltk.download('punkt')
 
-def stemming(speeches: pl.DataFrame, column: str) -> pl.DataFrame:
+# 'apply' stems every token occurrence, 'cache' memoizes the stems of
+# recently seen tokens and 'vocabulary' stems every token type only once
+STEMMING_MODES = ["apply", "cache", "vocabulary"]
+
+# 'nltk' splits the speeches with nltk.word_tokenize per speech, 'polars'
+# with the vectorized tokenizer of src.tokenizer
+TOKENIZERS = ["nltk", "polars"]
+
+# The maximum number of memoized stems of the 'cache' mode, and the
+# maximum vocabulary size of the 'vocabulary' mode before it falls
+# back to the 'cache' mode
+MAX_TYPES = 2 ** 20
+
+# The number of speeches sent to a worker process at once
+CHUNK_SIZE = 1000
+
+# The stem function of a worker process, created once per process
+_worker_stem = None
+
+
+def _init_worker(cache_size: int = None) -> None:
     """
-    Perform stemming on a text in a specified column of a Polars DataFrame
+    Create the stemmer of a worker process.
+
+    Args:
+        cache_size (int): The number of stems kept in an LRU cache,
+        or None to stem every token occurrence.
+    """
+    global _worker_stem
+    snowball = nltk.stem.SnowballStemmer(language="german")
+    _worker_stem = snowball.stem
+    if cache_size:
+        _worker_stem = lru_cache(maxsize=cache_size)(_worker_stem)
+
+
+def _stem_chunk(speeches: list[str]) -> list[str]:
+    """
+    Tokenize and stem a chunk of speeches in a worker process.
+    """
+    return [None if speech is None else
+            " ".join(_worker_stem(word) for word in
+                     nltk.word_tokenize(speech))
+            for speech in speeches]
+
+
+def _stem_tokens_chunk(speeches: list[list[str]]) -> list[str]:
+    """
+    Stem a chunk of tokenized speeches in a worker process.
+    """
+    return [None if tokens is None else
+            " ".join(_worker_stem(word) for word in tokens)
+            for tokens in speeches]
+
+
+def _tokenize_chunk(speeches: list[str]) -> list[list[str]]:
+    """
+    Tokenize a chunk of speeches in a worker process.
+    """
+    return [None if speech is None else nltk.word_tokenize(speech)
+            for speech in speeches]
+
+
+class ChunkedProcessPool:
+    """
+    A callable that splits a column into chunks of rows and processes
+    them in a pool of worker processes. The chunks are reassembled in
+    their original order.
+
+    The pool is started on the first call and reused for all further
+    batches, so it can be passed to `map_batches` in a streaming query.
+    Workers are spawned rather than forked, as forking a process with
+    a running Polars thread pool can deadlock.
+    """
+
+    def __init__(
+            self,
+            function,
+            return_dtype: pl.PolarsDataType,
+            workers: int,
+            chunk_size: int = CHUNK_SIZE,
+            cache_size: int = None
+    ) -> None:
+        self.function = function
+        self.return_dtype = return_dtype
+        self.workers = workers
+        self.chunk_size = chunk_size
+        self.cache_size = cache_size
+        self.executor = None
+
+    def __call__(self, speeches: pl.Series) -> pl.Series:
+        if self.executor is None:
+            self.executor = ProcessPoolExecutor(
+                max_workers=self.workers,
+                mp_context=multiprocessing.get_context("spawn"),
+                initializer=_init_worker,
+                initargs=(self.cache_size,)
+            )
+            weakref.finalize(self, self.executor.shutdown)
+
+        chunks = [speeches.slice(offset, self.chunk_size).to_list()
+                  for offset in range(0, len(speeches), self.chunk_size)]
+        results = chain.from_iterable(
+            self.executor.map(self.function, chunks))
+
+        return pl.Series(speeches.name, list(results),
+                         dtype=self.return_dtype)
+
+
+def stemming_expr(column: str, cache_size: int = None,
+                  workers: int = 1, tokenizer: str = "nltk") -> pl.Expr:
+    """
+    Build the expression that stems the text in a specified column
     using NLTK's SnowballStemmer for German.
 
     Args:
-        speeches (pl.DataFrame): A Polars DataFrame containing text data.
-        column (str): The name of the column in `speeches` DataFrame where
-        a text should be stemmed.
+        column (str): The name of the column where a text should
+        be stemmed.
+        cache_size (int): The number of stems kept in an LRU cache,
+        or None to stem every token occurrence.
+        workers (int): The number of worker processes stemming
+        chunks of rows in parallel.
+        tokenizer (str): The tokenizer splitting the text into words,
+        either 'nltk' or 'polars'.
 
     Returns:
-        pl.DataFrame: A new Polars DataFrame with the specified `column`
-        containing the stemmed text.
+        pl.Expr: An expression tokenizing and stemming each text.
     """
+    if tokenizer == "polars":
+        return _stem_tokens_expr(tokenize_expr(column), cache_size, workers)
+
+    if workers > 1:
+        return pl.col(column).map_batches(
+            ChunkedProcessPool(_stem_chunk, pl.String, workers,
+                               cache_size=cache_size),
+            return_dtype=pl.String,
+            is_elementwise=True
+        )
+
     # Initialize Snowball Stemmer for German
     snowball = nltk.stem.SnowballStemmer(language="german")
 
+    stem = snowball.stem
+    if cache_size:
+        stem = lru_cache(maxsize=cache_size)(stem)
+
     # Apply stemming to the specified column
-    text = speeches.with_columns(
+    return (pl.col(column)
+            .map_elements(lambda speech: " "
+                          .join(stem(word) for word in
+                                nltk.word_tokenize(speech)),
+                          return_dtype=pl.String))
+
+
+def _stem_tokens_expr(tokens: pl.Expr, cache_size: int = None,
+                      workers: int = 1) -> pl.Expr:
+    """
+    Build the expression that stems and joins a list column of tokens.
+    """
+    if workers > 1:
+        return tokens.map_batches(
+            ChunkedProcessPool(_stem_tokens_chunk, pl.String, workers,
+                               cache_size=cache_size),
+            return_dtype=pl.String,
+            is_elementwise=True
+        )
+
+    snowball = nltk.stem.SnowballStemmer(language="german")
+
+    stem = snowball.stem
+    if cache_size:
+        stem = lru_cache(maxsize=cache_size)(stem)
+
+    return tokens.map_elements(lambda words: " "
+                               .join(stem(word) for word in words),
+                               return_dtype=pl.String)
+
+
+def vocabulary_stemming(speeches: pl.DataFrame | pl.LazyFrame,
+                        column: str,
+                        max_types: int = MAX_TYPES,
+                        workers: int = 1,
+                        tokenizer: str = "nltk",
+                        staging_dir: str = None) \
+        -> pl.DataFrame | pl.LazyFrame:
+    """
+    Perform stemming on a text in a specified column by stemming each
+    unique token type of the column exactly once, and mapping the stems
+    back onto the tokens with a vectorized replace.
+
+    If the column contains more than `max_types` token types, the stems
+    are computed per speech with an LRU cache of that size instead. The
+    number of types is estimated before the vocabulary is collected, so
+    a vocabulary that doesn't fit in memory is never collected.
+
+    Given a staging directory, the tokens of a LazyFrame are streamed
+    once to a Parquet file in it, from which the vocabulary and the
+    stemmed text are read, so the upstream query runs only once. The
+    directory has to exist until the returned LazyFrame is collected.
+
+    Args:
+        speeches (pl.DataFrame | pl.LazyFrame): A Polars DataFrame or
+        LazyFrame containing text data.
+        column (str): The name of the column where a text should
+        be stemmed.
+        max_types (int): The maximum number of token types to stem
+        at once.
+        workers (int): The number of worker processes tokenizing
+        chunks of rows in parallel.
+        tokenizer (str): The tokenizer splitting the text into words,
+        either 'nltk' or 'polars'.
+        staging_dir (str): A temporary directory for the tokens of a
+        LazyFrame, or None to run the upstream query for each pass.
+
+    Returns:
+        pl.DataFrame | pl.LazyFrame: The speeches with the specified
+        `column` containing the stemmed text.
+    """
+    if tokenizer == "polars":
+        tokenized = tokenize_expr(column)
+    elif workers > 1:
+        tokenized = pl.col(column).map_batches(
+            ChunkedProcessPool(_tokenize_chunk, pl.List(pl.String), workers),
+            return_dtype=pl.List(pl.String),
+            is_elementwise=True
+        )
+    else:
+        tokenized = pl.col(column).map_elements(
+            nltk.word_tokenize, return_dtype=pl.List(pl.String))
+
+    tokens = speeches.with_columns(tokenized)
+    if isinstance(tokens, pl.LazyFrame) and staging_dir:
+        # The tokens are written once, so that collecting the vocabulary
+        # doesn't run the upstream query again
+        path = os.path.join(staging_dir, f"{column}.tokens.parquet")
+        tokens.sink_parquet(path)
+        tokens = pl.scan_parquet(path)
+
+    words = tokens.lazy().select(pl.col(column).explode().drop_nulls())
+    # the estimate only keeps a fixed size sketch of the types in memory
+    n_types = words.select(pl.col(column).approx_n_unique()) \
+        .collect(streaming=True).item()
+
+    types = None
+    if n_types <= max_types:
+        types = words.unique().collect(streaming=True)[column]
+
+    if types is None or len(types) > max_types:
+        return tokens.with_columns(_stem_tokens_expr(pl.col(column),
+                                                     max_types, workers))
+
+    snowball = nltk.stem.SnowballStemmer(language="german")
+    stems = pl.Series([snowball.stem(word) for word in types],
+                      dtype=pl.String)
+
+    return tokens.with_columns(
         pl.col(column)
-        .apply(lambda speech: " "
-               .join(snowball.stem(word) for word in
-                     nltk.word_tokenize(speech)),
-               return_dtype=pl.String)
+        .list.eval(pl.element().replace(types, stems))
+        .list.join(" ")
     )
 
+
+def stemming(speeches: pl.DataFrame | pl.LazyFrame,
+             column: str,
+             mode: str = "apply",
+             max_types: int = MAX_TYPES,
+             workers: int = 1,
+             tokenizer: str = "nltk",
+             staging_dir: str = None) -> pl.DataFrame | pl.LazyFrame:
+    """
+    Perform stemming on a text in a specified column of a Polars DataFrame
+    using NLTK's SnowballStemmer for German.
+
+    Args:
+        speeches (pl.DataFrame | pl.LazyFrame): A Polars DataFrame or
+        LazyFrame containing text data.
+        column (str): The name of the column in `speeches` DataFrame where
+        a text should be stemmed.
+        mode (str): 'apply' to stem every token occurrence, 'cache' to
+        memoize the stems in an LRU cache, or 'vocabulary' to stem every
+        token type once.
+        max_types (int): The size of the LRU cache, and the maximum
+        number of token types of the 'vocabulary' mode.
+        workers (int): The number of worker processes, each tokenizing
+        and stemming chunks of rows with its own stemmer.
+        tokenizer (str): 'nltk' to split the text with nltk.word_tokenize,
+        or 'polars' to use the vectorized tokenizer of src.tokenizer.
+        staging_dir (str): A temporary directory in which the
+        'vocabulary' mode stages the tokens of a LazyFrame, see
+        vocabulary_stemming.
+
+    Returns:
+        pl.DataFrame | pl.LazyFrame: A new Polars DataFrame, or a LazyFrame
+        for lazy input, with the specified `column` containing the
+        stemmed text.
+    """
+    if tokenizer not in TOKENIZERS:
+        raise ValueError(f'Argument tokenizer must be one of '
+                         f'{", ".join(TOKENIZERS)}')
+
+    if mode == "apply":
+        text = speeches.with_columns(stemming_expr(column,
+                                                   workers=workers,
+                                                   tokenizer=tokenizer))
+    elif mode == "cache":
+        text = speeches.with_columns(stemming_expr(column, max_types,
+                                                   workers, tokenizer))
+    elif mode == "vocabulary":
+        text = vocabulary_stemming(speeches, column, max_types, workers,
+                                   tokenizer, staging_dir)
+    else:
+        raise ValueError(f'Argument mode must be one of '
+                         f'{", ".join(STEMMING_MODES)}')
+
     return text
 
 
@@ -54,6 +356,39 @@ def main():
         help="The column containing the speech content"
     )
 
+    parser.add_argument(
+        "--mode",
+        type=str,
+        choices=STEMMING_MODES,
+        default="apply",
+        help="Whether to stem every token, memoize the stems in an "
+             "LRU cache or stem every token type once"
+    )
+
+    parser.add_argument(
+        "--max-types",
+        type=int,
+        default=MAX_TYPES,
+        help="The LRU cache size, and the maximum vocabulary size "
+             "before the vocabulary mode falls back to the cache"
+    )
+
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=1,
+        help="The number of worker processes"
+    )
+
+    parser.add_argument(
+        "--tokenizer",
+        type=str,
+        choices=TOKENIZERS,
+        default="nltk",
+        help="Whether to split the speeches with NLTK's word_tokenize or "
+             "with the vectorized Polars tokenizer"
+    )
+
     parser.add_argument(
         "--output",
         type=str,
@@ -61,12 +396,25 @@ def main():
         help="The output file path for the stemming list"
     )
 
+    parser.add_argument(
+        "--partition-by",
+        nargs="+",
+        choices=PARTITION_COLUMNS,
+        default=None,
+        help="Write the output as a dataset directory partitioned "
+             "by these columns"
+    )
+
     args = parser.parse_args()
 
-    stemm = stemming(pl.read_parquet(args.speech), args.column)
+    # The staged tokens are removed once the output is written
+    with tempfile.TemporaryDirectory(prefix="stemming-") as staging_dir:
+        stemm = stemming(scan_speeches(args.speech), args.column,
+                         args.mode, args.max_types, args.workers,
+                         args.tokenizer, staging_dir)
 
-    # Write the DataFrame to a Parquet file
-    stemm.write_parquet(args.output)
+        # Stream the query result to a Parquet file
+        write_speeches(stemm, args.output, args.partition_by)
 
     print(f"Stemming have been written to {args.output}")
 
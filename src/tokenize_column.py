@@ -0,0 +1,252 @@
+import argparse
+import os
+import tempfile
+from itertools import islice
+from typing import Iterable, Iterator
+
+import polars as pl
+import spacy
+from spacy.language import Language
+
+from src.speeches_io import (PARTITION_COLUMNS, collect, scan_speeches,
+                             write_speeches)
+
+# Pipeline components that are not needed to tag and lemmatize tokens
+EXCLUDED_COMPONENTS = ["parser", "ner"]
+
+# The number of texts buffered and processed by spaCy at once
+BATCH_SIZE = 256
+
+# The number of texts sorted by length and lemmatized at once
+CHUNK_SIZE = 10000
+
+
+def iter_lemmas(texts: Iterable[str | None],
+                nlp: Language,
+                pos_filter: list[str] = None,
+                batch_size: int = BATCH_SIZE,
+                n_process: int = 1,
+                chunk_size: int = CHUNK_SIZE) -> Iterator[list[str] | None]:
+    """
+    Lazily lemmatize a sequence of texts with a spaCy pipeline, keeping
+    only the lemmas of tokens with one of the given part-of-speech tags.
+
+    The texts are read in chunks of `chunk_size`, and the texts of each
+    chunk are passed to `nlp.pipe` sorted by length, so each batch holds
+    texts of similar length and little work is spent on padding, while
+    only one chunk is held in memory at a time. The lemmas are yielded
+    in the original order of the texts.
+
+    Args:
+        texts (Iterable[str | None]): The texts to lemmatize, None for
+        missing texts.
+        nlp (Language): The spaCy pipeline tagging and lemmatizing
+        the tokens.
+        pos_filter (list[str]): The part-of-speech tags of the tokens to
+        keep, or None to keep all tokens.
+        batch_size (int): The number of texts processed at once.
+        n_process (int): The number of processes running the pipeline.
+        chunk_size (int): The number of texts sorted by length at once.
+
+    Yields:
+        list[str] | None: The lemmas of each text, None for missing texts.
+    """
+    pos_filter = set(pos_filter) if pos_filter else None
+    texts = iter(texts)
+
+    while chunk := list(islice(texts, chunk_size)):
+        lemmas = [None] * len(chunk)
+
+        order = sorted((i for i, text in enumerate(chunk)
+                        if text is not None),
+                       key=lambda i: len(chunk[i]))
+        docs = nlp.pipe((chunk[i] for i in order),
+                        batch_size=batch_size,
+                        n_process=n_process)
+
+        for i, doc in zip(order, docs):
+            lemmas[i] = [token.lemma_ for token in doc
+                         if pos_filter is None or token.pos_ in pos_filter]
+
+        yield from lemmas
+
+
+def lemmatize(texts: list[str],
+              nlp: Language,
+              pos_filter: list[str] = None,
+              batch_size: int = BATCH_SIZE,
+              n_process: int = 1,
+              chunk_size: int = CHUNK_SIZE) -> list[list[str]]:
+    """
+    Lemmatize a list of texts with a spaCy pipeline, keeping only the
+    lemmas of tokens with one of the given part-of-speech tags.
+    See iter_lemmas.
+
+    Args:
+        texts (list[str]): The texts to lemmatize, None for missing texts.
+        nlp (Language): The spaCy pipeline tagging and lemmatizing
+        the tokens.
+        pos_filter (list[str]): The part-of-speech tags of the tokens to
+        keep, or None to keep all tokens.
+        batch_size (int): The number of texts processed at once.
+        n_process (int): The number of processes running the pipeline.
+        chunk_size (int): The number of texts sorted by length at once.
+
+    Returns:
+        list[list[str]]: The lemmas of each text, None for missing texts.
+    """
+    return list(iter_lemmas(texts, nlp, pos_filter, batch_size, n_process,
+                            chunk_size))
+
+
+def tokenize_column(speeches: pl.DataFrame | pl.LazyFrame,
+                    column: str,
+                    nlp: Language,
+                    pos_filter: list[str] = None,
+                    output_column: str = None,
+                    batch_size: int = BATCH_SIZE,
+                    n_process: int = 1,
+                    chunk_size: int = CHUNK_SIZE,
+                    staging_dir: str = None) -> pl.DataFrame | pl.LazyFrame:
+    """
+    Add a list column with the lemmas of the text in a specified column
+    of a Polars DataFrame.
+
+    Given a staging directory, a LazyFrame is read and lemmatized in
+    slices of `chunk_size` rows, which are written to Parquet files in
+    the directory, so the speeches are never held in memory at once.
+    The directory has to exist until the returned LazyFrame is collected.
+
+    Args:
+        speeches (pl.DataFrame | pl.LazyFrame): A Polars DataFrame or
+        LazyFrame containing text data.
+        column (str): The name of the column containing the text.
+        nlp (Language): The spaCy pipeline tagging and lemmatizing
+        the tokens.
+        pos_filter (list[str]): The part-of-speech tags of the tokens to
+        keep, or None to keep all tokens.
+        output_column (str): The name of the lemma column, by default
+        `{column}_tokens`.
+        batch_size (int): The number of texts processed at once.
+        n_process (int): The number of processes running the pipeline.
+        chunk_size (int): The number of texts sorted by length at once.
+        staging_dir (str): A temporary directory for the lemmatized
+        slices of a LazyFrame, or None to collect the LazyFrame.
+
+    Returns:
+        pl.DataFrame | pl.LazyFrame: The speeches with an additional
+        list column of lemmas, lazy if they were staged.
+    """
+    output_column = output_column or f"{column}_tokens"
+
+    def with_lemmas(chunk: pl.DataFrame) -> pl.DataFrame:
+        lemmas = iter_lemmas(chunk[column], nlp, pos_filter, batch_size,
+                             n_process, chunk_size)
+        return chunk.with_columns(
+            pl.Series(output_column, lemmas, dtype=pl.List(pl.String)))
+
+    if not isinstance(speeches, pl.LazyFrame) or not staging_dir:
+        return with_lemmas(collect(speeches))
+
+    height = speeches.select(pl.len()).collect().item()
+    # an empty table is written as a single empty slice
+    for part, offset in enumerate(range(0, max(height, 1), chunk_size)):
+        chunk = speeches.slice(offset, chunk_size).collect()
+        with_lemmas(chunk).write_parquet(
+            os.path.join(staging_dir, f"part-{part:05d}.parquet"))
+
+    return pl.scan_parquet(os.path.join(staging_dir, "part-*.parquet"))
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Lemmatize a column of speeches with spaCy and store "
+                    "the lemmas as a list column."
+    )
+
+    parser.add_argument(
+        "speech",
+        type=str,
+        help="A Dataframe of speech texts"
+    )
+
+    parser.add_argument(
+        "column",
+        type=str,
+        help="The column containing the speech content"
+    )
+
+    parser.add_argument(
+        "-f",
+        "--filter",
+        nargs="+",
+        default=None,
+        help="The part-of-speech tags of the tokens to keep"
+    )
+
+    parser.add_argument(
+        "--model",
+        type=str,
+        default="de_core_news_lg",
+        help="The spaCy model used for tagging and lemmatization"
+    )
+
+    parser.add_argument(
+        "--batch-size",
+        type=int,
+        default=BATCH_SIZE,
+        help="The number of speeches processed by spaCy at once"
+    )
+
+    parser.add_argument(
+        "--n-process",
+        type=int,
+        default=1,
+        help="The number of processes running the spaCy pipeline"
+    )
+
+    parser.add_argument(
+        "--output-column",
+        type=str,
+        default=None,
+        help="The name of the lemma column, by default {column}_tokens"
+    )
+
+    parser.add_argument(
+        "-o",
+        "--output",
+        type=str,
+        default="../data/tokenized.parquet",
+        help="The output file path for the tokenized speeches"
+    )
+
+    parser.add_argument(
+        "--partition-by",
+        nargs="+",
+        choices=PARTITION_COLUMNS,
+        default=None,
+        help="Write the output as a dataset directory partitioned "
+             "by these columns"
+    )
+
+    args = parser.parse_args()
+
+    nlp = spacy.load(args.model, exclude=EXCLUDED_COMPONENTS)
+
+    # The lemmatized slices are removed once the output is written
+    with tempfile.TemporaryDirectory(prefix="tokenize-") as staging_dir:
+        tokenized = tokenize_column(scan_speeches(args.speech), args.column,
+                                    nlp,
+                                    pos_filter=args.filter,
+                                    output_column=args.output_column,
+                                    batch_size=args.batch_size,
+                                    n_process=args.n_process,
+                                    staging_dir=staging_dir)
+
+        write_speeches(tokenized, args.output, args.partition_by)
+
+    print(f"Tokenized speeches have been written to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
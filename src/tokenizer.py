@@ -0,0 +1,58 @@
+import polars as pl
+
+# A word tokenizer for German speeches that mirrors the output of
+# nltk.word_tokenize for the common cases:
+#   - numbers with thousands separators, decimal commas and times
+#     ("1.000", "3,5", "10:30") are kept as one token
+#   - words may contain umlauts and are joined by hyphens and slashes
+#     ("CDU/CSU-Fraktion"), also after a number ("2,5-fache"), a trailing
+#     hyphen of a truncated compound ("Bundes- und Landesrecht") is kept
+#     with the word
+#   - clitics are split off the preceding word ("geht's" -> "geht", "'s")
+#   - ellipses and double dashes are single tokens, any other
+#     punctuation character is a token on its own
+# Unlike nltk.word_tokenize, periods of abbreviations ("Dr.", "z.B.") are
+# split off, straight double quotes are not converted to `` and '', an
+# opening single quote is not kept with the next word ("'sehr") and
+# English negations are not split ("don't" -> "don", "'", "t").
+TOKEN_PATTERN = (r"\d+(?:[.,:]\d+)+(?:[-/]\w+)*-?"
+                 r"|\w+(?:[-/]\w+)*-?"
+                 r"|'(?i:s|m|d|ll|re|ve)\b"
+                 r"|\.\.\.|--|[^\w\s]")
+
+
+def tokenize_expr(column: str) -> pl.Expr:
+    """
+    Build the expression that splits the text in a specified column
+    into a list of word and punctuation tokens.
+
+    Args:
+        column (str): The name of the column containing the text.
+
+    Returns:
+        pl.Expr: An expression evaluating to a list of tokens per text.
+    """
+    return pl.col(column).str.extract_all(TOKEN_PATTERN)
+
+
+def tokenize(speeches: pl.DataFrame | pl.LazyFrame,
+             column: str,
+             output_column: str = None) -> pl.DataFrame | pl.LazyFrame:
+    """
+    Split the text in a specified column of a Polars DataFrame into
+    a list of tokens using native Polars string expressions.
+
+    Args:
+        speeches (pl.DataFrame | pl.LazyFrame): A Polars DataFrame or
+        LazyFrame containing text data.
+        column (str): The name of the column containing the text.
+        output_column (str): The name of the list column holding the
+        tokens, or None to replace the text column.
+
+    Returns:
+        pl.DataFrame | pl.LazyFrame: The speeches with a list column
+        of tokens.
+    """
+    return speeches.with_columns(
+        tokenize_expr(column).alias(output_column or column)
+    )
@@ -0,0 +1,93 @@
+"""
+Title: test_backends.py
+
+Description:
+    This file contains unit tests
+    for the topic modelling backends.
+
+Usage:
+    Run all tests using\n
+    python -m unittest discover -s tests
+"""
+
+import unittest
+from unittest.mock import patch
+
+from gensim.corpora import Dictionary
+from gensim.models import HdpModel, LdaModel, LdaMulticore, LsiModel
+
+from src.LDA import backends
+
+
+class TestBackends(unittest.TestCase):
+    """
+    Unit tests for the functions in the backends module.
+    """
+
+    def setUp(self):
+        texts = [['Steuer', 'Haushalt', 'Schulden'],
+                 ['Panzer', 'Soldat', 'Bundeswehr'],
+                 ['Steuer', 'Schulden', 'Haushalt', 'Rente'],
+                 ['Soldat', 'Einsatz', 'Panzer']]
+        self.dictionary = Dictionary(texts)
+        self.corpus = [self.dictionary.doc2bow(text) for text in texts]
+
+    def test_train_model(self):
+        """
+        Test if each backend trains a model of its algorithm.
+        """
+        for name, model_class in [('LDA', LdaModel), ('HDP', HdpModel),
+                                  ('LSI', LsiModel),
+                                  ('LDA-MULTICORE', LdaMulticore)]:
+            model = backends.train_model(name, self.corpus, self.dictionary,
+                                         2, random_state=1, workers=2)
+            self.assertIsInstance(model, model_class)
+
+    @patch('src.LDA.backends.HdpModel')
+    @patch('src.LDA.backends.LsiModel')
+    @patch('src.LDA.backends.LdaModel')
+    def test_only_requested_model_is_trained(self, mock_lda, mock_lsi,
+                                             mock_hdp):
+        """
+        Test if only the requested algorithm is trained with its
+        tuning parameters, while unset parameters keep their defaults.
+        """
+        backends.train_model('LDA', self.corpus, self.dictionary, 2,
+                             passes=5, iterations=None, alpha='auto')
+
+        mock_lda.assert_called_once_with(
+            corpus=self.corpus, num_topics=2, id2word=self.dictionary,
+            passes=5, alpha='auto')
+        mock_lsi.assert_not_called()
+        mock_hdp.assert_not_called()
+
+    @patch('src.LDA.backends.LdaMulticore')
+    def test_multicore_parameters(self, mock_multicore):
+        """
+        Test if the multicore backend receives its worker count
+        and evaluation interval.
+        """
+        backends.train_model('LDA-MULTICORE', self.corpus, self.dictionary,
+                             2, workers=4, eval_every=0, chunksize=500)
+
+        mock_multicore.assert_called_once_with(
+            corpus=self.corpus, num_topics=2, id2word=self.dictionary,
+            workers=4, chunksize=500, eval_every=0)
+
+    def test_unknown_backend(self):
+        """
+        Test if an unknown algorithm is rejected.
+        """
+        with self.assertRaises(ValueError):
+            backends.train_model('NMF', self.corpus, self.dictionary, 2)
+
+    def test_parse_prior(self):
+        """
+        Test if priors are parsed as numbers or names.
+        """
+        self.assertEqual(backends.parse_prior('0.1'), 0.1)
+        self.assertEqual(backends.parse_prior('auto'), 'auto')
+
+
+if __name__ == '__main__':
+    unittest.main()
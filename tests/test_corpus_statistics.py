@@ -0,0 +1,73 @@
+import os
+import shutil
+import tempfile
+import unittest
+
+import polars as pl
+
+from src.corpus_statistics import CorpusStatistics, statistics_path
+
+
+class TestCorpusStatistics(unittest.TestCase):
+
+    def setUp(self):
+        # Create a temporary directory and a sample speeches DataFrame
+        self.test_dir = tempfile.mkdtemp()
+        self.df = pl.DataFrame({
+            "date": ["1949-09-07", "1949-10-01", "1950-01-02", "1950-03-04"],
+            "factionId": [1, 2, 1, 1],
+            "speechContent": ["Erste Rede", "", "Dritte  lange Rede",
+                              "Vierte Rede"],
+            "tokens": [["Rede"], [], ["Rede"], ["Vierte", "Rede"]],
+        })
+        self.path = os.path.join(self.test_dir, "speeches.parquet")
+        self.df.write_parquet(self.path)
+
+    def test_compute(self):
+        # Test if the counts equal those of the whole corpus
+        statistics = CorpusStatistics.compute(self.df.lazy(), "tokens")
+
+        self.assertEqual(statistics.word_count,
+                         len(" ".join(self.df["speechContent"]).split()))
+        self.assertEqual(statistics.token_count, 4)
+        self.assertEqual(statistics.speech_count, 4)
+        self.assertEqual(statistics.party_count, 2)
+        self.assertListEqual(statistics.years, [1949, 1950])
+        self.assertListEqual(statistics.by_year()["words"].to_list(),
+                             [2, 5])
+        self.assertIsNone(CorpusStatistics.compute(self.df).token_count)
+
+    def test_sidecar(self):
+        # Test if the sidecar is read back and recomputed once stale
+        sidecar = statistics_path(self.path)
+        statistics = CorpusStatistics.for_dataset(
+            self.df, sidecar, self.path, "tokens")
+        self.assertTrue(os.path.exists(sidecar))
+
+        cached = CorpusStatistics.for_dataset(
+            self.df.head(1), sidecar, self.path, "tokens")
+        self.assertTrue(cached.table.equals(statistics.table))
+
+        os.utime(self.path, (os.path.getmtime(sidecar) + 10,) * 2)
+        updated = CorpusStatistics.for_dataset(
+            self.df.head(1), sidecar, self.path, "tokens")
+        self.assertEqual(updated.speech_count, 1)
+
+    def test_sidecar_without_tokens(self):
+        # Test if a sidecar without tokens is recomputed once requested
+        sidecar = statistics_path(self.path)
+        statistics = CorpusStatistics.for_dataset(self.df, sidecar, self.path)
+        self.assertIsNone(statistics.token_count)
+
+        statistics = CorpusStatistics.for_dataset(
+            self.df, sidecar, self.path, "tokens")
+        self.assertEqual(statistics.token_count, 4)
+        self.assertEqual(CorpusStatistics.read(sidecar).token_count, 4)
+
+    def tearDown(self):
+        # Clean up the temporary directory
+        shutil.rmtree(self.test_dir)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,59 @@
+"""
+Title: test_factions.py
+
+Description:
+    This file contains unit tests
+    for the faction index of the LDA model.
+
+Usage:
+    Run all tests using\n
+    python -m unittest discover -s tests
+"""
+
+import unittest
+
+import polars as pl
+
+from src.LDA.factions import FactionGroups, FactionIndex
+
+
+FACTIONS = pl.DataFrame({'id': [0, 1, 2],
+                         'abbreviation': ['SPD', 'CDU/CSU', 'FDP']})
+
+
+class TestFactions(unittest.TestCase):
+
+    def test_faction_index(self):
+        """
+        Test the lookups between abbreviations and IDs.
+        """
+        factions = FactionIndex(FACTIONS)
+
+        self.assertEqual(factions.id('CDU/CSU'), 1)
+        self.assertEqual(factions.id(2), 2)
+        self.assertEqual(factions.abbreviation(0), 'SPD')
+        self.assertIsNone(factions.abbreviation(5))
+        with self.assertRaises(ValueError):
+            factions.id('AfD')
+
+    def test_faction_groups(self):
+        """
+        Test if the speeches of a faction equal a filter over all
+        speeches, in the order of the dataset.
+        """
+        speeches = pl.DataFrame({
+            'factionId': [2, 0, 2, None, 1, 0, 2],
+            'speechContent': ['a', 'b', 'c', 'd', 'e', 'f', 'g']
+        })
+        groups = FactionGroups(speeches)
+
+        self.assertEqual(len(groups), 4)
+        for faction_id in [0, 1, 2]:
+            self.assertTrue(groups.get(faction_id).equals(
+                speeches.filter(pl.col('factionId') == faction_id)))
+        self.assertEqual(groups.get(None)['speechContent'].to_list(), ['d'])
+        self.assertTrue(groups.get(3).is_empty())
+
+
+if __name__ == '__main__':
+    unittest.main()
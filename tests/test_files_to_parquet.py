@@ -0,0 +1,69 @@
+import os
+import shutil
+import tempfile
+import unittest
+
+import polars as pl
+
+import src.files_to_parquet as files_to_parquet
+
+
+class TestFilesToParquet(unittest.TestCase):
+
+    def setUp(self):
+        # Create a temporary directory with a small speeches.csv file
+        self.test_dir = tempfile.mkdtemp()
+        self.speeches = os.path.join(self.test_dir, "speeches.csv")
+        with open(self.speeches, "w", encoding="utf-8") as file:
+            file.write(
+                "id,speechContent,factionId,politicianId,date\n"
+                '1,"Erste\nRede",3,11000001,1949-09-07\n'
+                "2,Zweite Rede,-1,-1,1950-01-02\n"
+            )
+
+    def test_convert_speeches_streaming(self):
+        # Test if the streamed file matches the eagerly converted file
+        eager = os.path.join(self.test_dir, "eager.parquet")
+        streamed = os.path.join(self.test_dir, "streamed.parquet")
+
+        files_to_parquet.convert_speeches(self.speeches, eager)
+        files_to_parquet.convert_speeches(self.speeches, streamed,
+                                          streaming=True,
+                                          compression="zstd",
+                                          compression_level=10,
+                                          row_group_size=1)
+
+        self.assertTrue(pl.read_parquet(eager)
+                        .equals(pl.read_parquet(streamed)))
+
+    def test_convert_speeches_schema(self):
+        # Test if date and id columns are written with explicit types
+        output = os.path.join(self.test_dir, "speeches.parquet")
+
+        files_to_parquet.convert_speeches(self.speeches, output,
+                                          streaming=True)
+
+        schema = pl.read_parquet_schema(output)
+        self.assertEqual(schema["date"], pl.Date)
+        self.assertEqual(schema["factionId"], pl.Int64)
+        self.assertEqual(schema["politicianId"], pl.Int64)
+        self.assertEqual(schema["year"], pl.Int64)
+
+    def test_convert_speeches_partitioned(self):
+        # Test if the streamed speeches are partitioned by year
+        output = os.path.join(self.test_dir, "speeches")
+
+        files_to_parquet.convert_speeches(self.speeches, output,
+                                          streaming=True,
+                                          partition_by=["year"])
+
+        self.assertListEqual(sorted(os.listdir(output)),
+                             ["year=1949", "year=1950"])
+
+    def tearDown(self):
+        # Clean up the temporary directory
+        shutil.rmtree(self.test_dir)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -19,10 +19,57 @@ Usage:
     python -m unittest discover -s tests
 """
 
+import tempfile
 import unittest
 from unittest.mock import patch, MagicMock
 
+import numpy as np
+from gensim.models import LdaMulticore
+import spacy
+
+from src.LDA import lda_model
 from src.LDA.lda_model import *
+from src.LDA.vocabulary import Vocabulary
+from src.LDA.word_vectors import export_vectors
+
+
+def write_topic_corpus(directory):
+    """
+    Write a small pre-tokenized speeches table of two years, a factions
+    table and word vectors for all words to a directory.
+
+    Returns:
+        tuple: The paths to the speeches, the factions and the vectors.
+    """
+    rng = np.random.default_rng(0)
+    themes = [['Steuer', 'Haushalt', 'Schulden', 'Rente', 'Euro', 'Bank'],
+              ['Panzer', 'Soldat', 'Einsatz', 'Nato', 'Armee', 'Waffe'],
+              ['Klima', 'Kohle', 'Energie', 'Wind', 'Strom', 'Umwelt']]
+
+    rows = {'date': [], 'factionId': [], 'speechContent': [],
+            'speechContent_tokens': []}
+    for year in [2019, 2020]:
+        for i in range(30):
+            tokens = list(rng.choice(themes[i % 3], size=10))
+            rows['date'].append(f'{year}-05-01')
+            rows['factionId'].append(i % 4)
+            rows['speechContent'].append(' '.join(tokens))
+            rows['speechContent_tokens'].append(tokens)
+
+    speeches = os.path.join(directory, 'speeches.parquet')
+    pl.DataFrame(rows).write_parquet(speeches)
+    factions = os.path.join(directory, 'factions.parquet')
+    pl.DataFrame({'id': [0, 1, 2, 3],
+                  'abbreviation': ['SPD', 'CDU/CSU', 'FDP', 'Grüne']}
+                 ).write_parquet(factions)
+
+    nlp = spacy.blank('de')
+    for word in sum(themes, []):
+        nlp.vocab.set_vector(word, rng.random(8, dtype='float32'))
+    vectors = os.path.join(directory, 'vectors')
+    export_vectors(nlp, vectors)
+
+    return speeches, factions, vectors
 
 
 class TestLDAModel(unittest.TestCase):
@@ -58,8 +105,8 @@ class TestLDAModel(unittest.TestCase):
 
         self.assertEqual(data, mock_data.limit.return_value)
 
-    @patch('src.LDA.lda_model.Topic')
-    def test_process_topics_by_year(self, mock_topic):
+    @patch('src.LDA.lda_model.name_topics')
+    def test_process_topics_by_year(self, mock_name_topics):
         """
         Test the process_topics_by_year function.
 
@@ -68,20 +115,21 @@ class TestLDAModel(unittest.TestCase):
         and updates the topics_by_year dictionary accordingly.
 
         Args:
-            mock_topic (MagicMock): Mocked Topic class.
+            mock_name_topics (MagicMock): Mocked name_topics function.
         """
         ldaModel = MagicMock()
         ldaModel.available_years = [2020, 2021]
         ldaModel.generate_topics.return_value = [
-            (['word1', 'word2'], 0.1, ['party1', 'party2'])
-        ]
+            (['word1', 'word2'], 0.1, ['party1', 'party2'],
+             {'party1': 3, 'party2': 1}, {'party1': 0.2, 'party2': 0.1})
+        ] * 2
 
         min_frequency = 5
         used_words = set(["word1"])
         topic_naming_engine = "engine"
 
-        mock_topic_instance = mock_topic.return_value
-        mock_topic_instance.name = 'test_topic'
+        mock_name_topics.side_effect = \
+            lambda word_lists, **kwargs: ['test_topic'] * len(word_lists)
 
         topics_by_year = process_topics_by_year(
             ldaModel,
@@ -90,8 +138,276 @@ class TestLDAModel(unittest.TestCase):
             topic_naming_engine
         )
 
-        self.assertIn(2020, topics_by_year)
-        self.assertIn('test_topic', topics_by_year[2020])
+        self.assertIn('2020', topics_by_year)
+        self.assertIn('test_topic', topics_by_year['2020'])
+        # topics with the same name are merged
+        self.assertEqual(topics_by_year['2020']['test_topic']['party_counts'],
+                         {'party1': 6, 'party2': 2})
+        self.assertEqual(topics_by_year['2020']['test_topic']['party_shares'],
+                         {'party1': 0.4, 'party2': 0.2})
+        mock_name_topics.assert_called_once_with(
+            [['word1', 'word2']] * 4,
+            engine=topic_naming_engine, vectors=None, cache_dir=None)
+
+    def test_process_topics_by_year_jobs(self):
+        """
+        Test if generating the topics of the years in worker processes
+        produces the same topics as the sequential run.
+        """
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            speeches, factions, vectors = write_topic_corpus(tmp_dir)
+            model_kwargs = dict(
+                topic_model='LDA',
+                tokens_column='speechContent_tokens',
+                model_params={'random_state': 1, 'passes': 2},
+                factions_path=factions)
+            ldaModel = TopicModel(load_data(speeches), process=False,
+                                  **model_kwargs)
+
+            results = [
+                process_topics_by_year(
+                    ldaModel, 1, set(), 'list',
+                    vectors=MemmapVectors(vectors), jobs=jobs,
+                    worker_args=(speeches, None, model_kwargs))
+                for jobs in [1, 2]
+            ]
+
+        self.assertListEqual(list(results[0]), ['2019', '2020'])
+        self.assertTrue(results[0]['2019'])
+        self.assertEqual(results[0], results[1])
+
+    def test_init_worker_scans_lazily(self):
+        """
+        Test if a worker scans the speeches lazily
+        and only collects the speeches of a year.
+        """
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            speeches, factions, _ = write_topic_corpus(tmp_dir)
+            lda_model._init_worker(speeches, 45, dict(factions_path=factions))
+            ldaModel = lda_model._worker_model
+
+            self.assertIsInstance(ldaModel.data, pl.LazyFrame)
+            self.assertEqual(len(ldaModel.get_speeches_by_year(2019)), 30)
+            self.assertEqual(len(ldaModel.get_speeches_by_year(2020)), 15)
+
+    def test_process_topics_by_year_streaming(self):
+        """
+        Test if streaming the corpus from disk produces the same
+        topics as holding it in memory.
+        """
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            speeches, factions, vectors = write_topic_corpus(tmp_dir)
+            data = load_data(speeches)
+
+            results = []
+            for corpus_dir in [None, os.path.join(tmp_dir, 'corpus')]:
+                ldaModel = TopicModel(
+                    data, process=False, topic_model='LDA',
+                    tokens_column='speechContent_tokens',
+                    model_params={'random_state': 1},
+                    factions_path=factions, corpus_dir=corpus_dir)
+                results.append(process_topics_by_year(
+                    ldaModel, 1, set(), 'list',
+                    vectors=MemmapVectors(vectors)))
+
+            self.assertTrue(os.path.exists(
+                os.path.join(tmp_dir, 'corpus', '2019', 'corpus.mm')))
+
+        self.assertEqual(results[0], results[1])
+
+    def test_process_topics_by_year_vocabulary(self):
+        """
+        Test if the vocabulary is trained once on all years,
+        persisted, and applied to every year.
+        """
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            speeches, factions, vectors = write_topic_corpus(tmp_dir)
+            model_kwargs = dict(
+                topic_model='LDA',
+                tokens_column='speechContent_tokens',
+                model_params={'random_state': 1},
+                factions_path=factions,
+                vocabulary_dir=os.path.join(tmp_dir, 'vocabulary'))
+
+            ldaModel = TopicModel(load_data(speeches), process=False,
+                                  **model_kwargs)
+            topics_by_year = process_topics_by_year(
+                ldaModel, 1, set(), 'list', vectors=MemmapVectors(vectors))
+            vocabulary = Vocabulary.load(model_kwargs['vocabulary_dir'])
+
+            # a later run loads the persisted vocabulary
+            ldaModel = TopicModel(load_data(speeches), process=False,
+                                  **model_kwargs)
+            with patch.object(Vocabulary, 'build') as mock_build:
+                loaded = ldaModel.get_vocabulary(min_frequency=1)
+
+        mock_build.assert_not_called()
+        self.assertEqual(loaded.dictionary.token2id,
+                         vocabulary.dictionary.token2id)
+        words = {word for topics in topics_by_year.values()
+                 for topic in topics.values() for word in topic['words']}
+        self.assertTrue(words)
+        self.assertTrue(words <= set(vocabulary.dictionary.token2id))
+
+    def test_get_speeches_by_party(self):
+        """
+        Test if the speeches of a party can be looked up
+        by the ID or abbreviation of its faction.
+        """
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            speeches, factions, _ = write_topic_corpus(tmp_dir)
+            data = load_data(speeches)
+            ldaModel = TopicModel(data, process=False, factions_path=factions)
+
+            by_abbreviation = ldaModel.get_speeches_by_party('CDU/CSU')
+            by_id = ldaModel.get_speeches_by_party(
+                1, 'speechContent_tokens')
+
+        expected = data.filter(pl.col('factionId') == 1)
+        self.assertEqual(by_abbreviation,
+                         expected['speechContent'].to_list())
+        self.assertEqual(by_id, expected['speechContent_tokens'].to_list())
+        with self.assertRaises(ValueError):
+            ldaModel.get_speeches_by_party('AfD')
+
+    def test_topic_list(self):
+        """
+        Test if the batched inference and the TopicList give the same
+        shares and party topics as inferring and accumulating the topics
+        of each document separately.
+        """
+        rng = np.random.default_rng(0)
+        words = [f'Wort{i}' for i in range(40)]
+        texts = [list(rng.choice(words, 30)) for _ in range(50)]
+        dictionary = Dictionary(texts)
+        corpus = [dictionary.doc2bow(text) for text in texts]
+        parties = [int(party) for party in rng.integers(0, 4, 50)]
+        # a small prior gives shares that Gensim omits
+        model = LdaModel(corpus, id2word=dictionary, num_topics=4,
+                         alpha=1e-9, random_state=1)
+
+        model.random_state = np.random.RandomState(2)
+        documents = [model.get_document_topics(doc_bow, minimum_probability=0)
+                     for doc_bow in corpus]
+        model.random_state = np.random.RandomState(2)
+        topic_distributions = infer_document_topics(model, corpus,
+                                                    chunksize=7)
+        topic_list = TopicList({}, topic_distributions, parties)
+
+        shares, counts, party_topics = {}, {}, {}
+        for document, party in zip(documents, parties):
+            for topic_id, share in document:
+                shares[topic_id] = shares.get(topic_id, 0) + share
+                counts[topic_id] = counts.get(topic_id, 0) + 1
+            main_topic = max(document, key=lambda x: x[1])[0]
+            party_topics.setdefault(main_topic, set()).add(party)
+
+        self.assertEqual(topic_distributions.shape, (50, 4))
+        self.assertLess(sum(counts.values()), topic_distributions.size)
+        self.assertEqual(topic_list.topics_parties, party_topics)
+        self.assertEqual(topic_list.party_ids, sorted(set(parties)))
+        self.assertEqual(topic_list.party_topic_counts.sum(), 50)
+        for idx, party in enumerate(topic_list.party_ids):
+            for topic_id, share in enumerate(
+                    topic_list.party_topic_shares[idx]):
+                self.assertEqual(
+                    topic_list.party_topic_counts[idx, topic_id] > 0,
+                    party in party_topics.get(topic_id, set()))
+                party_mass = [dict(document).get(topic_id, 0)
+                              for document, doc_party in zip(documents,
+                                                             parties)
+                              if doc_party == party]
+                self.assertAlmostEqual(share, np.mean(party_mass), places=5)
+        self.assertEqual(set(topic_list.average_share_of_topic),
+                         set(shares))
+        for topic_id, share in shares.items():
+            self.assertAlmostEqual(
+                topic_list.average_share_of_topic[topic_id],
+                share / counts[topic_id], places=5)
+
+    def test_topic_list_negative_weights(self):
+        """
+        Test if the negative topic weights of LSI models are counted.
+        """
+        topic_list = TopicList({}, [[0.5, -0.25], [0.5, 1e-9]], [0, 1])
+
+        self.assertEqual(topic_list.average_share_of_topic,
+                         {0: 0.5, 1: -0.25})
+
+    def test_infer_document_topics_other_models(self):
+        """
+        Test if the topic matrix of a model without batched inference
+        has a column for every topic, even if the last topics don't
+        occur in any document.
+        """
+        model = MagicMock(num_topics=4)
+        model.__getitem__.side_effect = lambda doc_bow: [(0, 0.6), (1, 0.4)]
+
+        topic_distributions = infer_document_topics(model, [[(0, 1)]] * 3)
+
+        np.testing.assert_allclose(topic_distributions,
+                                   [[0.6, 0.4, 0, 0]] * 3)
+
+    def test_update_year(self):
+        """
+        Test if updating a year trains its persisted model on the new
+        speeches only, with the passes of the model parameters, and
+        replaces only the topics of that year.
+        """
+        for topic_model, model_class in [('LDA', LdaModel),
+                                         ('LDA-MULTICORE', LdaMulticore)]:
+            with self.subTest(topic_model=topic_model):
+                self.check_update_year(topic_model, model_class)
+
+    def check_update_year(self, topic_model, model_class):
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            speeches, factions, vectors = write_topic_corpus(tmp_dir)
+            vectors = MemmapVectors(vectors)
+            model_kwargs = dict(
+                topic_model=topic_model,
+                tokens_column='speechContent_tokens',
+                model_params={'random_state': 1, 'passes': 1,
+                              'iterations': None, 'workers': 1},
+                factions_path=factions,
+                model_dir=os.path.join(tmp_dir, 'models'))
+
+            data = load_data(speeches)
+            ldaModel = TopicModel(data, process=False, **model_kwargs)
+            self.assertIsNone(TopicModel(
+                data, process=False, factions_path=factions,
+                tokens_column='speechContent_tokens').get_texts(2020)[2])
+            topics_by_year = process_topics_by_year(
+                ldaModel, 1, set(), 'list', vectors=vectors)
+            topics_2019 = topics_by_year['2019']
+
+            model, _, _, seen = ldaModel.model_store.load('2020')
+            num_updates = model.num_updates
+
+            # repeated speeches are new speeches as well
+            new_speeches = data.filter(pl.col('date').str.starts_with('2020'))
+            model_kwargs['model_params']['passes'] = 2
+            ldaModel = TopicModel(pl.concat([data, new_speeches]),
+                                  process=False, **model_kwargs)
+
+            # only the new speeches are read for the update
+            texts = list(ldaModel.get_texts(2020, seen=seen)[0])
+            self.assertEqual(len(texts), new_speeches.height)
+
+            topics_by_year = update_year(ldaModel, 2020, 1, topics_by_year,
+                                         set(), 'list', vectors=vectors)
+
+            model, _, _, updated = ldaModel.model_store.load('2020')
+            corpus, parties = ldaModel.model_store.load_corpus('2020')
+
+        self.assertIs(type(model), model_class)
+        self.assertIs(topics_by_year['2019'], topics_2019)
+        self.assertTrue(topics_by_year['2020'])
+        self.assertEqual(len(updated), len(seen) + new_speeches.height)
+        self.assertEqual(len(corpus), len(updated))
+        self.assertEqual(len(parties), len(updated))
+        self.assertEqual(model.num_updates,
+                         num_updates + new_speeches.height)
+        self.assertEqual(model.passes, 2)
 
     @patch('builtins.open', new_callable=unittest.mock.mock_open)
     @patch('json.dump')
@@ -146,6 +462,27 @@ class TestLDAModel(unittest.TestCase):
         args.n_rows = None
         args.output = 'output.json'
         args.topic_naming_engine = 'engine'
+        args.tokens_column = 'speechContent_tokens'
+        args.n_process = 2
+        args.batch_size = 64
+        args.exclude = ['parser', 'ner']
+        args.lemma_cache = 'lemma_cache'
+        args.vectors = None
+        args.passes = 5
+        args.iterations = None
+        args.chunksize = 1000
+        args.alpha = 'auto'
+        args.eta = None
+        args.random_state = 42
+        args.workers = 3
+        args.eval_every = None
+        args.filename1 = 'factions.parquet'
+        args.jobs = 1
+        args.model_dir = None
+        args.update_year = None
+        args.corpus_dir = None
+        args.vocabulary_dir = None
+        args.statistics = True
 
         mock_load_data.return_value = MagicMock()
         mock_TopicModel.return_value = MagicMock()
@@ -155,9 +492,24 @@ class TestLDAModel(unittest.TestCase):
         mock_load_data.assert_called_once_with(
             args.filename, args.n_rows)
         mock_TopicModel.assert_called_once_with(
-            mock_load_data.return_value, process=False, topic_model=args.model)
+            mock_load_data.return_value, process=False, topic_model=args.model,
+            tokens_column=args.tokens_column, n_process=args.n_process,
+            batch_size=args.batch_size, exclude=args.exclude,
+            lemma_cache=args.lemma_cache,
+            model_params={'passes': 5, 'iterations': None, 'chunksize': 1000,
+                          'alpha': 'auto', 'eta': None, 'random_state': 42,
+                          'workers': 3, 'eval_every': None},
+            factions_path=args.filename1, model_dir=args.model_dir,
+            corpus_dir=args.corpus_dir,
+            vocabulary_dir=args.vocabulary_dir,
+            dataset_path=args.filename)
         mock_save_topics.assert_called_once()
 
+        # the statistics of the first rows are not persisted
+        args.n_rows = 100
+        main(args)
+        self.assertIsNone(mock_TopicModel.call_args.kwargs['dataset_path'])
+
 
 if __name__ == '__main__':
     unittest.main()
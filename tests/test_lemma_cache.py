@@ -0,0 +1,209 @@
+"""
+Title: test_lemma_cache.py
+
+Description:
+    This file contains unit tests
+    for the lemma cache of the LDA model.
+
+Usage:
+    Run all tests using\n
+    python -m unittest discover -s tests
+"""
+
+import os
+import tempfile
+import unittest
+from unittest.mock import patch
+
+import polars as pl
+import spacy
+from spacy.language import Language
+
+from src.LDA.lda_model import TopicModel
+from src.LDA.lemma_cache import LemmaCache
+
+
+# texts tagged by the capitalized_nouns component
+parsed_texts = []
+
+
+@Language.component("capitalized_nouns")
+def capitalized_nouns(doc):
+    """
+    Tag capitalized tokens as nouns, in place of a trained pipeline.
+    """
+    parsed_texts.append(doc.text)
+    for token in doc:
+        token.pos_ = "NOUN" if token.text[0].isupper() else "X"
+        token.lemma_ = token.text
+    return doc
+
+
+class TestLemmaCache(unittest.TestCase):
+    """
+    Unit tests for the LemmaCache class and its use by the TopicModel.
+    """
+
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tmp_dir.name, 'lemmas')
+
+    def tearDown(self):
+        self.tmp_dir.cleanup()
+
+    def test_put_save_load(self):
+        """
+        Test if saved lemmas are served by a new cache instance.
+        """
+        cache = LemmaCache(self.path, 'de_core_news_lg', '3.7.0', ['NOUN'])
+        cache.put(['Der Bundestag tagt', ''], [['Bundestag'], []])
+        cache.save()
+
+        cache = LemmaCache(self.path, 'de_core_news_lg', '3.7.0', ['NOUN'])
+
+        self.assertEqual(len(cache), 2)
+        self.assertListEqual(
+            cache.get(['', 'Der Bundestag tagt', 'Neue Rede']),
+            [[], ['Bundestag'], None])
+
+    def test_save_keeps_entries_of_other_processes(self):
+        """
+        Test if saving keeps entries another cache instance has
+        written to the same directory in the meantime.
+        """
+        first = LemmaCache(self.path, 'de_core_news_lg', '3.7.0', ['NOUN'])
+        second = LemmaCache(self.path, 'de_core_news_lg', '3.7.0', ['NOUN'])
+
+        first.put(['Der Bundestag tagt'], [['Bundestag']])
+        first.save()
+        second.put(['Die Regierung spricht'], [['Regierung']])
+        second.save()
+
+        cache = LemmaCache(self.path, 'de_core_news_lg', '3.7.0', ['NOUN'])
+        self.assertListEqual(
+            cache.get(['Der Bundestag tagt', 'Die Regierung spricht']),
+            [['Bundestag'], ['Regierung']])
+
+    def test_save_appends_shards(self):
+        """
+        Test if every save writes only the new entries to a new shard,
+        and if compacting merges the shards into one.
+        """
+        cache = LemmaCache(self.path, 'de_core_news_lg', '3.7.0', ['NOUN'])
+        cache.put(['Der Bundestag tagt'], [['Bundestag']])
+        cache.save()
+        cache.save()  # nothing new to write
+        cache.put(['Die Regierung spricht'], [['Regierung']])
+        cache.save()
+
+        shards = LemmaCache.shards(self.path)
+        self.assertEqual(len(shards), 2)
+        self.assertListEqual(
+            sorted(len(pl.read_parquet(shard)) for shard in shards), [1, 1])
+
+        LemmaCache.compact(self.path)
+
+        self.assertEqual(len(LemmaCache.shards(self.path)), 1)
+        cache = LemmaCache(self.path, 'de_core_news_lg', '3.7.0', ['NOUN'])
+        self.assertListEqual(
+            cache.get(['Der Bundestag tagt', 'Die Regierung spricht']),
+            [['Bundestag'], ['Regierung']])
+
+    def test_save_compacts_shards(self):
+        """
+        Test if a save merges the shards once there are too many,
+        and if lookups only return the requested entries.
+        """
+        cache = LemmaCache(self.path, 'de_core_news_lg', '3.7.0', ['NOUN'])
+        texts = ['Der Bundestag tagt', 'Die Regierung spricht',
+                 'Eine neue Rede']
+        with patch('src.LDA.lemma_cache.MAX_SHARDS', 2):
+            for text in texts:
+                cache.put([text], [[text.split()[1]]])
+                cache.save()
+
+        self.assertEqual(len(LemmaCache.shards(self.path)), 1)
+        cache = LemmaCache(self.path, 'de_core_news_lg', '3.7.0', ['NOUN'])
+        self.assertEqual(len(cache), 3)
+        self.assertListEqual(cache.get(['Eine neue Rede', 'Keine Rede']),
+                             [['neue'], None])
+
+    def test_key_depends_on_model_and_filter(self):
+        """
+        Test if a different model version, POS filter or set of excluded
+        components doesn't serve lemmas cached for another configuration.
+        """
+        cache = LemmaCache(self.path, 'de_core_news_lg', '3.7.0', ['NOUN'],
+                           ['ner', 'parser'])
+        cache.put(['Der Bundestag tagt'], [['Bundestag']])
+        cache.save()
+
+        cache = LemmaCache(self.path, 'de_core_news_lg', '3.7.0', ['NOUN'],
+                           ['parser', 'ner'])
+        self.assertListEqual(cache.get(['Der Bundestag tagt']),
+                             [['Bundestag']])
+
+        for version, pos_filter, exclude in [
+                ('3.8.0', ['NOUN'], ['ner', 'parser']),
+                ('3.7.0', ['NOUN', 'PROPN'], ['ner', 'parser']),
+                ('3.7.0', ['NOUN'], ['ner'])]:
+            cache = LemmaCache(self.path, 'de_core_news_lg', version,
+                               pos_filter, exclude)
+            self.assertListEqual(cache.get(['Der Bundestag tagt']), [None])
+
+    def test_topic_model_parses_only_new_speeches(self):
+        """
+        Test if the TopicModel only parses speeches missing in the cache.
+        """
+        nlp = spacy.blank('de')
+        nlp.add_pipe('capitalized_nouns')
+
+        model = TopicModel.__new__(TopicModel)
+        model.nlp = nlp
+        model.batch_size = 2
+        model.n_process = 1
+        model.exclude = []
+        model.lemma_cache = LemmaCache.for_model(self.path, nlp, ['NOUN'])
+
+        texts = ['Der Bundestag tagt', 'Die Regierung spricht']
+        self.assertListEqual(model.get_lemmas(texts),
+                             [['Der', 'Bundestag'], ['Die', 'Regierung']])
+
+        model.lemma_cache = LemmaCache.for_model(self.path, nlp, ['NOUN'])
+        parsed_texts.clear()
+        lemmas = model.get_lemmas(texts + ['Eine neue Rede'])
+
+        self.assertListEqual(lemmas, [['Der', 'Bundestag'],
+                                      ['Die', 'Regierung'],
+                                      ['Eine', 'Rede']])
+        self.assertListEqual(parsed_texts, ['Eine neue Rede'])
+
+    def test_topic_model_tags_lazily(self):
+        """
+        Test if the TopicModel only tags the speeches
+        of a chunk once its lemmas are consumed.
+        """
+        nlp = spacy.blank('de')
+        nlp.add_pipe('capitalized_nouns')
+
+        model = TopicModel.__new__(TopicModel)
+        model.nlp = nlp
+        model.batch_size = 2
+        model.n_process = 1
+        model.lemma_cache = None
+        model.lemma_cache_path = None
+
+        texts = ['Der Bundestag tagt', 'Die Regierung spricht',
+                 'Eine neue Rede']
+        parsed_texts.clear()
+        with patch('src.LDA.lda_model.LEMMA_CHUNKSIZE', 2):
+            lemmas = model.iter_lemmas(iter(texts))
+            self.assertListEqual(next(lemmas), ['Der', 'Bundestag'])
+            self.assertListEqual(parsed_texts, texts[:2])
+            self.assertListEqual(list(lemmas), [['Die', 'Regierung'],
+                                                ['Eine', 'Rede']])
+        self.assertListEqual(parsed_texts, texts)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -61,7 +61,8 @@ class TestMergeTables(unittest.TestCase):
             table1_foreign_key_column_name='id',
             data_columns=['extra_info'],
             id='uid',
-            output='dummy_out.parquet'
+            output='dummy_out.parquet',
+            partition_by=None
         )
 
         # Call the main function
@@ -74,7 +75,8 @@ class TestMergeTables(unittest.TestCase):
             'id',
             ['extra_info'],
             'uid',
-            'dummy_out.parquet'
+            'dummy_out.parquet',
+            None
         )
 
     def tearDown(self):
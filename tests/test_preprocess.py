@@ -0,0 +1,72 @@
+import unittest
+
+import polars as pl
+
+import src.clean_text as clean_text
+import src.preprocess as preprocess
+import src.remove_punctuation as remove_punctuation
+import src.remove_stopwords as remove_stopwords
+import src.remove_whitespaces as remove_whitespaces
+import src.stemming as stemming
+
+
+class TestPreprocess(unittest.TestCase):
+
+    def setUp(self):
+        # Create a sample DataFrame for testing
+        self.df = pl.DataFrame({
+            "speech_id": [1, 2, 3],
+            "speech": [
+                "Herr Präsident!\nMeine Damen und Herren! ({Beifall})",
+                "Der Bundestag hat\n{abc}  heute beschlossen.",
+                ""
+            ]
+        })
+
+        self.stopwords_file = "data/custom_stopwords.txt"
+
+    def test_preprocess_matches_single_stages(self):
+        # Test if the fused pipeline produces the same text as
+        # applying the single stages one after another
+        expected_df = clean_text.clean_text(self.df, "speech")
+        expected_df = remove_stopwords.remove_stopwords(
+            self.stopwords_file, expected_df, "speech")
+        expected_df = remove_whitespaces.remove_whitespaces(
+            expected_df, "speech")
+        expected_df = stemming.stemming(expected_df, "speech")
+        expected_df = remove_punctuation.remove_punctuation(
+            expected_df, "speech")
+
+        preprocessed_df = preprocess.preprocess(self.stopwords_file,
+                                                self.df, "speech")
+
+        self.assertListEqual(preprocessed_df["speech"].to_list(),
+                             expected_df["speech"].to_list())
+
+    def test_preprocess_lazy(self):
+        # Test if the lazy plan produces the same result as the
+        # eager pipeline
+        preprocessed_df = preprocess.preprocess(self.stopwords_file,
+                                                self.df, "speech")
+        preprocessed_lf = preprocess.preprocess(self.stopwords_file,
+                                                self.df.lazy(), "speech")
+
+        self.assertIsInstance(preprocessed_lf, pl.LazyFrame)
+        self.assertTrue(preprocessed_lf.collect().equals(preprocessed_df))
+
+    def test_preprocess_keep_intermediate_columns(self):
+        # Test if the requested intermediate stages are kept
+        preprocessed_df = preprocess.preprocess(self.stopwords_file,
+                                                self.df, "speech",
+                                                keep=["cleaned", "stemmed"])
+
+        self.assertListEqual(preprocessed_df.columns,
+                             ["speech_id", "speech", "speech_cleaned",
+                              "speech_stemmed"])
+        self.assertListEqual(
+            preprocessed_df["speech_cleaned"].to_list(),
+            clean_text.clean_text(self.df, "speech")["speech"].to_list())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -54,6 +54,17 @@ class TestRemovePunctuation(unittest.TestCase):
         self.assertListEqual(cleaned_df.columns, ["speech_id", "speech"])
         self.assertEqual(cleaned_df.height, 3)
 
+    def test_remove_punctuation_lazy(self):
+        # Test if a LazyFrame is processed into a lazy query plan with
+        # the same result as the eager DataFrame
+        cleaned_df = (remove_punctuation
+                      .remove_punctuation(self.df, "speech"))
+        cleaned_lf = (remove_punctuation
+                      .remove_punctuation(self.df.lazy(), "speech"))
+
+        self.assertIsInstance(cleaned_lf, pl.LazyFrame)
+        self.assertTrue(cleaned_lf.collect().equals(cleaned_df))
+
 
 if __name__ == "__main__":
     unittest.main()
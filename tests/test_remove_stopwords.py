@@ -65,6 +65,48 @@ class TestRemoveStopwords(unittest.TestCase):
         self.assertListEqual(cleaned_df.columns, ["speech_id", "speech"])
         self.assertEqual(cleaned_df.height, 3)
 
+    def test_remove_stopwords_lazy(self):
+        # Test if a LazyFrame is processed into a lazy query plan with
+        # the same result as the eager DataFrame
+        cleaned_df = (remove_stopwords
+                      .remove_stopwords(self.stopwords_file, self.df,
+                                        "speech"))
+        cleaned_lf = (remove_stopwords
+                      .remove_stopwords(self.stopwords_file,
+                                        self.df.lazy(), "speech"))
+
+        self.assertIsInstance(cleaned_lf, pl.LazyFrame)
+        self.assertTrue(cleaned_lf.collect().equals(cleaned_df))
+
+    def test_remove_stopwords_set_engine(self):
+        # Test if the set engine produces the same text as the
+        # regex engine
+        df = self.df.vstack(pl.DataFrame({
+            "speech_id": [4, 5, 6, 7],
+            "speech": [
+                "Meine Damen und Herren! Wir haben, DASS wir es tun.",
+                "Frau Kollegin Müller-Lüdenscheidt, über 3 Anträge.",
+                "",
+                None
+            ]
+        }))
+
+        regex_df = (remove_stopwords
+                    .remove_stopwords(self.stopwords_file, df, "speech",
+                                      engine="regex"))
+        set_df = (remove_stopwords
+                  .remove_stopwords(self.stopwords_file, df, "speech",
+                                    engine="set"))
+
+        self.assertListEqual(set_df["speech"].to_list(),
+                             regex_df["speech"].to_list())
+
+    def test_remove_stopwords_unknown_engine(self):
+        # Test if an unknown engine is rejected
+        with self.assertRaises(ValueError):
+            remove_stopwords.remove_stopwords(self.stopwords_file, self.df,
+                                              "speech", engine="trie")
+
 
 if __name__ == "__main__":
     unittest.main()
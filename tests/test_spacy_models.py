@@ -0,0 +1,64 @@
+"""
+Title: test_spacy_models.py
+
+Description:
+    This file contains unit tests
+    for the spaCy model registry.
+
+Usage:
+    Run all tests using\n
+    python -m unittest discover -s tests
+"""
+
+import unittest
+from unittest.mock import patch
+
+import spacy
+
+from src.LDA import spacy_models
+from src.LDA.topic_naming import Topic
+
+
+class TestSpacyModels(unittest.TestCase):
+    """
+    Unit tests for the functions in the spacy_models module.
+    """
+
+    def tearDown(self):
+        spacy_models.clear_models()
+
+    @patch('src.LDA.spacy_models._loader')
+    def test_load_model_once(self, mock_loader):
+        """
+        Test if a pipeline is loaded only once per
+        model name and set of excluded components.
+        """
+        mock_loader.side_effect = lambda name, exclude: spacy.blank('de')
+
+        nlp = spacy_models.load_model('de_core_news_lg', ['parser', 'ner'])
+
+        self.assertIs(
+            spacy_models.load_model('de_core_news_lg', ['ner', 'parser']),
+            nlp)
+        self.assertIsNot(
+            spacy_models.load_model('de_core_news_lg', []), nlp)
+        self.assertEqual(mock_loader.call_count, 2)
+
+    @patch('src.LDA.spacy_models._loader')
+    def test_register_model(self, mock_loader):
+        """
+        Test if an injected pipeline is shared by all topics
+        without loading the model.
+        """
+        nlp = spacy.blank('de')
+        spacy_models.register_model(nlp)
+
+        topics = [Topic(['Steuer']), Topic(['Bundeswehr'])]
+
+        for topic in topics:
+            self.assertIs(topic.nlp, nlp)
+        mock_loader.assert_not_called()
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,116 @@
+import datetime
+import os
+import shutil
+import tempfile
+import unittest
+
+import polars as pl
+
+import src.speeches_io as speeches_io
+
+
+class TestSpeechesIO(unittest.TestCase):
+
+    def setUp(self):
+        # Create a temporary directory and a sample speeches DataFrame
+        self.test_dir = tempfile.mkdtemp()
+        self.df = pl.DataFrame({
+            "id": [1, 2, 3],
+            "speechContent": ["Erste Rede", "Zweite Rede", "Dritte Rede"],
+            "date": [datetime.date(1949, 9, 7),
+                     datetime.date(1949, 10, 1),
+                     datetime.date(1950, 1, 2)],
+        })
+        self.dataset = os.path.join(self.test_dir, "speeches")
+
+    def test_write_partitioned_layout(self):
+        # Test if one hive-style directory is written per year
+        speeches_io.write_speeches(self.df, self.dataset, ["year"])
+
+        self.assertTrue(speeches_io.is_partitioned(self.dataset))
+        self.assertListEqual(sorted(os.listdir(self.dataset)),
+                             ["year=1949", "year=1950"])
+
+    def test_scan_partitioned_roundtrip(self):
+        # Test if a lazily written dataset can be read back completely
+        speeches_io.write_speeches(self.df.lazy(), self.dataset, ["year"])
+
+        result = (speeches_io.scan_speeches(self.dataset)
+                  .collect()
+                  .sort("id"))
+
+        self.assertListEqual(result["speechContent"].to_list(),
+                             self.df["speechContent"].to_list())
+        self.assertListEqual(result["year"].to_list(), [1949, 1949, 1950])
+
+    def test_scan_partitioned_single_year(self):
+        # Test if a filter on the year only scans that partition
+        speeches_io.write_speeches(self.df, self.dataset, ["year"])
+
+        query = (speeches_io.scan_speeches(self.dataset)
+                 .filter(pl.col("year") == 1950))
+
+        self.assertNotIn("year=1949", query.explain())
+        self.assertListEqual(query.collect()["id"].to_list(), [3])
+
+    def test_write_partitioned_lazy_single_pass(self):
+        # Test if the plan of a LazyFrame is executed only once
+        # for all partitions and no staging file is left behind
+        calls = []
+
+        def mark(text):
+            calls.append(text)
+            return text
+
+        source = os.path.join(self.test_dir, "source.parquet")
+        self.df.write_parquet(source)
+        speeches = pl.scan_parquet(source).with_columns(
+            pl.col("speechContent").map_elements(mark, return_dtype=pl.String))
+        speeches_io.write_speeches(speeches, self.dataset, ["year"])
+
+        self.assertEqual(len(calls), self.df.height)
+        self.assertListEqual(sorted(os.listdir(self.test_dir)),
+                             ["source.parquet", "speeches"])
+        result = speeches_io.scan_speeches(self.dataset).collect().sort("id")
+        self.assertListEqual(result["speechContent"].to_list(),
+                             self.df["speechContent"].to_list())
+
+    def test_write_single_file(self):
+        # Test if speeches are written to a single file without partitions
+        output = os.path.join(self.test_dir, "speeches.parquet")
+        speeches_io.write_speeches(self.df, output)
+
+        self.assertFalse(speeches_io.is_partitioned(output))
+        self.assertTrue(speeches_io.scan_speeches(output).collect()
+                        .equals(self.df))
+
+    def test_with_date_columns(self):
+        # Test if date strings are parsed and the year is derived
+        speeches = pl.DataFrame({
+            "date": ["1949-09-07", "1950-01-02T00:00:00"],
+            "electoralTerm": ["1", "1"],
+        })
+
+        result = speeches_io.with_date_columns(speeches.lazy()).collect()
+
+        self.assertEqual(result.schema["date"], pl.Date)
+        self.assertListEqual(result["date"].to_list(),
+                             [datetime.date(1949, 9, 7),
+                              datetime.date(1950, 1, 2)])
+        self.assertListEqual(result["year"].to_list(), [1949, 1950])
+        self.assertListEqual(result["electoralTerm"].to_list(), [1, 1])
+
+    def test_with_date_columns_typed(self):
+        # Test if typed date columns are left unchanged
+        speeches = self.df.with_columns(
+            pl.col("date").dt.year().cast(pl.Int64).alias("year"))
+
+        self.assertIs(speeches_io.with_date_columns(speeches), speeches)
+
+    def tearDown(self):
+        # Clean up the temporary directory
+        shutil.rmtree(self.test_dir)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,4 +1,6 @@
+import tempfile
 import unittest
+from unittest.mock import patch
 
 import polars as pl
 
@@ -51,6 +53,119 @@ class TestStemming(unittest.TestCase):
         self.assertListEqual(stemmed_df.columns, ["speech_id", "speech"])
         self.assertEqual(stemmed_df.height, 3)
 
+    def test_stemming_lazy(self):
+        # Test if a LazyFrame is processed into a lazy query plan with
+        # the same result as the eager DataFrame
+        stemmed_df = stemming.stemming(self.df, "speech")
+        stemmed_lf = stemming.stemming(self.df.lazy(), "speech")
+
+        self.assertIsInstance(stemmed_lf, pl.LazyFrame)
+        self.assertTrue(stemmed_lf.collect().equals(stemmed_df))
+
+    def test_stemming_modes(self):
+        # Test if the cached and vocabulary modes produce the same
+        # text as stemming every token
+        df = self.df.vstack(pl.DataFrame({
+            "speech_id": [4, 5],
+            "speech": ["Die Sonne schien, die Sonne scheint.", ""]
+        }))
+
+        expected_speeches = stemming.stemming(df, "speech")["speech"]
+
+        for mode in ["cache", "vocabulary"]:
+            stemmed_df = stemming.stemming(df, "speech", mode=mode)
+            self.assertListEqual(stemmed_df["speech"].to_list(),
+                                 expected_speeches.to_list())
+
+    def test_stemming_vocabulary_lazy(self):
+        # Test if the vocabulary mode processes a LazyFrame
+        stemmed_df = stemming.stemming(self.df, "speech")
+        stemmed_lf = stemming.stemming(self.df.lazy(), "speech",
+                                       mode="vocabulary")
+
+        self.assertIsInstance(stemmed_lf, pl.LazyFrame)
+        self.assertTrue(stemmed_lf.collect().equals(stemmed_df))
+
+    def test_stemming_vocabulary_lazy_single_pass(self):
+        # Test if the upstream query of a LazyFrame only runs once
+        # when the tokens are staged, and if the staged tokens are
+        # removed with the staging directory
+        calls = []
+
+        def upstream(speech):
+            calls.append(speech)
+            return speech
+
+        speeches = self.df.lazy().with_columns(
+            pl.col("speech").map_elements(upstream, return_dtype=pl.String))
+
+        with tempfile.TemporaryDirectory() as staging_dir:
+            stemmed_lf = stemming.stemming(speeches, "speech",
+                                           mode="vocabulary",
+                                           tokenizer="polars",
+                                           staging_dir=staging_dir)
+            stemmed_lf.collect()
+            self.assertEqual(len(calls), self.df.height)
+
+            # the fallback also reads the written tokens
+            calls.clear()
+            stemming.stemming(speeches, "speech", mode="vocabulary",
+                              max_types=2, tokenizer="polars",
+                              staging_dir=staging_dir).collect()
+            self.assertEqual(len(calls), self.df.height)
+
+        # without a staging directory, building the plan writes nothing
+        with patch("polars.LazyFrame.sink_parquet") as sink_parquet:
+            stemming.stemming(speeches, "speech", mode="vocabulary")
+        sink_parquet.assert_not_called()
+
+    def test_stemming_vocabulary_fallback(self):
+        # Test if the vocabulary mode falls back to the LRU cache
+        # if there are more token types than allowed
+        stemmed_df = stemming.stemming(self.df, "speech",
+                                       mode="vocabulary", max_types=2)
+
+        self.assertTrue(stemmed_df.equals(
+            stemming.stemming(self.df, "speech")))
+
+    def test_stemming_workers(self):
+        # Test if stemming in worker processes produces the same text
+        # in the original order
+        expected_df = stemming.stemming(self.df, "speech")
+
+        for mode in stemming.STEMMING_MODES:
+            stemmed_df = stemming.stemming(self.df, "speech", mode=mode,
+                                           workers=2)
+            self.assertTrue(stemmed_df.equals(expected_df))
+
+    def test_stemming_polars_tokenizer(self):
+        # Test if the Polars tokenizer produces the same stems as NLTK's
+        # word_tokenize in every mode, with and without worker processes
+        expected_df = stemming.stemming(self.df, "speech")
+
+        for mode in stemming.STEMMING_MODES:
+            for workers in [1, 2]:
+                stemmed_df = stemming.stemming(self.df, "speech", mode=mode,
+                                               workers=workers,
+                                               tokenizer="polars")
+                self.assertTrue(stemmed_df.equals(expected_df))
+
+    def test_stemming_unknown_tokenizer(self):
+        # Test if an unknown tokenizer is rejected
+        with self.assertRaises(ValueError):
+            stemming.stemming(self.df, "speech", tokenizer="spacy")
+
+    def test_chunked_process_pool_order(self):
+        # Test if chunks processed by the pool are reassembled in order
+        pool = stemming.ChunkedProcessPool(stemming._stem_chunk, pl.String,
+                                           workers=2, chunk_size=1)
+
+        stemmed = pool(self.df["speech"])
+
+        self.assertListEqual(
+            stemmed.to_list(),
+            stemming.stemming(self.df, "speech")["speech"].to_list())
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,68 @@
+"""
+Title: test_streaming_corpus.py
+
+Description:
+    This file contains unit tests
+    for the streaming corpus of the LDA model.
+
+Usage:
+    Run all tests using\n
+    python -m unittest discover -s tests
+"""
+
+import os
+import tempfile
+import unittest
+
+from gensim.corpora import Dictionary
+from gensim.models.phrases import Phrases
+
+from src.LDA.streaming_corpus import TokenFile, stream_corpus
+
+
+TEXTS = [
+    ['Klima', 'Schutz', 'Energie', 'Wende'],
+    [],
+    ['Energie', 'Wende', 'Klima', 'Schutz', 'Rente'],
+    ['Rente', 'Energie', 'Wende'],
+] * 5
+
+
+class TestStreamingCorpus(unittest.TestCase):
+
+    def test_token_file(self):
+        """
+        Test if a token file can be iterated repeatedly,
+        keeping empty documents.
+        """
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            tokens = TokenFile.write(os.path.join(tmp_dir, 'tokens.txt'),
+                                     iter(TEXTS))
+
+            self.assertEqual(list(tokens), TEXTS)
+            self.assertEqual(list(tokens), TEXTS)
+
+    def test_stream_corpus(self):
+        """
+        Test if the streamed corpus equals the one built in memory.
+        """
+        phrases = Phrases(TEXTS).freeze()
+        texts = [phrases[text] for text in TEXTS]
+        dictionary = Dictionary(texts)
+        dictionary.filter_extremes(no_below=2)
+        corpus = [dictionary.doc2bow(text) for text in texts]
+
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            streamed = stream_corpus(iter(TEXTS), tmp_dir,
+                                     min_frequency=2)
+            streamed_vocabulary, streamed_corpus = streamed
+
+            self.assertEqual(streamed_vocabulary.dictionary.token2id,
+                             dictionary.token2id)
+            self.assertEqual(
+                [[(i, int(n)) for i, n in doc] for doc in streamed_corpus],
+                corpus)
+
+
+if __name__ == '__main__':
+    unittest.main()
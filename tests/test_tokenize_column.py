@@ -0,0 +1,100 @@
+import tempfile
+import unittest
+
+import polars as pl
+import spacy
+from spacy.language import Language
+
+import src.tokenize_column as tokenize_column
+
+
+@Language.component("capitalization_tagger")
+def capitalization_tagger(doc):
+    # Tag capitalized tokens as nouns and use the lowercased
+    # text as lemma, in place of a trained German pipeline
+    for token in doc:
+        token.pos_ = "NOUN" if token.text[0].isupper() else "X"
+        token.lemma_ = token.text.lower()
+    return doc
+
+
+class TestTokenizeColumn(unittest.TestCase):
+
+    def setUp(self):
+        self.nlp = spacy.blank("de")
+        self.nlp.add_pipe("capitalization_tagger")
+
+        # Create a sample DataFrame for testing
+        self.df = pl.DataFrame({
+            "speech_id": [1, 2, 3, 4],
+            "speech": [
+                "Die Regierung hat den Haushalt heute beschlossen",
+                "Danke",
+                None,
+                "Der Bundestag tagt"
+            ]
+        })
+
+    def test_lemmatize(self):
+        # Test if all lemmas are returned in the original order
+        # although the texts are processed sorted by length
+        lemmas = tokenize_column.lemmatize(self.df["speech"].to_list(),
+                                           self.nlp, batch_size=1)
+
+        self.assertListEqual(lemmas, [
+            ["die", "regierung", "hat", "den", "haushalt", "heute",
+             "beschlossen"],
+            ["danke"],
+            None,
+            ["der", "bundestag", "tagt"]
+        ])
+
+    def test_lemmatize_pos_filter(self):
+        # Test if only tokens with the given tags are kept
+        lemmas = tokenize_column.lemmatize(self.df["speech"].to_list(),
+                                           self.nlp, pos_filter=["NOUN"])
+
+        self.assertListEqual(lemmas, [
+            ["die", "regierung", "haushalt"],
+            ["danke"],
+            None,
+            ["der", "bundestag"]
+        ])
+
+    def test_tokenize_column(self):
+        # Test if the lemmas are added as a list column to the speeches
+        tokenized_df = tokenize_column.tokenize_column(
+            self.df.lazy(), "speech", self.nlp, pos_filter=["NOUN"])
+
+        self.assertListEqual(tokenized_df.columns,
+                             ["speech_id", "speech", "speech_tokens"])
+        self.assertEqual(tokenized_df.schema["speech_tokens"],
+                         pl.List(pl.String))
+        self.assertListEqual(tokenized_df["speech_tokens"][3].to_list(),
+                             ["der", "bundestag"])
+
+    def test_lemmatize_chunks(self):
+        # Test if lemmatizing in chunks keeps the order of the texts
+        self.assertListEqual(
+            tokenize_column.lemmatize(self.df["speech"].to_list(),
+                                      self.nlp, chunk_size=3),
+            tokenize_column.lemmatize(self.df["speech"].to_list(),
+                                      self.nlp))
+
+    def test_tokenize_column_staged(self):
+        # Test if a LazyFrame lemmatized in staged slices gives the
+        # same speeches as a collected one
+        expected_df = tokenize_column.tokenize_column(
+            self.df, "speech", self.nlp, pos_filter=["NOUN"])
+
+        with tempfile.TemporaryDirectory() as staging_dir:
+            tokenized_lf = tokenize_column.tokenize_column(
+                self.df.lazy(), "speech", self.nlp, pos_filter=["NOUN"],
+                chunk_size=3, staging_dir=staging_dir)
+
+            self.assertIsInstance(tokenized_lf, pl.LazyFrame)
+            self.assertTrue(tokenized_lf.collect().equals(expected_df))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,90 @@
+import unittest
+
+import nltk
+import polars as pl
+
+import src.tokenizer as tokenizer
+
+
+class TestTokenizer(unittest.TestCase):
+
+    def setUp(self):
+        # Create a sample DataFrame of speeches with umlauts, hyphenated
+        # compounds, numbers and punctuation
+        self.df = pl.DataFrame({
+            "speech_id": [1, 2, 3, 4, 5, 6, 7],
+            "speech": [
+                "Meine sehr verehrten Damen und Herren! Die CDU/CSU-Fraktion "
+                "hat 1.000 Anträge zu Bundes- und Landesrecht gestellt.",
+                "Das kostet 3,5 Milliarden Euro, also 10 % mehr als 2019; "
+                "um 10:30 Uhr beginnt die Sitzung.",
+                "Warum? Weil die Regierung (wie immer) versagt hat... "
+                "Das ist ein Skandal!",
+                "Über die Änderung des Grundgesetzes -- Artikel 16a -- "
+                "müssen wir reden: jetzt.",
+                "Sie sagen „Wir schaffen das“ und tun nichts.",
+                "Wie geht's weiter? Das gibt's doch nicht, sagt's "
+                "der Kollege.",
+                "Die Kosten sind um das 2,5-fache gestiegen, die "
+                "1.000-Euro-Grenze und die 5-Prozent-Hürde bleiben."
+            ]
+        })
+
+    def test_tokenize_word_tokenize_equivalence(self):
+        # Test if the tokens are the same as those of NLTK's word_tokenize
+        tokenized_df = tokenizer.tokenize(self.df, "speech")
+
+        for speech, tokens in zip(self.df["speech"], tokenized_df["speech"]):
+            self.assertListEqual(tokens.to_list(),
+                                 nltk.word_tokenize(speech))
+
+    def test_tokenize_word_tokenize_differences(self):
+        # Test the known differences to NLTK's word_tokenize
+        df = pl.DataFrame({"speech": [
+            "Dr. Müller, z.B. heute",
+            'Er sagte "Nein".',
+            "Sie sagt 'sehr gut'.",
+            "I don't know",
+        ]})
+        expected = [
+            ["Dr", ".", "Müller", ",", "z", ".", "B", ".", "heute"],
+            ["Er", "sagte", '"', "Nein", '"', "."],
+            ["Sie", "sagt", "'", "sehr", "gut", "'", "."],
+            ["I", "don", "'", "t", "know"],
+        ]
+
+        tokenized_df = tokenizer.tokenize(df, "speech")
+
+        for speech, tokens, expected_tokens in zip(
+                df["speech"], tokenized_df["speech"], expected):
+            self.assertListEqual(tokens.to_list(), expected_tokens)
+            self.assertNotEqual(expected_tokens, nltk.word_tokenize(speech))
+
+    def test_tokenize_output_column(self):
+        # Test if the tokens can be written to a separate column
+        tokenized_df = tokenizer.tokenize(self.df, "speech", "tokens")
+
+        self.assertListEqual(tokenized_df.columns,
+                             ["speech_id", "speech", "tokens"])
+        self.assertEqual(tokenized_df.schema["tokens"], pl.List(pl.String))
+
+    def test_tokenize_empty_text(self):
+        # Test if empty and missing texts are handled gracefully
+        df = pl.DataFrame({"speech": ["", None]})
+
+        tokenized_df = tokenizer.tokenize(df, "speech")
+
+        self.assertListEqual(tokenized_df["speech"].to_list(), [[], None])
+
+    def test_tokenize_lazy(self):
+        # Test if a LazyFrame is processed into a lazy query plan with
+        # the same result as the eager DataFrame
+        tokenized_df = tokenizer.tokenize(self.df, "speech")
+        tokenized_lf = tokenizer.tokenize(self.df.lazy(), "speech")
+
+        self.assertIsInstance(tokenized_lf, pl.LazyFrame)
+        self.assertTrue(tokenized_lf.collect().equals(tokenized_df))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,113 @@
+"""
+Title: test_topic_naming.py
+
+Description:
+    This file contains unit tests
+    for naming topics with category centroids.
+
+Usage:
+    Run all tests using\n
+    python -m unittest discover -s tests
+"""
+
+import json
+import os
+import tempfile
+import unittest
+
+import numpy as np
+import spacy
+from sklearn.metrics.pairwise import cosine_similarity
+
+from src.LDA import topic_naming
+from src.LDA.exceptions import MissingVectorError
+
+
+class TestTopicNaming(unittest.TestCase):
+    """
+    Unit tests for the TopicCentroids class and name_topics.
+    """
+
+    def setUp(self):
+        self.nlp = spacy.blank('de')
+        vectors = {
+            'Steuer': [1.0, 0.1, 0.0],
+            'Haushalt': [0.9, 0.3, 0.1],
+            'Panzer': [0.0, 1.0, 0.2],
+            'Soldat': [0.1, 0.8, 0.0],
+            'Klima': [0.1, 0.0, 1.0],
+            'Kohle': [0.4, 0.1, 0.7],
+        }
+        for word, vector in vectors.items():
+            self.nlp.vocab.set_vector(word, np.array(vector, dtype='f'))
+
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.keywords = {'topics': {
+            'Wirtschaftspolitik': ['Steuer', 'Haushalt'],
+            'Bundeswehr': ['Panzer', 'Soldat', 'Unbekannt'],
+            'Klimapolitik': ['Klima'],
+            'Leer': ['Unbekannt'],
+        }}
+        self.keywords_path = os.path.join(self.tmp_dir.name, 'kw.json')
+        with open(self.keywords_path, 'w', encoding='utf-8') as fp:
+            json.dump(self.keywords, fp)
+
+    def tearDown(self):
+        self.tmp_dir.cleanup()
+
+    def test_classify_matches_cosine_similarity(self):
+        """
+        Test if the batch naming picks the category with the highest
+        cosine similarity of the averaged vectors for every topic.
+        """
+        centroids = topic_naming.TopicCentroids.from_keywords(
+            self.nlp, self.keywords_path)
+        word_lists = [['Steuer'], ['Soldat', 'Kohle'], ['Kohle'],
+                      ['Klima', 'Haushalt']]
+
+        vectors = np.stack([topic_naming.average_vector(words, self.nlp)
+                            for words in word_lists])
+
+        expected = []
+        for vector in vectors:
+            similarities = {}
+            for topic, lemma_list in self.keywords['topics'].items():
+                topic_vector = topic_naming.average_vector(lemma_list,
+                                                           self.nlp)
+                if topic_vector is not None:
+                    similarities[topic] = cosine_similarity(
+                        [vector], [topic_vector])[0][0]
+            expected.append(max(similarities, key=similarities.get))
+
+        self.assertListEqual(centroids.names, ['Wirtschaftspolitik',
+                                               'Bundeswehr', 'Klimapolitik'])
+        self.assertListEqual(centroids.classify(vectors), expected)
+
+    def test_centroid_cache(self):
+        """
+        Test if the centroids are stored on disk and loaded again.
+        """
+        centroids = topic_naming.TopicCentroids.from_keywords(
+            self.nlp, self.keywords_path, cache_dir=self.tmp_dir.name)
+        cache_files = [f for f in os.listdir(self.tmp_dir.name)
+                       if f.startswith('centroids_')]
+
+        cached = topic_naming.TopicCentroids.from_keywords(
+            spacy.blank('de'), self.keywords_path,
+            cache_dir=self.tmp_dir.name)
+
+        self.assertEqual(len(cache_files), 1)
+        self.assertListEqual(cached.names, centroids.names)
+        np.testing.assert_allclose(cached.matrix, centroids.matrix)
+
+    def test_name_topics_missing_vector(self):
+        """
+        Test if a topic without any known word raises an error.
+        """
+        with self.assertRaises(MissingVectorError):
+            topic_naming.name_topics([['Steuer'], ['Unbekannt']],
+                                     vectors=self.nlp)
+
+
+if __name__ == '__main__':
+    unittest.main()
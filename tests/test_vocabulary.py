@@ -0,0 +1,77 @@
+"""
+Title: test_vocabulary.py
+
+Description:
+    This file contains unit tests
+    for the vocabulary of the LDA model.
+
+Usage:
+    Run all tests using\n
+    python -m unittest discover -s tests
+"""
+
+import tempfile
+import unittest
+from unittest.mock import patch
+
+from gensim.corpora import Dictionary
+from gensim.models.phrases import Phrases
+
+from src.LDA.vocabulary import Vocabulary
+
+
+TEXTS = [
+    ['Klima', 'Schutz', 'Energie'],
+    ['Rente', 'Energie', 'Steuer'],
+    ['Rente', 'Steuer', 'Energie'],
+    ['Klima', 'Schutz', 'Steuer'],
+] * 10
+
+
+def train_phrases(texts):
+    """
+    Train a bigram model that detects bigrams in a small corpus.
+    """
+    return Phrases(texts, min_count=1, threshold=0.5, scoring='npmi')
+
+
+class TestVocabulary(unittest.TestCase):
+
+    def test_build(self):
+        """
+        Test if the vocabulary equals the bigram model and
+        dictionary trained on the documents directly.
+        """
+        phrases = train_phrases(TEXTS).freeze()
+        texts = [phrases[text] for text in TEXTS]
+        dictionary = Dictionary(texts)
+        dictionary.filter_extremes(no_below=15)
+
+        with patch('src.LDA.vocabulary.Phrases', train_phrases):
+            vocabulary = Vocabulary.build(TEXTS, no_below=15)
+
+        self.assertIn('Klima_Schutz', vocabulary.dictionary.token2id)
+        self.assertEqual(vocabulary.dictionary.token2id,
+                         dictionary.token2id)
+        self.assertEqual(vocabulary.doc2bow(TEXTS[0]),
+                         dictionary.doc2bow(texts[0]))
+
+    def test_save_load(self):
+        """
+        Test if a persisted vocabulary is loaded unchanged.
+        """
+        vocabulary = Vocabulary.build(TEXTS, use_bigrams=False)
+
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            self.assertFalse(Vocabulary.exists(tmp_dir))
+            vocabulary.save(tmp_dir)
+            self.assertTrue(Vocabulary.exists(tmp_dir))
+            loaded = Vocabulary.load(tmp_dir)
+
+        self.assertIsNone(loaded.phrases)
+        self.assertEqual(loaded.dictionary.token2id,
+                         vocabulary.dictionary.token2id)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,87 @@
+"""
+Title: test_word_vectors.py
+
+Description:
+    This file contains unit tests
+    for the word vector backends.
+
+Usage:
+    Run all tests using\n
+    python -m unittest discover -s tests
+"""
+
+import os
+import tempfile
+import unittest
+
+import numpy as np
+import spacy
+
+from src.LDA import topic_naming
+from src.LDA.word_vectors import MemmapVectors, export_vectors
+
+
+class TestWordVectors(unittest.TestCase):
+    """
+    Unit tests for exporting and memory-mapping word vectors.
+    """
+
+    def setUp(self):
+        self.nlp = spacy.blank('de')
+        self.vectors = {
+            'Steuer': [1.0, 0.1, 0.0],
+            'Haushalt': [0.9, 0.3, 0.1],
+            'Panzer': [0.0, 1.0, 0.2],
+            'Klimaschutzprogramm': [0.1, 0.0, 1.0],
+        }
+        for word, vector in self.vectors.items():
+            self.nlp.vocab.set_vector(word, np.array(vector, dtype='f'))
+
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.prefix = os.path.join(self.tmp_dir.name, 'vectors', 'de')
+
+    def tearDown(self):
+        self.tmp_dir.cleanup()
+
+    def test_export_and_lookup(self):
+        """
+        Test if exported vectors are found by the memory-mapped backend.
+        """
+        n_keys = export_vectors(self.nlp, self.prefix)
+        vectors = MemmapVectors(self.prefix)
+
+        self.assertEqual(n_keys, len(self.vectors))
+        self.assertIsInstance(vectors.vectors, np.memmap)
+        for word, vector in self.vectors.items():
+            np.testing.assert_allclose(vectors.get(word), vector, rtol=1e-6)
+        self.assertIsNone(vectors.get('Unbekannt'))
+        self.assertIsNone(vectors.get('Klimaschutzprogrammentwurf'))
+        self.assertIsNone(vectors.get(''))
+
+    def test_export_words(self):
+        """
+        Test if only the requested words with a vector are exported.
+        """
+        n_keys = export_vectors(self.nlp, self.prefix,
+                                ['Panzer', 'Steuer', 'Unbekannt'])
+        vectors = MemmapVectors(self.prefix)
+
+        self.assertEqual(n_keys, 2)
+        np.testing.assert_allclose(vectors.get('Panzer'),
+                                   self.vectors['Panzer'])
+        self.assertIsNone(vectors.get('Haushalt'))
+
+    def test_average_vector_backends(self):
+        """
+        Test if both backends average the same vectors.
+        """
+        export_vectors(self.nlp, self.prefix)
+        words = ['Steuer', 'Unbekannt', 'Haushalt']
+
+        np.testing.assert_allclose(
+            topic_naming.average_vector(words, MemmapVectors(self.prefix)),
+            topic_naming.average_vector(words, self.nlp), rtol=1e-6)
+
+
+if __name__ == '__main__':
+    unittest.main()